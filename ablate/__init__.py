@@ -1,7 +1,34 @@
-from . import blocks, exporters, queries, sources
-from .report import Report
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 
-__all__ = ["blocks", "exporters", "queries", "Report", "sources"]
+if TYPE_CHECKING:  # pragma: no cover
+    from . import blocks, exporters, queries, sources
+    from .core.profiling import profile
+    from .report import Report
+
+
+__all__ = ["blocks", "exporters", "profile", "queries", "Report", "sources"]
 
 __version__ = "0.2.3"
+
+
+def __getattr__(name: str) -> Any:
+    # submodules are imported on first access to keep `import ablate` fast
+    if name in ("blocks", "exporters", "queries", "sources"):
+        return import_module(f".{name}", __name__)
+    if name == "Report":
+        from .report import Report
+
+        globals()["Report"] = Report
+        return Report
+    if name == "profile":
+        from .core.profiling import profile
+
+        globals()["profile"] = profile
+        return profile
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,4 +1,6 @@
 from .abstract_block import AbstractBlock
+from .cache import BuildCache
+from .columns import ColumnDependency, ColumnStore
 from .figure_blocks import AbstractFigureBlock, MetricPlot
 from .table_blocks import AbstractTableBlock, Table
 from .text_blocks import H1, H2, H3, H4, H5, H6, AbstractTextBlock, Text
@@ -9,6 +11,9 @@ __all__ = [
     "AbstractFigureBlock",
     "AbstractTableBlock",
     "AbstractTextBlock",
+    "BuildCache",
+    "ColumnDependency",
+    "ColumnStore",
     "H1",
     "H2",
     "H3",
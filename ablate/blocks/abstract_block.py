@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
 from ablate.core.types import Run
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.queries import AbstractSelector
+
+
 class AbstractBlock(ABC):
     def __init__(self, runs: List[Run] | None = None) -> None:
         """Abstract content block for a report.
@@ -25,3 +29,16 @@ class AbstractBlock(ABC):
         Returns:
             The intermediate representation of the block.
         """
+
+    def selectors(self) -> List["AbstractSelector"]:
+        """Get the selectors evaluated on the runs when building the block.
+
+        Used to analyze the dependencies of a report, so selectors shared by
+        multiple blocks are evaluated only once, see
+        :class:`~ablate.blocks.ColumnStore`. Blocks should evaluate these
+        selectors using :func:`~ablate.blocks.columns.evaluate`.
+
+        Returns:
+            The selectors of the block. Defaults to no selectors.
+        """
+        return []
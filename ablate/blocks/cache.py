@@ -0,0 +1,188 @@
+from collections import OrderedDict
+import hashlib
+import sys
+import threading
+from types import FunctionType, MethodType
+from typing import Any, Hashable, List, Tuple
+
+from ablate.core.cache import run_cache, run_version
+from ablate.core.types import Run
+
+from .abstract_block import AbstractBlock
+
+
+def config_key(value: Any) -> Hashable:
+    """Compute a hashable key describing the configuration of an object.
+
+    Objects are described by their type and attributes, so two independently
+    created blocks or selectors with the same configuration share the same key. The
+    `runs` attribute of blocks is excluded as it is part of the run-set key.
+
+    Args:
+        value: The object to compute the key for.
+
+    Returns:
+        A hashable key describing the configuration of the object.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(config_key(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), config_key(v)) for k, v in value.items()))
+    if isinstance(value, (type, FunctionType, MethodType)):
+        return value
+    if hasattr(value, "__dict__"):
+        attrs = {k: v for k, v in vars(value).items() if k != "runs"}
+        return (type(value).__module__, type(value).__qualname__, config_key(attrs))
+    return repr(value)
+
+
+def runs_key(runs: List[Run]) -> Tuple[Tuple[str, int], ...]:
+    """Compute a cheap key describing a list of runs based on their IDs and
+    process-local content versions.
+
+    Args:
+        runs: The list of runs to compute the key for.
+
+    Returns:
+        A hashable key describing the list of runs.
+    """
+    return tuple((run.id, run_version(run)) for run in runs)
+
+
+def runs_fingerprint(runs: List[Run]) -> str:
+    """Compute a persistent fingerprint of the content of a list of runs.
+
+    Unlike :func:`runs_key`, the fingerprint is stable across processes, allowing
+    it to key caches stored on disk. The fingerprint of each run is memoized for the
+    lifetime of the run object.
+
+    Args:
+        runs: The list of runs to compute the fingerprint for.
+
+    Returns:
+        A hexadecimal digest of the content of the runs.
+    """
+    digest = hashlib.md5()
+    for run in runs:
+        cache = run_cache(run)
+        if "fingerprint" not in cache:
+            content = run.model_dump_json().encode("utf-8")
+            cache["fingerprint"] = hashlib.md5(content).digest()
+        digest.update(cache["fingerprint"])
+    return digest.hexdigest()
+
+
+def block_fingerprint(block: AbstractBlock, runs: List[Run], *salt: str) -> str | None:
+    """Compute a persistent fingerprint of a block configuration and the content of
+    the runs it is built from.
+
+    Args:
+        block: The block to compute the fingerprint for.
+        runs: The list of runs the block is built from.
+        *salt: Additional strings to include in the fingerprint.
+
+    Returns:
+        A hexadecimal digest, or None if the configuration of the block cannot be
+        described in a way that is stable across processes, e.g. because it
+        contains lambdas.
+    """
+    config = repr(config_key(block))
+    if " at 0x" in config:
+        return None
+    digest = hashlib.md5(config.encode("utf-8"))
+    digest.update(runs_fingerprint(runs).encode("utf-8"))
+    for s in salt:
+        digest.update(b"\0" + s.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _sizeof(value: Any) -> int:
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return sys.getsizeof(value)
+
+
+class BuildCache:
+    def __init__(
+        self,
+        max_entries: int | None = 128,
+        max_bytes: int | None = 512 * 1024**2,
+    ) -> None:
+        """Least-recently-used cache for block build results.
+
+        Results are keyed by the configuration of the block and the IDs and content
+        versions of the runs it is built from, so repeated builds of the same block
+        over the same runs reuse the previously built result. Cached results are
+        shared and must not be modified in-place. The cache can be used from
+        multiple threads, while blocks are built outside of its lock.
+
+        Args:
+            max_entries: Maximum number of cached results. If None, the number of
+                entries is unlimited. Defaults to 128.
+            max_bytes: Maximum approximate size of all cached results in bytes. If
+                None, the size is unlimited. Defaults to 512 MiB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def build(self, block: AbstractBlock, runs: List[Run]) -> Any:
+        """Build a block, reusing a cached result if available.
+
+        Args:
+            block: The block to build.
+            runs: The list of runs to build the block from.
+
+        Returns:
+            The intermediate representation of the block.
+        """
+        key = (config_key(block), runs_key(runs))
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            self.misses += 1
+
+        result = block.build(runs)
+        size = _sizeof(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return result
+        with self._lock:
+            if key in self._entries:
+                # built concurrently by another thread
+                return self._entries[key][0]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            self._evict()
+        return result
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of all cached results in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+from typing import TYPE_CHECKING, Dict, Hashable, Iterator, List, NamedTuple, Tuple
+
+from ablate.core.cache import run_version
+
+from .abstract_block import AbstractBlock
+from .cache import config_key
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+    from ablate.core.types import Run
+    from ablate.queries import AbstractSelector
+    from ablate.report import Report
+
+
+class ColumnDependency(NamedTuple):
+    selector: AbstractSelector
+    """The selector evaluated by the blocks."""
+    runs: List[Run]
+    """The distinct runs the selector is evaluated on by any of the blocks."""
+    blocks: List[int]
+    """Positions of the blocks in the report depending on the selector."""
+
+
+def selector_key(selector: AbstractSelector) -> Hashable:
+    """Compute a hashable key describing the values computed by a selector.
+
+    Selectors only differing in their label compute the same values and therefore
+    share the same key.
+
+    Args:
+        selector: The selector to compute the key for.
+
+    Returns:
+        A hashable key describing the selector.
+    """
+    attrs = {k: v for k, v in vars(selector).items() if k != "label"}
+    return (type(selector).__module__, type(selector).__qualname__, config_key(attrs))
+
+
+def dependencies(report: Report) -> List[ColumnDependency]:
+    """Analyze which selectors the blocks of a report evaluate on which runs.
+
+    Identical selectors of different blocks are merged, and the runs of all blocks
+    evaluating a selector are combined, so each selector has to be evaluated only
+    once per distinct run.
+
+    Args:
+        report: The report to analyze.
+
+    Returns:
+        The selectors evaluated by the blocks in the order of their first use.
+    """
+    merged: Dict[Hashable, Tuple[ColumnDependency, Dict[int, None]]] = {}
+    for i, block in enumerate(report.blocks):
+        if not isinstance(block, AbstractBlock):
+            continue
+        runs = block.runs or report.runs
+        for selector in block.selectors():
+            key = selector_key(selector)
+            if key not in merged:
+                merged[key] = (ColumnDependency(selector, [], []), {})
+            dependency, seen = merged[key]
+            if i not in dependency.blocks:
+                dependency.blocks.append(i)
+            for run in runs:
+                if id(run) not in seen:
+                    seen[id(run)] = None
+                    dependency.runs.append(run)
+    return [dependency for dependency, _ in merged.values()]
+
+
+class _Column:
+    def __init__(self) -> None:
+        self.index: Dict[Tuple[int, int], int] = {}
+        self.runs: List[Run] = []
+        self.values: np.ndarray | None = None
+
+
+class ColumnStore:
+    def __init__(self, report: Report | None = None) -> None:
+        """Store of selector values shared by the blocks of a report.
+
+        Each distinct selector is evaluated at most once per run, and blocks read
+        the values of their columns from the store. If a report is given, its
+        :func:`dependencies` are analyzed upfront, and the first time a selector is
+        requested, it is evaluated on the runs of all blocks depending on it in a
+        single vectorized pass.
+
+        Values are keyed by the identity and content version of the runs, see
+        :func:`~ablate.core.cache.run_version`. The store keeps all runs it
+        evaluated alive and is meant to live for the duration of a single export.
+
+        Args:
+            report: Optional report to plan the evaluation of selectors for.
+                Defaults to None.
+        """
+        self._planned: Dict[Hashable, List[Run]] = {}
+        if report is not None:
+            for dependency in dependencies(report):
+                self._planned[selector_key(dependency.selector)] = dependency.runs
+        self._columns: Dict[Hashable, _Column] = {}
+        self.hits = 0
+        """Number of values read from the store that were already computed."""
+        self.misses = 0
+        """Number of values computed by evaluating selectors."""
+
+    def evaluate(self, selector: AbstractSelector, runs: List[Run]) -> np.ndarray:
+        """Evaluate a selector on a list of runs, reusing previously computed
+        values.
+
+        Args:
+            selector: The selector to evaluate.
+            runs: The runs to evaluate the selector on.
+
+        Returns:
+            An array containing the selected value for each run in order.
+        """
+        import numpy as np
+
+        key = selector_key(selector)
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = _Column()
+            self._extend(column, selector, self._planned.pop(key, []))
+        keys = [(id(run), run_version(run)) for run in runs]
+        self.hits += sum(k in column.index for k in keys)
+        self._extend(column, selector, runs)
+        if column.values is None:
+            return selector.evaluate_many([])
+        return column.values[np.fromiter(map(column.index.__getitem__, keys), int)]
+
+    def _extend(
+        self,
+        column: _Column,
+        selector: AbstractSelector,
+        runs: List[Run],
+    ) -> None:
+        import numpy as np
+
+        missing: List[Run] = []
+        for run in runs:
+            key = (id(run), run_version(run))
+            if key not in column.index:
+                column.index[key] = len(column.runs) + len(missing)
+                missing.append(run)
+        if not missing:
+            return
+        self.misses += len(missing)
+        values = selector.evaluate_many(missing)
+        column.runs.extend(missing)
+        if column.values is None:
+            column.values = values
+        else:
+            column.values = np.concatenate([column.values, values])
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+
+_local = threading.local()
+
+
+def active_column_store() -> ColumnStore | None:
+    """Get the column store active in the current thread.
+
+    Returns:
+        The active column store or None if no store is active.
+    """
+    return getattr(_local, "store", None)
+
+
+@contextmanager
+def use_column_store(store: ColumnStore | None) -> Iterator[ColumnStore | None]:
+    """Activate a column store in the current thread.
+
+    Args:
+        store: The column store to activate. If None, no store is active within
+            the context.
+
+    Yields:
+        The activated column store.
+    """
+    previous = active_column_store()
+    _local.store = store
+    try:
+        yield store
+    finally:
+        _local.store = previous
+
+
+def evaluate(selector: AbstractSelector, runs: List[Run]) -> np.ndarray:
+    """Evaluate a selector on a list of runs using the active column store.
+
+    Blocks should evaluate their selectors through this function, so values
+    shared with other blocks of the report are computed only once. If no column
+    store is active, the selector is evaluated directly.
+
+    Args:
+        selector: The selector to evaluate.
+        runs: The runs to evaluate the selector on.
+
+    Returns:
+        An array containing the selected value for each run in order.
+    """
+    store = active_column_store()
+    if store is None:
+        return selector.evaluate_many(runs)
+    return store.evaluate(selector, runs)
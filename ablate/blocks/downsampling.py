@@ -0,0 +1,100 @@
+from typing import Literal
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Select points of a series using the Largest-Triangle-Three-Buckets
+    algorithm, preserving the visual shape of the series.
+
+    Args:
+        x: The x-values of the series in ascending order.
+        y: The y-values of the series.
+        n: The maximum number of points to select.
+
+    Returns:
+        The sorted indices of the selected points.
+    """
+    size = len(x)
+    if n >= size:
+        return np.arange(size)
+    if n < 3:
+        return np.array([0, size - 1][: max(n, 0)], dtype=np.int64)
+
+    x = x.astype(np.float64)
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    indices = np.empty(n, dtype=np.int64)
+    indices[0], indices[-1] = 0, size - 1
+
+    a = 0
+    for i in range(n - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end if i + 2 < len(edges) else size - 1
+        next_end = edges[i + 2] if i + 2 < len(edges) else size
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Select the minimum and maximum point of equally sized buckets, preserving
+    the envelope of the series.
+
+    Args:
+        x: The x-values of the series in ascending order.
+        y: The y-values of the series.
+        n: The maximum number of points to select.
+
+    Returns:
+        The sorted indices of the selected points.
+    """
+    size = len(x)
+    if n >= size:
+        return np.arange(size)
+    if n < 2:
+        return np.arange(min(max(n, 0), size))
+
+    buckets = np.arange(size) * (n // 2) // size
+    order = np.lexsort((y, buckets))
+    bounds = np.flatnonzero(np.diff(buckets[order], prepend=-1, append=n))
+    starts, ends = bounds[:-1], bounds[1:] - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n: int,
+    method: Literal["lttb", "minmax"] = "lttb",
+) -> np.ndarray:
+    """Select at most `n` points of a series for plotting.
+
+    Args:
+        x: The x-values of the series in ascending order.
+        y: The y-values of the series.
+        n: The maximum number of points to select.
+        method: The downsampling method. "lttb" for Largest-Triangle-Three-Buckets
+            and "minmax" for the minimum and maximum per bucket. Defaults to "lttb".
+
+    Raises:
+        ValueError: If an unsupported downsampling method is provided.
+
+    Returns:
+        The sorted indices of the selected points.
+    """
+    match method:
+        case "lttb":
+            return lttb(x, y, n)
+        case "minmax":
+            return minmax(x, y, n)
+        case _:
+            raise ValueError(
+                f"Unsupported downsampling method: '{method}'. "
+                "Must be 'lttb' or 'minmax'."
+            )
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Tuple
 
 from ablate.queries import AbstractMetric, Id, Param
 
 from .abstract_block import AbstractBlock
+from .columns import evaluate
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    import pandas as pd
+
     from ablate.core.types import Run
+    from ablate.queries import AbstractSelector
+
+
+def _repeat_categorical(labels: List[Any], repeats: np.ndarray) -> pd.Categorical:
+    import numpy as np
+    import pandas as pd
+
+    codes, categories = pd.factorize(pd.Series(labels, dtype=object))
+    return pd.Categorical.from_codes(
+        np.repeat(codes, repeats),  # type: ignore[arg-type]
+        categories=categories,
+    )
 
 
 class AbstractFigureBlock(AbstractBlock, ABC):
@@ -25,6 +39,9 @@ class MetricPlot(AbstractFigureBlock):
         metrics: AbstractMetric | List[AbstractMetric],
         identifier: Param | None = None,
         runs: List[Run] | None = None,
+        max_points: int | None = None,
+        downsample: Literal["lttb", "minmax"] = "lttb",
+        errorbar: Literal["ci", "sd", "minmax"] | None = "ci",
     ) -> None:
         """Block for plotting metrics over time.
 
@@ -34,24 +51,105 @@ class MetricPlot(AbstractFigureBlock):
                 Defaults to None.
             runs: Optional list of runs to be used for the block instead of the default
                 runs from the report. Defaults to None.
+            max_points: Optional maximum number of points per series. Longer series
+                are downsampled when building the block. Series of runs sharing the
+                same identifier are downsampled to a shared set of steps selected
+                from their mean, so the aggregated line and band remain aligned
+                across runs. If None, all points are kept. Defaults to None.
+            downsample: Downsampling method applied to the series if `max_points`
+                is set. "lttb" for Largest-Triangle-Three-Buckets, preserving the
+                shape of the series, and "minmax" for the minimum and maximum of each
+                bucket, preserving the envelope of the series. Defaults to "lttb".
+            errorbar: Band drawn around runs sharing the same identifier. "ci" for a
+                bootstrapped 95% confidence interval, "sd" for the standard
+                deviation, "minmax" for the range between minimum and maximum, and
+                None to only draw the mean without any band. Only "ci" requires
+                bootstrapping. Defaults to "ci".
+
+        Raises:
+            ValueError: If an unsupported downsampling method or error bar is
+                provided.
         """
         super().__init__(runs)
+        if downsample not in ("lttb", "minmax"):
+            raise ValueError(
+                f"Unsupported downsampling method: '{downsample}'. "
+                "Must be 'lttb' or 'minmax'."
+            )
+        if errorbar not in ("ci", "sd", "minmax", None):
+            raise ValueError(
+                f"Unsupported error bar: '{errorbar}'. "
+                "Must be 'ci', 'sd', 'minmax', or None."
+            )
         self.metrics = metrics if isinstance(metrics, list) else [metrics]
         self.identifier = identifier or Id()
+        self.max_points = max_points
+        self.downsample = downsample
+        self.errorbar = errorbar
+
+    def selectors(self) -> List[AbstractSelector]:
+        return [self.identifier]
 
     def build(self, runs: List[Run]) -> pd.DataFrame:
-        data = []
-        for run in runs:
+        import numpy as np
+        import pandas as pd
+
+        steps: List[np.ndarray] = []
+        values: List[np.ndarray] = []
+        metrics, identifiers, run_ids = [], [], []
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for run, identifier in zip(runs, evaluate(self.identifier, runs), strict=False):
             for metric in self.metrics:
                 series = run.temporal.get(metric.name, [])
-                for step, value in series:
-                    data.append(
-                        {
-                            "step": step,
-                            "value": value,
-                            "metric": metric.label,
-                            "run": self.identifier(run),
-                            "run_id": run.id,
-                        }
-                    )
-        return pd.DataFrame(data)
+                if not series:
+                    continue
+                key = (metric.label, repr(identifier))
+                groups.setdefault(key, []).append(len(steps))
+                steps.append(np.array([point[0] for point in series]))
+                values.append(np.array([point[1] for point in series], dtype=float))
+                metrics.append(metric.label)
+                identifiers.append(identifier)
+                run_ids.append(run.id)
+
+        if not steps:
+            return pd.DataFrame(columns=["step", "value", "metric", "run", "run_id"])
+
+        if self.max_points is not None:
+            for members in groups.values():
+                self._downsample_group(steps, values, members, self.max_points)
+
+        repeats = np.asarray([len(x) for x in steps])
+        return pd.DataFrame(
+            {
+                "step": np.concatenate(steps),
+                "value": np.concatenate(values),
+                "metric": _repeat_categorical(metrics, repeats),
+                "run": _repeat_categorical(identifiers, repeats),
+                "run_id": _repeat_categorical(run_ids, repeats),
+            }
+        )
+
+    def _downsample_group(
+        self,
+        steps: List[np.ndarray],
+        values: List[np.ndarray],
+        members: List[int],
+        max_points: int,
+    ) -> None:
+        import numpy as np
+
+        from .downsampling import downsample
+
+        # select a shared grid of steps from the mean of all series in the group,
+        # so the runs aggregated into the same line are kept at the same steps
+        x = np.concatenate([steps[i] for i in members])
+        grid, inverse = np.unique(x, return_inverse=True)
+        if len(grid) <= max_points:
+            return
+        y = np.concatenate([values[i] for i in members])
+        counts = np.bincount(inverse, minlength=len(grid))
+        mean = np.bincount(inverse, weights=y, minlength=len(grid)) / counts
+        selected = grid[downsample(grid, mean, max_points, self.downsample)]
+        for i in members:
+            keep = np.isin(steps[i], selected)
+            steps[i], values[i] = steps[i][keep], values[i][keep]
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import pandas as pd
+from .abstract_block import AbstractBlock
+from .columns import evaluate
 
-from ablate.core.types import Run
-from ablate.queries import AbstractSelector
 
-from .abstract_block import AbstractBlock
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+    from ablate.core.types import Run
+    from ablate.queries import AbstractSelector
 
 
 class AbstractTableBlock(AbstractBlock, ABC):
@@ -29,13 +34,14 @@ class AbstractTableBlock(AbstractBlock, ABC):
     @abstractmethod
     def build(self, runs: List[Run]) -> pd.DataFrame: ...
 
+    def selectors(self) -> List[AbstractSelector]:
+        return list(self.columns)
+
 
 class Table(AbstractTableBlock):
     def build(self, runs: List[Run]) -> pd.DataFrame:
-        rows = []
-        for run in runs:
-            row = {}
-            for column in self.columns:
-                row[column.label] = column(run)
-            rows.append(row)
-        return pd.DataFrame(rows, columns=[column.label for column in self.columns])
+        import pandas as pd
+
+        data = {column.label: evaluate(column, runs) for column in self.columns}
+        df = pd.DataFrame(data, columns=[column.label for column in self.columns])
+        return df.infer_objects()
@@ -0,0 +1,169 @@
+import argparse
+from contextlib import nullcontext
+import sys
+from typing import Any, ContextManager, Dict, List
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get the argument parser of the `ablate` command.
+
+    Returns:
+        The argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ablate",
+        description="ablate turns deep learning experiments into structured, "
+        "human-readable reports.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser(
+        "build",
+        help="Build a report from a spec.",
+        description="Load the sources of a YAML or TOML report spec, apply its "
+        "query, and export its blocks with its exporters.",
+    )
+    build.add_argument("spec", help="Path to the YAML or TOML report spec.")
+    build.add_argument(
+        "--only",
+        nargs="+",
+        metavar="BLOCK",
+        help="Only build the blocks with the given names or positions starting at 1. "
+        "Requires --output to not overwrite the full report.",
+    )
+    build.add_argument(
+        "-o",
+        "--output",
+        help="Path to the output file, overriding the output path of the exporter.",
+    )
+    build.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of worker processes to render figures in parallel.",
+    )
+    build.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse blocks rendered by previous builds if unchanged.",
+    )
+    build.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable caching block builds within the export.",
+    )
+    build.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Print a profile of the build to stderr and optionally save it "
+        "as JSON to PATH.",
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Serve a report from a spec.",
+        description="Serve the report of a YAML or TOML report spec over HTTP, "
+        "keeping its runs warm in memory and refreshing them periodically.",
+    )
+    serve.add_argument("spec", help="Path to the YAML or TOML report spec.")
+    serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host to listen on. Defaults to %(default)s.",
+    )
+    serve.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on. Defaults to %(default)s.",
+    )
+    serve.add_argument(
+        "--socket",
+        help="Path to a Unix domain socket to listen on instead of a port.",
+    )
+    serve.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=60.0,
+        help="Interval in seconds to refresh the sources. If 0, sources are "
+        "never refreshed. Defaults to %(default)s.",
+    )
+    return parser
+
+
+def build(args: argparse.Namespace) -> None:
+    from ablate.core.profiling import profile
+    from ablate.spec import build_exporters, build_report, load_runs, load_spec
+
+    if args.only is not None and args.output is None:
+        # a partial report must not replace the full report and its assets
+        raise ValueError("--only requires --output.")
+    spec = load_spec(args.spec)
+    overrides: Dict[str, Any] = {}
+    if args.output is not None:
+        overrides["output_path"] = args.output
+    if args.workers is not None:
+        overrides["workers"] = args.workers
+    if args.incremental:
+        overrides["incremental"] = True
+
+    prof = profile() if args.profile is not None else None
+    context: ContextManager[Any] = prof if prof is not None else nullcontext()
+    with context:
+        exporters = build_exporters(spec, **overrides)
+        if args.output is not None and len(exporters) > 1:
+            raise ValueError("--output requires a single exporter.")
+        report = build_report(spec, load_runs(spec), args.only)
+        for exporter in exporters:
+            if args.no_cache:
+                exporter.build_cache = None
+            exporter.export(report)
+
+    if prof is not None:
+        print(prof.summary(), file=sys.stderr)
+        if args.profile:
+            prof.to_json(args.profile)
+
+
+def serve(args: argparse.Namespace) -> None:
+    from ablate.server import ReportServer
+
+    server = ReportServer(
+        args.spec,
+        host=args.host,
+        port=args.port,
+        socket=args.socket,
+        refresh_interval=args.refresh_interval or None,
+    )
+    print(f"Serving report on {server.address}", file=sys.stderr)
+    server.serve_forever()
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Run the `ablate` command.
+
+    Args:
+        argv: The command line arguments. If None, `sys.argv` is used.
+            Defaults to None.
+
+    Returns:
+        The exit code.
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "build":
+            build(args)
+        elif args.command == "serve":
+            serve(args)
+    except (OSError, ValueError) as e:
+        print(f"ablate: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
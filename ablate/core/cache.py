@@ -0,0 +1,67 @@
+from functools import partial
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+import weakref
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.types import Run
+
+
+_versions = itertools.count()
+_entries: Dict[int, Tuple[weakref.ref, Dict[Any, Any]]] = {}
+
+
+def _discard(key: int, ref: weakref.ref) -> None:
+    entry = _entries.get(key)
+    if entry is not None and entry[0] is ref:
+        del _entries[key]
+
+
+def run_cache(run: "Run") -> Dict[Any, Any]:
+    """Get the cache dictionary associated with a run.
+
+    The cache lives as long as the run object and is dropped when an attribute of
+    the run is reassigned. As runs are treated as immutable, in-place modifications
+    of nested data such as ``run.params[...] = ...`` are not detected.
+
+    Args:
+        run: The run to get the cache for.
+
+    Returns:
+        A dictionary for storing values derived from the run.
+    """
+    key = id(run)
+    entry = _entries.get(key)
+    if entry is not None and entry[0]() is run:
+        return entry[1]
+    ref = weakref.ref(run, partial(_discard, key))
+    cache: Dict[Any, Any] = {"__version__": next(_versions)}
+    _entries[key] = (ref, cache)
+    return cache
+
+
+def run_version(run: "Run") -> int:
+    """Get a process-local content version of a run.
+
+    The version is unique among all runs alive in the current process and changes
+    whenever an attribute of the run is reassigned.
+
+    Args:
+        run: The run to get the version for.
+
+    Returns:
+        The content version of the run.
+    """
+    return run_cache(run)["__version__"]
+
+
+def invalidate(run: "Run") -> None:
+    """Drop the cache and version associated with a run.
+
+    Args:
+        run: The run to invalidate.
+    """
+    entry = _entries.get(id(run))
+    if entry is not None and entry[0]() is run:
+        del _entries[id(run)]
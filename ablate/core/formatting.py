@@ -0,0 +1,29 @@
+def format_time(seconds: float) -> str:
+    """Format a duration for human-readable summaries.
+
+    Args:
+        seconds: The duration in seconds.
+
+    Returns:
+        The duration in milliseconds below one second, otherwise in seconds.
+    """
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_bytes(size: int) -> str:
+    """Format a number of bytes for human-readable summaries.
+
+    Args:
+        size: The number of bytes.
+
+    Returns:
+        The size in the largest binary unit up to GiB it is at least one of.
+    """
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    raise AssertionError  # pragma: no cover
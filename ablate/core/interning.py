@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.types import Run
+
+
+_SCALARS = (str, int, float, bool)
+
+
+class ParamTable:
+    def __init__(self) -> None:
+        """Shared table of the parameter names and values of runs.
+
+        Runs loaded from the same source typically repeat the same parameter names
+        and a small number of distinct values, e.g., "adam" or "resnet50", each
+        parsed into a separate object per run. Interning the parameters of the runs
+        replaces these copies with a single shared object per distinct name and
+        value, so each parameter of a run only costs a reference in its dictionary.
+        Comparing shared values in filters and groupings short-circuits on their
+        identity.
+
+        Each distinct value is dictionary-encoded by a small integer code, which
+        can be decoded using :meth:`decode`. Only strings, integers, floats, and
+        booleans are interned, and values are distinguished by their type, so e.g.
+        1, 1.0, and True are not merged. Other values are kept as is.
+        """
+        # shared value and code of each distinct value by its type
+        self._shared: Dict[type, Dict[Any, Any]] = {t: {} for t in _SCALARS}
+        self._codes: Dict[type, Dict[Any, int]] = {t: {} for t in _SCALARS}
+        self._values: List[Any] = []
+        # interned names of each layout of parameter names
+        self._layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def encode(self, value: Any) -> int | None:
+        """Get the code of a value, adding it to the table if necessary.
+
+        Args:
+            value: The value to encode.
+
+        Returns:
+            The code of the value or None if the value is not a string, integer,
+            float, or boolean, or a float that is NaN or zero, as these cannot be
+            merged without changing their value.
+        """
+        codes = self._codes.get(type(value))
+        if codes is None:
+            return None
+        if value not in codes:
+            self._add(value)
+        return codes.get(value)
+
+    def _add(self, value: Any) -> Any:
+        if isinstance(value, float) and (value != value or value == 0.0):
+            return value
+        if isinstance(value, str):
+            value = sys.intern(value)
+        self._shared[type(value)][value] = value
+        self._codes[type(value)][value] = len(self._values)
+        self._values.append(value)
+        return value
+
+    def decode(self, code: int) -> Any:
+        """Get the shared value of a code.
+
+        Args:
+            code: The code of the value.
+
+        Returns:
+            The shared value.
+        """
+        return self._values[code]
+
+    def intern(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the names and values of parameters with their shared objects.
+
+        Args:
+            params: The parameters to intern.
+
+        Returns:
+            A new dictionary of the interned parameters in the same order.
+        """
+        layout = tuple(params)
+        names = self._layouts.get(layout)
+        if names is None:
+            names = self._layouts[layout] = tuple(map(sys.intern, layout))
+
+        shared_by_type = self._shared
+        values = []
+        for value in params.values():
+            shared = shared_by_type.get(type(value))
+            if shared is not None:
+                interned = shared.get(value)
+                value = self._add(value) if interned is None else interned
+            values.append(value)
+        return dict(zip(names, values, strict=True))
+
+    def intern_runs(self, runs: List[Run]) -> List[Run]:
+        """Intern the parameters of runs in-place.
+
+        Args:
+            runs: The runs to intern the parameters of.
+
+        Returns:
+            The same runs with interned parameters.
+        """
+        for run in runs:
+            run.params = self.intern(run.params)
+        return runs
+
+    def __len__(self) -> int:
+        return len(self._values)
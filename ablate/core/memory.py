@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from collections import defaultdict
+import heapq
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+from ablate.core.formatting import format_bytes
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.types import Run
+
+
+class RunFootprint(BaseModel):
+    id: str
+    """ID of the run."""
+    bytes: int
+    """Approximate number of bytes used by the run."""
+
+
+class SeriesFootprint(BaseModel):
+    run: str
+    """ID of the run the series belongs to."""
+    key: str
+    """Name of the temporal metric."""
+    points: int
+    """Number of points of the series."""
+    bytes: int
+    """Approximate number of bytes used by the series."""
+
+
+class MemoryFootprint(BaseModel):
+    runs: int
+    """Number of runs."""
+    total: int
+    """Approximate number of bytes used by all runs."""
+    overhead: int
+    """Bytes used by the run objects and their parameter, metric, and temporal
+    dictionaries themselves."""
+    ids: int
+    """Bytes used by the IDs of the runs."""
+    params: Dict[str, int]
+    """Bytes used by the values of each parameter."""
+    metrics: Dict[str, int]
+    """Bytes used by the values of each metric."""
+    temporal: Dict[str, int]
+    """Bytes used by the series of each temporal metric."""
+    points: Dict[str, int]
+    """Number of points of the series of each temporal metric."""
+    largest_runs: List[RunFootprint]
+    """Largest runs in descending order of their size."""
+    largest_series: List[SeriesFootprint]
+    """Largest temporal series in descending order of their size."""
+
+    def summary(self) -> str:
+        """Summarize the memory footprint as a human-readable text report.
+
+        Returns:
+            The summary of the memory footprint.
+        """
+        total = self.total or 1
+        lines = [
+            f"{self.runs} runs, {format_bytes(self.total)} total",
+            "",
+            f"{'category':<32} {'bytes':>10} {'share':>7}",
+        ]
+
+        def add(name: str, size: int) -> None:
+            lines.append(f"{name:<32} {format_bytes(size):>10} {size / total:>7.1%}")
+
+        add("overhead", self.overhead)
+        add("ids", self.ids)
+        for category, sizes in (
+            ("params", self.params),
+            ("metrics", self.metrics),
+            ("temporal", self.temporal),
+        ):
+            add(category, sum(sizes.values()))
+            for key, size in sorted(sizes.items(), key=lambda item: -item[1]):
+                add(f"  {key}", size)
+
+        if self.largest_runs:
+            lines += ["", "largest runs:"]
+            for run in self.largest_runs:
+                lines.append(f"  {format_bytes(run.bytes):>10}  {run.id}")
+        if self.largest_series:
+            lines += ["", "largest series:"]
+            for series in self.largest_series:
+                lines.append(
+                    f"  {format_bytes(series.bytes):>10}  {series.points:>9} points"
+                    f"  {series.run} / {series.key}"
+                )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.summary()
+
+
+def sizeof(value: Any) -> int:
+    """Approximate the number of bytes used by a value and the values it contains.
+
+    Keys of dictionaries are not counted, as they are typically shared between
+    runs. Homogeneous lists of tuples such as temporal series are extrapolated from
+    their first element, so their size is computed in constant time.
+
+    Args:
+        value: The value to compute the size of.
+
+    Returns:
+        The approximate number of bytes used by the value.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(sizeof(v) for v in value.values())
+    if isinstance(value, list) and value and isinstance(value[0], tuple):
+        return size + len(value) * sizeof(value[0])
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(sizeof(v) for v in value)
+    return size
+
+
+def memory_footprint(runs: List[Run], top: int = 10) -> MemoryFootprint:
+    """Approximate the memory used by a list of runs, broken down by the IDs,
+    the values of each parameter and metric, and the series of each temporal
+    metric.
+
+    Sizes are estimated using :func:`sys.getsizeof` and include the Python object
+    overhead of all values, see :func:`sizeof`. Values shared between runs are
+    counted once per run, so the total may exceed the actual memory used.
+
+    Args:
+        runs: The runs to compute the memory footprint of.
+        top: Number of largest runs and series to list. Defaults to 10.
+
+    Returns:
+        The memory footprint of the runs.
+    """
+    params: Dict[str, int] = defaultdict(int)
+    metrics: Dict[str, int] = defaultdict(int)
+    temporal: Dict[str, int] = defaultdict(int)
+    points: Dict[str, int] = defaultdict(int)
+    overhead = ids = 0
+    run_sizes: List[Tuple[int, int]] = []
+    series_sizes: List[Tuple[int, int, str, int]] = []
+
+    for i, run in enumerate(runs):
+        run_overhead = (
+            sys.getsizeof(run)
+            + sys.getsizeof(run.__dict__)
+            + sys.getsizeof(run.params)
+            + sys.getsizeof(run.metrics)
+            + sys.getsizeof(run.temporal)
+        )
+        run_size = run_overhead + sys.getsizeof(run.id)
+        overhead += run_overhead
+        ids += sys.getsizeof(run.id)
+        for key, value in run.params.items():
+            size = sizeof(value)
+            params[key] += size
+            run_size += size
+        for key, value in run.metrics.items():
+            size = sizeof(value)
+            metrics[key] += size
+            run_size += size
+        for key, series in run.temporal.items():
+            size = sizeof(series)
+            temporal[key] += size
+            points[key] += len(series)
+            run_size += size
+            _push(series_sizes, (size, i, key, len(series)), top)
+        _push(run_sizes, (run_size, i), top)
+
+    total = (
+        overhead
+        + ids
+        + sum(params.values())
+        + sum(metrics.values())
+        + sum(temporal.values())
+    )
+    return MemoryFootprint(
+        runs=len(runs),
+        total=total,
+        overhead=overhead,
+        ids=ids,
+        params=dict(params),
+        metrics=dict(metrics),
+        temporal=dict(temporal),
+        points=dict(points),
+        largest_runs=[
+            RunFootprint(id=runs[i].id, bytes=size)
+            for size, i in sorted(run_sizes, reverse=True)
+        ],
+        largest_series=[
+            SeriesFootprint(run=runs[i].id, key=key, points=n, bytes=size)
+            for size, i, key, n in sorted(series_sizes, reverse=True)
+        ],
+    )
+
+
+def _push(heap: List[Any], item: Tuple[Any, ...], top: int) -> None:
+    if len(heap) < top:
+        heapq.heappush(heap, item)
+    elif top > 0 and item > heap[0]:
+        heapq.heapreplace(heap, item)
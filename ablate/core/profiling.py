@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import wraps
+import json
+import threading
+import time
+import tracemalloc
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from ablate.core.formatting import format_bytes, format_time
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from contextvars import Token
+    from pathlib import Path
+    from types import TracebackType
+
+
+Stage = Literal["load", "query", "build", "render"]
+F = TypeVar("F", bound=Callable[..., Any])
+
+# the active profile is scoped to the context that activated it, so concurrent
+# pipelines in other threads are not recorded in it by accident
+_active: ContextVar[Profile | None] = ContextVar("ablate_profile", default=None)
+
+
+class ProfileRecord(BaseModel):
+    stage: Stage
+    """Stage of the report pipeline the operation belongs to."""
+    name: str
+    """Name of the operation, e.g. the source, query method, or block type."""
+    wall_time: float
+    """Elapsed wall-clock time in seconds."""
+    cpu_time: float
+    """Elapsed CPU time of the current process in seconds."""
+    peak_memory: int | None
+    """Peak memory in bytes allocated on top of the memory allocated when the
+    operation started. None if memory tracing is disabled."""
+    runs: int | None
+    """Number of runs the operation was applied to or loaded."""
+    rows: int | None
+    """Number of rows produced, i.e. the number of runs or groups returned by
+    queries and the number of rows of built tables and figures."""
+    depth: int
+    """Nesting depth of the operation, as operations such as rendering a block
+    include building it."""
+
+
+class _Span:
+    __slots__ = ("profile", "stage", "name", "runs", "rows")
+
+    def __init__(
+        self, profile: Profile, stage: Stage, name: str, runs: int | None
+    ) -> None:
+        self.profile = profile
+        self.stage = stage
+        self.name = name
+        self.runs = runs
+        self.rows: int | None = None
+
+    def __enter__(self) -> Self:
+        self.profile._enter(self)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.profile._exit(self)
+
+
+class _DisabledSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+_DISABLED = _DisabledSpan()
+
+
+class Profile:
+    def __init__(self, memory: bool = True) -> None:
+        """Profile of the operations of a report pipeline.
+
+        Records the wall time, CPU time, and peak allocated memory of each source
+        load, query operation, block build, and block render while the profile is
+        active. Use :func:`ablate.profile` to create and activate a profile.
+
+        Work submitted to worker processes by exporters rendering in parallel is
+        not included in the render times. The profile is only active in the context
+        that activated it, e.g., not in other threads unless they run in a copy of
+        the context. Operations of different threads are nested independently,
+        while their peak memory is traced across all threads.
+
+        Args:
+            memory: Whether to trace the peak allocated memory of each operation
+                using :mod:`tracemalloc`, which slows down allocation-heavy
+                operations. Defaults to True.
+        """
+        self.memory = memory
+        self.records: List[ProfileRecord] = []
+        self._local = threading.local()
+        self._token: Token[Profile | None] | None = None
+        self._tracing = False
+
+    @property
+    def _stack(self) -> List[Tuple[_Span, float, float, int, int]]:
+        # each thread nests its operations on its own stack
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def __enter__(self) -> Self:
+        self._token = _active.set(self)
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            _active.reset(self._token)
+            self._token = None
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def _enter(self, span: _Span) -> None:
+        stack = self._stack
+        current = 0
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                self._raise_peak(peak)
+            tracemalloc.reset_peak()
+        stack.append((span, time.perf_counter(), time.process_time(), current, current))
+
+    def _exit(self, span: _Span) -> None:
+        cpu_end, wall_end = time.process_time(), time.perf_counter()
+        stack = self._stack
+        entry, wall_start, cpu_start, current, peak = stack.pop()
+        if entry is not span:  # pragma: no cover
+            raise RuntimeError("Profiled operations exited out of order.")
+
+        peak_memory = None
+        if self.memory and tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            peak_memory = max(peak - current, 0)
+            if stack:
+                self._raise_peak(peak)
+
+        self.records.append(
+            ProfileRecord(
+                stage=span.stage,
+                name=span.name,
+                wall_time=wall_end - wall_start,
+                cpu_time=cpu_end - cpu_start,
+                peak_memory=peak_memory,
+                runs=span.runs,
+                rows=span.rows,
+                depth=len(stack),
+            )
+        )
+
+    def _raise_peak(self, peak: int) -> None:
+        # tracemalloc only tracks a single peak, so the peaks of enclosing
+        # operations are carried along the stack when a nested operation resets it
+        stack = self._stack
+        span, wall, cpu, current, parent_peak = stack[-1]
+        stack[-1] = (span, wall, cpu, current, max(parent_peak, peak))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the profile as a JSON-serializable dictionary.
+
+        Returns:
+            A dictionary containing all records in the order they finished and the
+            totals of each stage.
+        """
+        return {
+            "records": [r.model_dump() for r in self.records],
+            "totals": self.totals(),
+        }
+
+    def to_json(self, path: str | Path | None = None, indent: int = 2) -> str:
+        """Serialize the profile to JSON.
+
+        Args:
+            path: Optional path to write the JSON to. Defaults to None.
+            indent: The indentation of the JSON. Defaults to 2.
+
+        Returns:
+            The profile serialized as JSON.
+        """
+        data = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def totals(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate the records of each stage.
+
+        Only top-level operations of each stage are summed, so nested operations
+        of the same stage such as queries composed of other queries are not
+        counted twice.
+
+        Returns:
+            A dictionary mapping each stage to its number of operations, total wall
+            time, total CPU time, and maximum peak memory.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for record in self._outermost():
+            total = totals.setdefault(
+                record.stage,
+                {"count": 0, "wall_time": 0.0, "cpu_time": 0.0, "peak_memory": None},
+            )
+            total["count"] += 1
+            total["wall_time"] += record.wall_time
+            total["cpu_time"] += record.cpu_time
+            if record.peak_memory is not None:
+                total["peak_memory"] = max(
+                    total["peak_memory"] or 0, record.peak_memory
+                )
+        return totals
+
+    def _outermost(self) -> List[ProfileRecord]:
+        # records finish innermost first, so in reverse each record is preceded by
+        # its enclosing operations, which are tracked on a stack by their depth
+        result: List[ProfileRecord] = []
+        enclosing: List[ProfileRecord] = []
+        for record in reversed(self.records):
+            while enclosing and enclosing[-1].depth >= record.depth:
+                enclosing.pop()
+            if all(r.stage != record.stage for r in enclosing):
+                result.append(record)
+            enclosing.append(record)
+        return result[::-1]
+
+    def summary(self) -> str:
+        """Summarize the profile as a human-readable text table.
+
+        Operations are grouped by stage and name and sorted by total wall time
+        within each stage.
+
+        Returns:
+            The summary of the profile.
+        """
+        groups: Dict[Tuple[str, str], List[ProfileRecord]] = defaultdict(list)
+        for record in self.records:
+            groups[(record.stage, record.name)].append(record)
+
+        header = ("stage", "name", "calls", "wall", "cpu", "peak mem", "runs", "rows")
+        rows = [header]
+        order = {s: i for i, s in enumerate(("load", "query", "build", "render"))}
+        for (stage, name), records in sorted(
+            groups.items(),
+            key=lambda item: (
+                order[item[0][0]],
+                -sum(r.wall_time for r in item[1]),
+            ),
+        ):
+            peaks = [r.peak_memory for r in records if r.peak_memory is not None]
+            runs = [r.runs for r in records if r.runs is not None]
+            counts = [r.rows for r in records if r.rows is not None]
+            rows.append(
+                (
+                    stage,
+                    name,
+                    str(len(records)),
+                    format_time(sum(r.wall_time for r in records)),
+                    format_time(sum(r.cpu_time for r in records)),
+                    format_bytes(max(peaks)) if peaks else "-",
+                    str(max(runs)) if runs else "-",
+                    str(max(counts)) if counts else "-",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+            ).rstrip()
+            for row in rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.summary()
+
+
+def profile(memory: bool = True) -> Profile:
+    """Profile the operations of a report pipeline within a context.
+
+    Records the wall time, CPU time, and peak allocated memory of each source
+    load, query operation, block build, and block render, tagged with the number
+    of runs and rows involved. Profiling is opt-in and adds no measurable overhead
+    while no profile is active.
+
+    .. code-block:: python
+
+        with ablate.profile() as prof:
+            runs = source.load()
+            ...
+            exporter.export(report)
+
+        print(prof.summary())
+        prof.to_json("profile.json")
+
+    Args:
+        memory: Whether to trace the peak allocated memory of each operation
+            using :mod:`tracemalloc`, which slows down allocation-heavy
+            operations. Defaults to True.
+
+    Returns:
+        The profile, to be used as a context manager.
+    """
+    return Profile(memory=memory)
+
+
+def active_profile() -> Profile | None:
+    """Get the currently active profile.
+
+    Returns:
+        The active profile or None if profiling is disabled.
+    """
+    return _active.get()
+
+
+def span(stage: Stage, name: str, runs: int | None = None) -> Any:
+    """Record an operation of the report pipeline in the active profile.
+
+    The number of produced rows can be set on the returned context manager.
+    If no profile is active, a shared no-op context manager is returned.
+
+    Args:
+        stage: The stage of the operation.
+        name: The name of the operation.
+        runs: The number of runs the operation is applied to. Defaults to None.
+
+    Returns:
+        A context manager recording the operation.
+    """
+    active = _active.get()
+    if active is None:
+        return _DISABLED
+    return _Span(active, stage, name, runs)
+
+
+def profiled(stage: Stage) -> Callable[[F], F]:
+    """Decorate a method to be recorded in the active profile.
+
+    The number of runs is taken from the length of the object the method is bound
+    to if it is sized, and the number of rows from the length of the result.
+
+    Args:
+        stage: The stage of the operation.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            active = _active.get()
+            if active is None:
+                return fn(self, *args, **kwargs)
+            runs = len(self) if hasattr(self, "__len__") else None
+            with _Span(active, stage, fn.__qualname__, runs) as s:
+                result = fn(self, *args, **kwargs)
+                s.rows = len(result) if hasattr(result, "__len__") else None
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
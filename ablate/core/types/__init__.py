@@ -1,4 +1,5 @@
+from .changes import ChangeSet
 from .runs import GroupedRun, Run
 
 
-__all__ = ["GroupedRun", "Run"]
+__all__ = ["ChangeSet", "GroupedRun", "Run"]
@@ -0,0 +1,57 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from .runs import Run
+
+
+class ChangeSet(BaseModel):
+    added: List[Run] = []
+    updated: List[Run] = []
+    removed: List[str] = []
+
+    def __init__(
+        self,
+        added: List[Run] | None = None,
+        updated: List[Run] | None = None,
+        removed: List[str] | None = None,
+    ) -> None:  # sphinx needs an explicit __init__ for autodoc
+        """Incremental changes of a source between two refreshes.
+
+        Args:
+            added: Runs that were added since the last refresh. If None, an empty
+                list is used. Defaults to None.
+            updated: Runs that were modified since the last refresh. If None, an
+                empty list is used. Defaults to None.
+            removed: IDs of runs that were removed since the last refresh. If None,
+                an empty list is used. Defaults to None.
+        """
+        super().__init__(
+            added=added or [],
+            updated=updated or [],
+            removed=removed or [],
+        )
+
+    def apply(self, runs: List[Run]) -> List[Run]:
+        """Apply the changes to a list of runs.
+
+        Updated runs replace the runs with the same ID in place, removed runs are
+        dropped, and added runs are appended to the end of the list. Updated runs
+        without a run of the same ID in the list, e.g., runs that failed to load
+        when they were added, are appended as well.
+
+        Args:
+            runs: List of runs to apply the changes to. The list is not modified.
+
+        Returns:
+            A new list of runs with the changes applied.
+        """
+        updated = {r.id: r for r in self.updated}
+        removed = set(self.removed)
+        known = {r.id for r in runs}
+        result = [updated.get(r.id, r) for r in runs if r.id not in removed]
+        unknown = [r for r in self.updated if r.id not in known]
+        return result + unknown + self.added
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
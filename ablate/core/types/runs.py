@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel
 
+from ablate.core.cache import invalidate
+
 
 class Run(BaseModel):
     id: str
@@ -27,6 +29,10 @@ class Run(BaseModel):
         """
         super().__init__(id=id, params=params, metrics=metrics, temporal=temporal or {})
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate(self)
+
 
 class GroupedRun(BaseModel):
     key: str
@@ -1,6 +1,32 @@
-from .abstract_exporter import AbstractExporter
-from .markdown_exporter import Markdown
-from .notebook_exporter import Notebook
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 
-__all__ = ["AbstractExporter", "Markdown", "Notebook"]
+if TYPE_CHECKING:  # pragma: no cover
+    from .abstract_exporter import AbstractExporter
+    from .html_exporter import HTML
+    from .markdown_exporter import Markdown
+    from .notebook_exporter import Notebook
+
+
+__all__ = ["AbstractExporter", "HTML", "Markdown", "Notebook"]
+
+_modules = {
+    "AbstractExporter": ".abstract_exporter",
+    "HTML": ".html_exporter",
+    "Markdown": ".markdown_exporter",
+    "Notebook": ".notebook_exporter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # exporters are imported on first access to keep `import ablate` fast
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,17 +1,49 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List, cast
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List
 
 from ablate.blocks import (
     AbstractBlock,
     AbstractFigureBlock,
     AbstractTableBlock,
     AbstractTextBlock,
+    BuildCache,
+    ColumnStore,
 )
+from ablate.blocks.columns import use_column_store
+from ablate.core import profiling
 from ablate.core.types import Run
 from ablate.report import Report
 
 
 class AbstractExporter(ABC):
+    share_columns: bool = True
+    """Whether to evaluate selectors shared by multiple blocks of a report only
+    once per run during an export, see :class:`~ablate.blocks.ColumnStore`."""
+
+    workers: int | None = None
+    """Number of worker processes used to render figures in parallel. If None or 1,
+    all blocks are rendered sequentially in the current process."""
+
+    _executor: Executor | None = None
+    _pending: List[Future]
+
+    @property
+    def build_cache(self) -> BuildCache | None:
+        """Cache used by :meth:`build_block` to reuse block build results within and
+        across exports of this exporter. Each exporter creates its own cache on first
+        use. Set to None to disable caching or assign a
+        :class:`~ablate.blocks.BuildCache` to configure its size limits or share it
+        between exporters."""
+        if "_build_cache" not in vars(self):
+            self._build_cache: BuildCache | None = BuildCache()
+        return self._build_cache
+
+    @build_cache.setter
+    def build_cache(self, cache: BuildCache | None) -> None:
+        self._build_cache = cache
+
     @abstractmethod
     def export(self, report: Report) -> None:
         """Export the report.
@@ -26,6 +58,11 @@ class AbstractExporter(ABC):
     def render_blocks(self, report: Report) -> List[Any]:
         """Render a blocks of the report.
 
+        If :attr:`workers` is greater than 1, work submitted through :meth:`submit`
+        while rendering is distributed to a process pool. All submitted work is
+        finished before returning, and the rendered blocks are always returned in
+        the order of the blocks in the report.
+
         Args:
             report: The report to be rendered.
 
@@ -35,31 +72,110 @@ class AbstractExporter(ABC):
         Returns:
             List of rendered blocks.
         """
-        render_map = {
-            AbstractTextBlock: self.render_text,
-            AbstractTableBlock: self.render_table,
-            AbstractFigureBlock: self.render_figure,
-        }
-        content = []
+        with self._rendering():
+            return list(self.iter_blocks(report))
+
+    def iter_blocks(self, report: Report) -> Iterator[Any]:
+        """Render the blocks of the report one by one.
+
+        Allows exporters to stream rendered blocks to their output as soon as they
+        are available. If blocks are rendered in parallel, work submitted through
+        :meth:`submit` may still be pending when a block is yielded. Selectors
+        shared by multiple blocks are evaluated only once per run if
+        :attr:`share_columns` is enabled.
+
+        Args:
+            report: The report to be rendered.
+
+        Raises:
+            ValueError: If the block type is not supported.
+
+        Yields:
+            The rendered blocks in the order of the blocks in the report.
+        """
+        store = ColumnStore(report) if self.share_columns else None
         for block in report.blocks:
-            for block_type, render_fn in render_map.items():
-                if isinstance(block, block_type):
-                    fn = cast("Callable[[AbstractBlock, List[Run]], Any]", render_fn)
-                    content.append(self._apply_render_fn(block, fn, report.runs))
-                    break
+            runs = getattr(block, "runs", None) or report.runs
+            with (
+                profiling.span("render", type(block).__name__, len(runs)),
+                use_column_store(store),
+            ):
+                rendered = self.render_block(block, runs)
+            yield rendered
+
+    def render_block(self, block: AbstractBlock, runs: List[Run]) -> Any:
+        """Render a single block by dispatching to :meth:`render_text`,
+        :meth:`render_table`, or :meth:`render_figure`.
+
+        Args:
+            block: The block to be rendered.
+            runs: The list of runs to be used for the block.
+
+        Raises:
+            ValueError: If the block type is not supported.
+
+        Returns:
+            The rendered block.
+        """
+        if isinstance(block, AbstractTextBlock):
+            return self.render_text(block, runs)
+        if isinstance(block, AbstractTableBlock):
+            return self.render_table(block, runs)
+        if isinstance(block, AbstractFigureBlock):
+            return self.render_figure(block, runs)
+        raise ValueError(f"Unknown block type: '{type(block)}'.")
+
+    @contextmanager
+    def _rendering(self) -> Iterator[None]:
+        if self.workers is None or self.workers <= 1:
+            yield
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            self._executor, self._pending = executor, []
+            try:
+                yield
+                for future in self._pending:
+                    future.result()
+            finally:
+                self._executor, self._pending = None, []
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Submit expensive, self-contained rendering work such as saving a figure.
+
+        The work is executed in a worker process if blocks are rendered in parallel
+        and immediately otherwise. The function and its arguments must therefore be
+        picklable and should not depend on the block itself, but only on its
+        prebuilt data.
+
+        Args:
+            fn: The function to be executed.
+            *args: The arguments to be passed to the function.
+        """
+        if self._executor is None:
+            fn(*args)
+            return
+        self._pending.append(self._executor.submit(fn, *args))
+
+    def build_block(self, block: AbstractBlock, runs: List[Run]) -> Any:
+        """Build a block, reusing the result of a previous build of the same block
+        configuration over the same runs if available.
+
+        Args:
+            block: The block to be built.
+            runs: The list of runs to be used for the block.
+
+        Returns:
+            The intermediate representation of the block.
+        """
+        with profiling.span("build", type(block).__name__, len(runs)) as span:
+            if self.build_cache is None:
+                result = block.build(runs)
             else:
-                raise ValueError(f"Unknown block type: '{type(block)}'.")
-        return content
-
-    @staticmethod
-    def _apply_render_fn(
-        block: AbstractBlock,
-        fn: Callable[[AbstractBlock, List[Run]], Any],
-        runs: List[Run],
-    ) -> Any:
-        if block.runs:
-            return fn(block, block.runs)
-        return fn(block, runs)
+                result = self.build_cache.build(block, runs)
+            if hasattr(result, "shape"):
+                span.rows = result.shape[0]
+        return result
 
     @abstractmethod
     def render_text(self, block: AbstractTextBlock, runs: List[Run]) -> Any:
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import time
+from typing import Any, Dict, Iterable, List, Set
+
+
+MANIFEST_DIR = ".manifests"
+BLOCK_CACHE_DIR = ".blocks"
+ASSET_PATTERN = re.compile(
+    r"[A-Za-z]\w*_[0-9a-f]{12}\.(png|svg|webp|csv|parquet|feather)"
+)
+"""File names of assets written by exporters, `<Block>_<hash>.<extension>`."""
+
+
+def _report_filename(output_path: Path) -> str:
+    key = hashlib.md5(str(output_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    return f"{output_path.stem}_{key}.json"
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def manifest_path(assets_dir: Path, output_path: Path) -> Path:
+    """Get the path of the manifest of a report within an assets directory.
+
+    Each report output path has its own manifest, so exports of different reports
+    sharing an assets directory do not overwrite each other's manifests.
+
+    Args:
+        assets_dir: The assets directory.
+        output_path: The output path of the report.
+
+    Returns:
+        The path to the manifest file.
+    """
+    return assets_dir / MANIFEST_DIR / _report_filename(output_path)
+
+
+def block_cache_path(assets_dir: Path, output_path: Path) -> Path:
+    """Get the path of the rendered block cache of a report within an assets
+    directory.
+
+    Args:
+        assets_dir: The assets directory.
+        output_path: The output path of the report.
+
+    Returns:
+        The path to the block cache file.
+    """
+    return assets_dir / BLOCK_CACHE_DIR / _report_filename(output_path)
+
+
+def read_block_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read a rendered block cache, ignoring missing or corrupt files.
+
+    Args:
+        path: The path to the block cache file.
+
+    Returns:
+        A mapping from block fingerprints to their rendered text and assets.
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_block_cache(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write a rendered block cache.
+
+    Args:
+        path: The path to the block cache file.
+        entries: A mapping from block fingerprints to their rendered text and
+            assets.
+    """
+    _write_json(path, entries)
+
+
+def claim_asset(assets_dir: Path, filename: str) -> bool:
+    """Mark an asset as in use by the current export.
+
+    Existing assets are touched so they are protected by the retention window of
+    concurrent prunes until the manifest of the current export is written.
+
+    Args:
+        assets_dir: The assets directory.
+        filename: The file name of the asset.
+
+    Returns:
+        Whether the asset does not exist yet and needs to be written.
+    """
+    try:
+        os.utime(assets_dir / filename)
+    except FileNotFoundError:
+        return True
+    return False
+
+
+def write_manifest(assets_dir: Path, output_path: Path, assets: Iterable[str]) -> None:
+    """Record the assets referenced by the latest export of a report.
+
+    Args:
+        assets_dir: The assets directory.
+        output_path: The output path of the report.
+        assets: The file names of all assets referenced by the report.
+    """
+    manifest = {"output": str(output_path.resolve()), "assets": sorted(assets)}
+    _write_json(manifest_path(assets_dir, output_path), manifest)
+
+
+def referenced_assets(assets_dir: Path) -> Set[str]:
+    """Collect the assets referenced by all reports exported to an assets directory.
+
+    Manifests and block caches of reports whose output file no longer exists are
+    removed.
+
+    Args:
+        assets_dir: The assets directory.
+
+    Returns:
+        The file names of all referenced assets.
+    """
+    referenced: Set[str] = set()
+    for path in (assets_dir / MANIFEST_DIR).glob("*.json"):
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not Path(manifest["output"]).exists():
+            path.unlink(missing_ok=True)
+            (assets_dir / BLOCK_CACHE_DIR / path.name).unlink(missing_ok=True)
+            continue
+        referenced.update(manifest["assets"])
+    return referenced
+
+
+def prune_assets(assets_dir: Path, retention: float = 0.0) -> List[Path]:
+    """Remove assets that are not referenced by any report manifest.
+
+    Assets modified within the retention window are kept, as they may have been
+    written or reused by a concurrent export that has not written its manifest yet.
+    Only files named like assets written by exporters, see :data:`ASSET_PATTERN`,
+    are removed, so reports and other files sharing the assets directory as well
+    as hidden files such as temporary files of in-progress writes are never
+    removed.
+
+    Args:
+        assets_dir: The assets directory.
+        retention: Minimum age in seconds of unreferenced assets to be removed.
+            Defaults to 0.0.
+
+    Returns:
+        The paths of the removed assets.
+    """
+    if not assets_dir.is_dir():
+        return []
+    referenced = referenced_assets(assets_dir)
+    cutoff = time.time() - retention
+    removed = []
+    with os.scandir(assets_dir) as it:
+        for entry in it:
+            if entry.name in referenced or not ASSET_PATTERN.fullmatch(entry.name):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                if entry.stat().st_mtime > cutoff:
+                    continue
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                continue
+            removed.append(Path(entry.path))
+    return removed
@@ -0,0 +1,254 @@
+import base64
+import html
+import os
+from pathlib import Path
+from typing import List, Literal, NamedTuple, Set
+
+from ablate.blocks import (
+    AbstractFigureBlock,
+    AbstractTableBlock,
+    AbstractTextBlock,
+    MetricPlot,
+    Text,
+)
+from ablate.blocks.text_blocks import _Heading
+from ablate.core.types import Run
+from ablate.exporters.abstract_exporter import AbstractExporter
+from ablate.report import Report
+
+from .assets import claim_asset, write_manifest
+from .interactive import dump_payload, metric_plot_payload, viewer_script
+from .utils import HEADING_LEVELS, metric_plot_filename, save_metric_plot
+
+
+MIME_TYPES = {"svg": "image/svg+xml", "webp": "image/webp", "png": "image/png"}
+FIGURE_FORMATS = (*MIME_TYPES, "interactive")
+
+TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 960px; margin: 2rem auto;
+  padding: 0 1rem; color: #222; }}
+img.ablate-figure {{ width: 100%; height: auto; aspect-ratio: 4 / 3; }}
+table {{ border-collapse: collapse; margin: 1rem 0; font-size: 0.9rem; }}
+th, td {{ padding: 0.25rem 0.75rem; border-bottom: 1px solid #ddd;
+  text-align: right; }}
+.ablate-pager {{ display: flex; gap: 0.5rem; align-items: center; }}
+</style>
+</head>
+<body>
+{body}
+<script>{scripts}</script>
+<script>
+(function () {{
+  function renderPage(el, data, page) {{
+    var size = parseInt(el.dataset.pageSize, 10);
+    var pages = Math.max(1, Math.ceil(data.data.length / size));
+    page = Math.min(Math.max(page, 0), pages - 1);
+    var table = document.createElement("table");
+    var head = table.createTHead().insertRow();
+    data.columns.forEach(function (c) {{
+      var th = document.createElement("th");
+      th.textContent = c;
+      head.appendChild(th);
+    }});
+    var body = table.createTBody();
+    data.data.slice(page * size, (page + 1) * size).forEach(function (row) {{
+      var tr = body.insertRow();
+      row.forEach(function (v) {{
+        tr.insertCell().textContent = v === null ? "" : v;
+      }});
+    }});
+    var pager = document.createElement("div");
+    pager.className = "ablate-pager";
+    var prev = document.createElement("button");
+    var next = document.createElement("button");
+    var info = document.createElement("span");
+    prev.textContent = "Previous";
+    next.textContent = "Next";
+    prev.disabled = page === 0;
+    next.disabled = page === pages - 1;
+    info.textContent = "Page " + (page + 1) + " of " + pages;
+    prev.onclick = function () {{ renderPage(el, data, page - 1); }};
+    next.onclick = function () {{ renderPage(el, data, page + 1); }};
+    pager.append(prev, info, next);
+    el.replaceChildren(table, pager, el.dataTemplate);
+  }}
+  function load(el) {{
+    if (el.dataset.src) {{
+      el.src = el.dataset.src;
+      el.removeAttribute("data-src");
+    }} else if (el.dataset.pageSize && !el.dataTemplate) {{
+      el.dataTemplate = el.querySelector("script");
+      renderPage(el, JSON.parse(el.dataTemplate.textContent), 0);
+    }} else if (el.dataset.interactive !== undefined) {{
+      var payload = JSON.parse(el.querySelector("script").textContent);
+      el.removeAttribute("data-interactive");
+      ablateViewer(el, payload);
+    }}
+  }}
+  var lazy = document.querySelectorAll(
+    "[data-src], [data-page-size], [data-interactive]"
+  );
+  if (!("IntersectionObserver" in window)) {{
+    lazy.forEach(load);
+    return;
+  }}
+  var observer = new IntersectionObserver(function (entries) {{
+    entries.forEach(function (entry) {{
+      if (entry.isIntersecting) {{
+        observer.unobserve(entry.target);
+        load(entry.target);
+      }}
+    }});
+  }}, {{ rootMargin: "200px" }});
+  lazy.forEach(function (el) {{ observer.observe(el); }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+class _Figure(NamedTuple):
+    filename: str
+    alt: str
+
+
+class HTML(AbstractExporter):
+    def __init__(
+        self,
+        output_path: str = "report.html",
+        assets_dir: str | None = None,
+        embed: bool = True,
+        figure_format: Literal["svg", "webp", "png", "interactive"] = "svg",
+        page_size: int = 50,
+        title: str = "ablate report",
+        workers: int | None = None,
+    ) -> None:
+        """Export the report as an HTML file.
+
+        Figures are only loaded once they are scrolled into view, and tables with
+        more rows than `page_size` are embedded as data and paginated client-side.
+        Figures are rendered through the content-addressed assets directory shared
+        with the :class:`~ablate.exporters.Markdown` exporter, so unchanged figures
+        are never rendered twice.
+
+        Args:
+            output_path: The path to the output HTML file. Defaults to "report.html".
+            assets_dir: The directory to store the assets (figures, etc.). If None,
+                defaults to the parent directory of the output file with a ".ablate"
+                subdirectory. Defaults to None.
+            embed: Whether to embed figures into the HTML file as data URIs,
+                producing a self-contained file. If False, figures are linked from
+                the assets directory. Defaults to True.
+            figure_format: The image format of figures. "interactive" embeds a
+                compact, decimated data payload of each figure together with an
+                offline viewer supporting zooming and panning instead of an image,
+                see :func:`~ablate.exporters.interactive.metric_plot_payload`.
+                Defaults to "svg".
+            page_size: Maximum number of table rows shown at once. Defaults to 50.
+            title: The title of the HTML document. Defaults to "ablate report".
+            workers: Number of worker processes used to render figures in
+                parallel. If None or 1, figures are rendered sequentially.
+                Defaults to None.
+
+        Raises:
+            ValueError: If an unsupported figure format is provided.
+        """
+        if figure_format not in FIGURE_FORMATS:
+            raise ValueError(
+                f"Unsupported figure format: '{figure_format}'. "
+                "Must be 'svg', 'webp', 'png', or 'interactive'."
+            )
+        self.output_path = Path(output_path)
+        self.assets_dir = (
+            Path(assets_dir) if assets_dir else self.output_path.parent / ".ablate"
+        )
+        self.assets_dir.mkdir(exist_ok=True)
+        self.embed = embed
+        self.figure_format = figure_format
+        self.page_size = page_size
+        self.title = title
+        self.workers = workers
+        self._assets: Set[str] = set()
+
+    def export(self, report: Report) -> None:
+        self._assets = set()
+        content = self.render_blocks(report)
+        body = "\n".join(
+            self._render_image(c) if isinstance(c, _Figure) else c for c in content
+        )
+        scripts = viewer_script() if self.figure_format == "interactive" else ""
+        page = TEMPLATE.format(
+            title=html.escape(self.title),
+            body=body,
+            scripts=scripts,
+        )
+        self.output_path.write_text(page, encoding="utf-8")
+        write_manifest(self.assets_dir, self.output_path, self._assets)
+
+    def _render_image(self, figure: _Figure) -> str:
+        if self.embed:
+            data = (self.assets_dir / figure.filename).read_bytes()
+            mime = MIME_TYPES[self.figure_format]
+            src = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+        else:
+            path = self.assets_dir / figure.filename
+            src = Path(os.path.relpath(path, self.output_path.parent)).as_posix()
+        alt = html.escape(figure.alt)
+        return f'<img class="ablate-figure" data-src="{src}" alt="{alt}">'
+
+    def render_text(self, block: AbstractTextBlock, runs: List[Run]) -> str:
+        text = html.escape(block.build(runs))
+        if isinstance(block, Text):
+            return f"<p>{text}</p>"
+        if isinstance(block, _Heading):
+            level = HEADING_LEVELS[type(block)]
+            return f"<h{level}>{text}</h{level}>"
+        raise NotImplementedError(f"Unsupported text block: '{type(block)}'.")
+
+    def render_table(self, block: AbstractTableBlock, runs: List[Run]) -> str:
+        df = self.build_block(block, runs)
+        if len(df) <= self.page_size:
+            return df.to_html(index=False, border=0)
+        data = df.to_json(orient="split", index=False).replace("</", "<\\/")
+        return (
+            f'<div class="ablate-table" data-page-size="{self.page_size}">'
+            f'<script type="application/json">{data}</script></div>'
+        )
+
+    def render_figure(
+        self, block: AbstractFigureBlock, runs: List[Run]
+    ) -> str | _Figure:
+        if not isinstance(block, MetricPlot):
+            raise NotImplementedError(f"Unsupported figure block: '{type(block)}'.")
+
+        df = self.build_block(block, runs)
+        if df.empty:
+            labels = html.escape(", ".join(m.label for m in block.metrics))
+            return f"<p><em>No data available for {labels}</em></p>"
+
+        if self.figure_format == "interactive":
+            payload = metric_plot_payload(df, block.identifier.label, block.errorbar)
+            return (
+                '<div class="ablate-interactive" data-interactive>'
+                f'<script type="application/json">{dump_payload(payload)}</script>'
+                "</div>"
+            )
+
+        filename = metric_plot_filename(block, df, self.figure_format)
+        self._assets.add(filename)
+        if claim_asset(self.assets_dir, filename):
+            self.submit(
+                save_metric_plot,
+                df,
+                block.identifier.label,
+                block.errorbar,
+                self.assets_dir / filename,
+            )
+        return _Figure(filename, ", ".join(m.label for m in block.metrics))
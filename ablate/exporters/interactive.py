@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import base64
+import html
+from importlib.resources import files
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Literal
+
+from .utils import aggregate_metric_frame
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    import numpy as np
+    import pandas as pd
+
+
+DOCUMENT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body style="font-family: sans-serif; max-width: 960px; margin: 2rem auto;">
+<h3>{title}</h3>
+<div id="ablate-viewer"></div>
+<script>{script}</script>
+<script>
+ablateViewer(document.getElementById("ablate-viewer"), {payload});
+</script>
+</body>
+</html>
+"""
+
+
+def viewer_script() -> str:
+    """Get the source of the JavaScript viewer for metric plot payloads.
+
+    The viewer defines a single function ``ablateViewer(container, payload)``
+    rendering a payload into a canvas supporting zooming by scrolling, panning by
+    dragging, and resetting by double-clicking. It has no external dependencies.
+
+    Returns:
+        The JavaScript source of the viewer.
+    """
+    return (files("ablate.exporters") / "static" / "viewer.js").read_text("utf-8")
+
+
+def _encode(values: np.ndarray, dtype: str) -> str:
+    return base64.b64encode(values.astype(dtype).tobytes()).decode("ascii")
+
+
+def metric_plot_payload(
+    df: pd.DataFrame,
+    label: str,
+    errorbar: Literal["ci", "sd", "minmax"] | None = None,
+    points: int = 1000,
+    levels: int = 4,
+    factor: int = 4,
+) -> Dict[str, Any]:
+    """Build a compact data payload of a metric plot for the interactive viewer.
+
+    Runs sharing the same identifier are aggregated to their mean. Each series is
+    stored as a decimation pyramid of increasingly fine levels, each selecting the
+    minimum and maximum of equally sized buckets to preserve the envelope of the
+    series. The viewer draws the coarsest level that still resolves the visible
+    range. Values are encoded as base64 little-endian float arrays, and metrics and
+    runs as indices into lists of labels.
+
+    Args:
+        df: The data of the metric plot as built by
+            :meth:`~ablate.blocks.MetricPlot.build`.
+        label: The label of the identifier of the runs.
+        errorbar: Band drawn around the mean. Only "sd" and "minmax" are supported,
+            as "ci" requires bootstrapping. Defaults to None.
+        points: Maximum number of points per series of the coarsest level.
+            Defaults to 1000.
+        levels: Maximum number of levels per series. Defaults to 4.
+        factor: Factor by which the number of points grows per level.
+            Defaults to 4.
+
+    Returns:
+        A JSON-serializable payload.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from ablate.blocks.downsampling import downsample
+
+    band = None if errorbar == "ci" else errorbar
+    agg = aggregate_metric_frame(df, band)
+    metric_codes, metrics = pd.factorize(agg["metric"])
+    run_codes, runs = pd.factorize(agg["run"])
+    bounds = np.flatnonzero(
+        np.diff(metric_codes, prepend=-1, append=-1)
+        | np.diff(run_codes, prepend=-1, append=-1)
+    )
+
+    series: List[Dict[str, Any]] = []
+    for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+        x = agg["step"].to_numpy(dtype=np.float64)[start:end]
+        y = agg["value"].to_numpy(dtype=np.float64)[start:end]
+        pyramid = []
+        for level in range(levels):
+            n = points * factor**level
+            idx = downsample(x, y, n, "minmax") if n < len(x) else np.arange(len(x))
+            entry = {"x": _encode(x[idx], "<f8"), "y": _encode(y[idx], "<f4")}
+            if band is not None:
+                for key in ("lower", "upper"):
+                    values = agg[key].to_numpy(dtype=np.float64)[start:end]
+                    entry[key] = _encode(values[idx], "<f4")
+            pyramid.append(entry)
+            if n >= len(x):
+                break
+        series.append(
+            {
+                "metric": int(metric_codes[start]),
+                "run": int(run_codes[start]),
+                "levels": pyramid,
+            }
+        )
+
+    return {
+        "label": label,
+        "metrics": [str(m) for m in metrics],
+        "runs": [str(r) for r in runs],
+        "series": series,
+    }
+
+
+def dump_payload(payload: Dict[str, Any]) -> str:
+    """Serialize a payload for embedding into an HTML script element.
+
+    Args:
+        payload: The payload to serialize.
+
+    Returns:
+        The serialized payload.
+    """
+    return json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+
+
+def save_interactive_plot(
+    df: pd.DataFrame,
+    label: str,
+    errorbar: Literal["ci", "sd", "minmax"] | None,
+    path: Path,
+) -> None:
+    """Save a metric plot as a standalone HTML document with an embedded
+    interactive viewer that works offline.
+
+    Args:
+        df: The data of the metric plot.
+        label: The label of the identifier of the runs.
+        errorbar: Band drawn around the mean. Only "sd" and "minmax" are supported.
+        path: The path to the output HTML file.
+    """
+    payload = metric_plot_payload(df, label, errorbar)
+    document = DOCUMENT.format(
+        title=html.escape(label),
+        script=viewer_script(),
+        payload=dump_payload(payload),
+    )
+    path.write_text(document, encoding="utf-8")
@@ -1,19 +1,44 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Set, cast
 
 from ablate.blocks import (
+    AbstractBlock,
     AbstractFigureBlock,
     AbstractTableBlock,
     AbstractTextBlock,
     MetricPlot,
     Text,
 )
+from ablate.blocks.cache import block_fingerprint
 from ablate.blocks.text_blocks import _Heading
-from ablate.core.types import Run
 from ablate.exporters.abstract_exporter import AbstractExporter
-from ablate.report import Report
 
-from .utils import HEADING_LEVELS, hash_dataframe, render_metric_plot
+from .assets import (
+    block_cache_path,
+    claim_asset,
+    prune_assets,
+    read_block_cache,
+    write_block_cache,
+    write_manifest,
+)
+from .utils import (
+    DATA_FORMATS,
+    HEADING_LEVELS,
+    PLOT_STYLE,
+    hash_dataframe,
+    metric_plot_filename,
+    save_data,
+    save_metric_plot,
+)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+    from ablate.core.types import Run
+    from ablate.report import Report
 
 
 class Markdown(AbstractExporter):
@@ -22,16 +47,53 @@ class Markdown(AbstractExporter):
         output_path: str = "report.md",
         assets_dir: str | None = None,
         export_csv: bool = False,
+        export_data: Literal["csv", "parquet", "feather"] | None = None,
+        workers: int | None = None,
+        prune: bool = False,
+        retention: float = 0.0,
+        stream: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Export the report as a markdown file.
 
+        The assets directory is treated as a content-addressed cache. Figures and
+        CSV files are named after a hash of their data and plot settings, and
+        existing assets are reused instead of being rendered again. The assets
+        referenced by each export are recorded in a manifest, allowing assets that
+        are no longer referenced by any report to be pruned.
+
         Args:
             output_path: The path to the output markdown file. Defaults to "report.md".
             assets_dir: The directory to store the assets (figures, etc.). If None,
                 defaults to the parent directory of the output file with a ".ablate"
                 subdirectory. Defaults to None.
             export_csv: Whether to export tables and plots as CSV files.
+                Shorthand for `export_data="csv"`. Defaults to False.
+            export_data: The format to export the data of tables and plots in.
+                "parquet" and "feather" write zstd-compressed columnar files that
+                preserve categorical columns and require `pyarrow`. If None, data is
+                only exported if `export_csv` is True. Defaults to None.
+            workers: Number of worker processes used to render figures in
+                parallel. If None or 1, figures are rendered sequentially.
+                Defaults to None.
+            prune: Whether to prune unreferenced assets after each export.
                 Defaults to False.
+            retention: Minimum age in seconds of unreferenced assets to be pruned,
+                protecting assets of concurrent exports sharing the assets
+                directory. Defaults to 0.0.
+            stream: Whether to write each block to the output file as soon as it is
+                rendered instead of writing the whole report at the end, so partial
+                results are available while the export is running and kept if a
+                block fails. Defaults to False.
+            incremental: Whether to reuse the rendered text of blocks whose
+                configuration and runs did not change since the previous export
+                of the report, only rendering changed blocks. Blocks configured with
+                lambdas are always rendered. Defaults to False.
+
+        Raises:
+            ValueError: If an unsupported data format is provided.
+            ImportError: If a columnar data format is requested but `pyarrow` is not
+                installed.
         """
         self.output_path = Path(output_path)
         self.assets_dir = (
@@ -39,13 +101,105 @@ class Markdown(AbstractExporter):
         )
         self.assets_dir.mkdir(exist_ok=True)
         self.export_csv = export_csv
+        if export_data is None and export_csv:
+            export_data = "csv"
+        if export_data is not None and export_data not in DATA_FORMATS:
+            raise ValueError(
+                f"Unsupported data format: '{export_data}'. "
+                "Must be 'csv', 'parquet', or 'feather'."
+            )
+        if export_data in ("parquet", "feather"):
+            try:
+                import pyarrow as pa  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    f"Markdown exporter requires `pyarrow` to export {export_data}. "
+                    "Please install with `pip install ablate[arrow]`."
+                ) from e
+        self.export_data = export_data
+        self.workers = workers
+        self.prune = prune
+        self.retention = retention
+        self.stream = stream
+        self.incremental = incremental
+        self._assets: Set[str] = set()
+        self._block_assets: List[str] = []
+        self._cached_blocks: Dict[str, Dict[str, Any]] = {}
+        self._rendered_blocks: Dict[str, Dict[str, Any]] = {}
 
     def export(self, report: Report) -> None:
-        content = self.render_blocks(report)
-        with self.output_path.open("w", encoding="utf-8") as f:
-            for block_output in content:
+        self._assets = set()
+        cache_path = block_cache_path(self.assets_dir, self.output_path)
+        if self.incremental:
+            self._cached_blocks = read_block_cache(cache_path)
+        self._rendered_blocks = {}
+        try:
+            if self.stream:
+                self._export_stream(report)
+            else:
+                content = self.render_blocks(report)
+                with self.output_path.open("w", encoding="utf-8") as f:
+                    for block_output in content:
+                        f.write(block_output)
+                        f.write("\n\n")
+        finally:
+            if self.incremental:
+                write_block_cache(cache_path, self._rendered_blocks)
+            self._cached_blocks, self._rendered_blocks = {}, {}
+        write_manifest(self.assets_dir, self.output_path, self._assets)
+        if self.prune:
+            self.prune_assets()
+
+    def _export_stream(self, report: Report) -> None:
+        with self._rendering(), self.output_path.open("w", encoding="utf-8") as f:
+            for block_output in self.iter_blocks(report):
                 f.write(block_output)
                 f.write("\n\n")
+                f.flush()
+
+    def render_block(self, block: AbstractBlock, runs: List[Run]) -> str:
+        if not self.incremental:
+            return super().render_block(block, runs)
+
+        key = block_fingerprint(
+            block,
+            runs,
+            str(self.export_data),
+            repr(sorted(PLOT_STYLE.items())),
+        )
+        entry = self._cached_blocks.get(key) if key is not None else None
+        # reset before claiming cached assets, so they are not attributed to the
+        # previously rendered block
+        self._block_assets = []
+        if entry is not None and not any(self._claim_asset(a) for a in entry["assets"]):
+            self._rendered_blocks[cast("str", key)] = entry
+            return entry["text"]
+
+        self._block_assets = []
+        text = super().render_block(block, runs)
+        if key is not None:
+            self._rendered_blocks[key] = {"text": text, "assets": self._block_assets}
+        return text
+
+    def prune_assets(self, retention: float | None = None) -> List[Path]:
+        """Remove assets that are not referenced by the latest export of any report
+        sharing the assets directory.
+
+        Args:
+            retention: Minimum age in seconds of unreferenced assets to be removed.
+                If None, defaults to the retention of the exporter.
+
+        Returns:
+            The paths of the removed assets.
+        """
+        return prune_assets(
+            self.assets_dir, self.retention if retention is None else retention
+        )
+
+    def _claim_asset(self, filename: str) -> bool:
+        self._assets.add(filename)
+        self._block_assets.append(filename)
+        return claim_asset(self.assets_dir, filename)
 
     def render_text(self, block: AbstractTextBlock, runs: List[Run]) -> str:
         if isinstance(block, Text):
@@ -55,28 +209,40 @@ class Markdown(AbstractExporter):
         raise NotImplementedError(f"Unsupported text block: '{type(block)}'.")
 
     def render_table(self, block: AbstractTableBlock, runs: List[Run]) -> str:
-        df = block.build(runs)
-        if self.export_csv:
-            df.to_csv(
-                self.assets_dir / f"{type(block).__name__}_{hash_dataframe(df)}.csv",
-                index=False,
-            )
+        df = self.build_block(block, runs)
+        if self.export_data is not None:
+            self._export_data(block, df, self.export_data)
         return df.to_markdown(index=False)
 
     def render_figure(self, block: AbstractFigureBlock, runs: List[Run]) -> str:
         if not isinstance(block, MetricPlot):
             raise NotImplementedError(f"Unsupported figure block: '{type(block)}'.")
 
-        if self.export_csv:
-            df = block.build(runs)
-            df.to_csv(
-                self.assets_dir / f"{type(block).__name__}_{hash_dataframe(df)}.csv",
-                index=False,
-            )
+        df = self.build_block(block, runs)
+        if self.export_data is not None:
+            self._export_data(block, df, self.export_data)
 
-        filename = render_metric_plot(block, runs, self.assets_dir)
-        if filename is None:
+        if df.empty:
             return (
                 f"*No data available for {', '.join(m.label for m in block.metrics)}*"
             )
+        filename = metric_plot_filename(block, df)
+        if self._claim_asset(filename):
+            self.submit(
+                save_metric_plot,
+                df,
+                block.identifier.label,
+                block.errorbar,
+                self.assets_dir / filename,
+            )
         return f"![{filename}](.ablate/{filename})"
+
+    def _export_data(
+        self,
+        block: AbstractBlock,
+        df: pd.DataFrame,
+        data_format: Literal["csv", "parquet", "feather"],
+    ) -> None:
+        filename = f"{type(block).__name__}_{hash_dataframe(df)}.{data_format}"
+        if self._claim_asset(filename):
+            save_data(df, self.assets_dir / filename, data_format)
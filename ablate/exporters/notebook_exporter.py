@@ -1,8 +1,6 @@
 import sys
 from typing import List
 
-from matplotlib import pyplot as plt
-
 from ablate.blocks import (
     AbstractFigureBlock,
     AbstractTableBlock,
@@ -55,7 +53,7 @@ class Notebook(AbstractExporter):
     def render_table(self, block: AbstractTableBlock, runs: List[Run]) -> None:
         from IPython.display import display
 
-        display(block.build(runs))
+        display(self.build_block(block, runs))
 
     def render_figure(self, block: AbstractFigureBlock, runs: List[Run]) -> None:
         from IPython.display import Markdown, display
@@ -63,12 +61,10 @@ class Notebook(AbstractExporter):
         if not isinstance(block, MetricPlot):
             raise NotImplementedError(f"Unsupported figure block: '{type(block)}'.")
 
-        df = block.build(runs)
+        df = self.build_block(block, runs)
         if df.empty:
             m = f"*No data available for {', '.join(m.label for m in block.metrics)}*"
             display(Markdown(m))
             return
 
-        fig = create_metric_plot(df, block.identifier.label)
-        plt.close(fig)
-        display(fig)
+        display(create_metric_plot(df, block.identifier.label, block.errorbar))
@@ -0,0 +1,173 @@
+function ablateViewer(container, payload) {
+  var COLORS = ["#4878d0", "#ee854a", "#6acc64", "#d65f5f", "#956cb4",
+    "#8c613c", "#dc7ec0", "#797979", "#d5bb67", "#82c6e2"];
+  var DASHES = [[], [6, 3], [2, 2], [8, 3, 2, 3]];
+  var PAD = { left: 56, right: 12, top: 12, bottom: 28 };
+
+  function decode(data) {
+    var bytes = atob(data), buffer = new ArrayBuffer(bytes.length);
+    var view = new Uint8Array(buffer);
+    for (var i = 0; i < bytes.length; i++) view[i] = bytes.charCodeAt(i);
+    return buffer;
+  }
+  var series = payload.series.map(function (s) {
+    return {
+      metric: s.metric, run: s.run,
+      levels: s.levels.map(function (l) {
+        return {
+          x: new Float64Array(decode(l.x)), y: new Float32Array(decode(l.y)),
+          lower: l.lower ? new Float32Array(decode(l.lower)) : null,
+          upper: l.upper ? new Float32Array(decode(l.upper)) : null
+        };
+      })
+    };
+  });
+  var xmin = Infinity, xmax = -Infinity;
+  series.forEach(function (s) {
+    var x = s.levels[0].x;
+    if (x.length) { xmin = Math.min(xmin, x[0]); xmax = Math.max(xmax, x[x.length - 1]); }
+  });
+  if (xmin === xmax) { xmin -= 1; xmax += 1; }
+  var full = [xmin, xmax], view = [xmin, xmax];
+
+  var canvas = document.createElement("canvas");
+  canvas.style.width = "100%";
+  canvas.style.cursor = "grab";
+  var legend = document.createElement("div");
+  legend.style.fontSize = "0.8rem";
+  container.replaceChildren(canvas, legend);
+  payload.runs.forEach(function (run, i) {
+    var item = document.createElement("span");
+    item.style.marginRight = "1rem";
+    item.innerHTML = '<span style="color:' + COLORS[i % COLORS.length] +
+      '">&#9632;</span> ';
+    item.appendChild(document.createTextNode(run));
+    legend.appendChild(item);
+  });
+  if (payload.metrics.length > 1) {
+    payload.metrics.forEach(function (metric, i) {
+      var item = document.createElement("span");
+      item.style.marginRight = "1rem";
+      item.textContent = ["solid", "dashed", "dotted", "dash-dot"][i % 4] +
+        ": " + metric;
+      legend.appendChild(item);
+    });
+  }
+
+  function search(x, value) {
+    var lo = 0, hi = x.length;
+    while (lo < hi) { var mid = (lo + hi) >> 1; if (x[mid] < value) lo = mid + 1; else hi = mid; }
+    return lo;
+  }
+  function visible(s, width) {
+    for (var k = 0; k < s.levels.length; k++) {
+      var l = s.levels[k], a = search(l.x, view[0]), b = search(l.x, view[1]);
+      if (b - a >= width || k === s.levels.length - 1) {
+        return { level: l, start: Math.max(a - 1, 0), end: Math.min(b + 1, l.x.length) };
+      }
+    }
+  }
+  function ticks(lo, hi, count) {
+    var step = Math.pow(10, Math.floor(Math.log10((hi - lo) / count)));
+    var err = (hi - lo) / count / step;
+    step *= err >= 7.5 ? 10 : err >= 3.5 ? 5 : err >= 1.5 ? 2 : 1;
+    var out = [];
+    for (var t = Math.ceil(lo / step) * step; t <= hi; t += step) out.push(t);
+    return out;
+  }
+  function format(t) { return Math.abs(t) >= 1e4 ? t.toExponential(1) : +t.toPrecision(4); }
+
+  function draw() {
+    var ratio = window.devicePixelRatio || 1;
+    var width = canvas.clientWidth || 640, height = Math.round(width * 0.6);
+    canvas.width = width * ratio;
+    canvas.height = height * ratio;
+    canvas.style.height = height + "px";
+    var ctx = canvas.getContext("2d");
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+    var plotW = width - PAD.left - PAD.right, plotH = height - PAD.top - PAD.bottom;
+    var spans = series.map(function (s) { return visible(s, plotW); });
+    var ymin = Infinity, ymax = -Infinity;
+    spans.forEach(function (v) {
+      for (var i = v.start; i < v.end; i++) {
+        var lo = v.level.lower ? v.level.lower[i] : v.level.y[i];
+        var hi = v.level.upper ? v.level.upper[i] : v.level.y[i];
+        if (lo < ymin) ymin = lo;
+        if (hi > ymax) ymax = hi;
+      }
+    });
+    if (!isFinite(ymin)) { ymin = 0; ymax = 1; }
+    if (ymin === ymax) { ymin -= 0.5; ymax += 0.5; }
+    var margin = (ymax - ymin) * 0.05;
+    ymin -= margin; ymax += margin;
+    function px(x) { return PAD.left + (x - view[0]) / (view[1] - view[0]) * plotW; }
+    function py(y) { return PAD.top + (ymax - y) / (ymax - ymin) * plotH; }
+
+    ctx.font = "11px sans-serif";
+    ctx.fillStyle = "#444";
+    ctx.strokeStyle = "#e5e5e5";
+    ctx.lineWidth = 1;
+    ctx.textAlign = "center";
+    ticks(view[0], view[1], 6).forEach(function (t) {
+      ctx.beginPath(); ctx.moveTo(px(t), PAD.top); ctx.lineTo(px(t), PAD.top + plotH); ctx.stroke();
+      ctx.fillText(format(t), px(t), height - 10);
+    });
+    ctx.textAlign = "right";
+    ticks(ymin, ymax, 5).forEach(function (t) {
+      ctx.beginPath(); ctx.moveTo(PAD.left, py(t)); ctx.lineTo(PAD.left + plotW, py(t)); ctx.stroke();
+      ctx.fillText(format(t), PAD.left - 6, py(t) + 4);
+    });
+
+    ctx.save();
+    ctx.beginPath();
+    ctx.rect(PAD.left, PAD.top, plotW, plotH);
+    ctx.clip();
+    series.forEach(function (s, k) {
+      var v = spans[k], l = v.level, color = COLORS[s.run % COLORS.length];
+      if (v.end - v.start === 0) return;
+      if (l.lower) {
+        ctx.beginPath();
+        for (var i = v.start; i < v.end; i++) ctx.lineTo(px(l.x[i]), py(l.upper[i]));
+        for (var j = v.end - 1; j >= v.start; j--) ctx.lineTo(px(l.x[j]), py(l.lower[j]));
+        ctx.closePath();
+        ctx.globalAlpha = 0.2;
+        ctx.fillStyle = color;
+        ctx.fill();
+        ctx.globalAlpha = 1;
+      }
+      ctx.beginPath();
+      for (var n = v.start; n < v.end; n++) ctx.lineTo(px(l.x[n]), py(l.y[n]));
+      ctx.setLineDash(DASHES[s.metric % DASHES.length]);
+      ctx.strokeStyle = color;
+      ctx.lineWidth = 1.5;
+      ctx.stroke();
+    });
+    ctx.restore();
+  }
+
+  var drag = null;
+  canvas.addEventListener("wheel", function (e) {
+    e.preventDefault();
+    var rect = canvas.getBoundingClientRect();
+    var plotW = rect.width - PAD.left - PAD.right;
+    var at = view[0] + (e.clientX - rect.left - PAD.left) / plotW * (view[1] - view[0]);
+    var scale = Math.exp(e.deltaY * 0.001);
+    var lo = at - (at - view[0]) * scale, hi = at + (view[1] - at) * scale;
+    view = [Math.max(lo, full[0]), Math.min(hi, full[1])];
+    draw();
+  }, { passive: false });
+  canvas.addEventListener("mousedown", function (e) { drag = { x: e.clientX, view: view.slice() }; });
+  window.addEventListener("mouseup", function () { drag = null; });
+  window.addEventListener("mousemove", function (e) {
+    if (!drag) return;
+    var plotW = canvas.clientWidth - PAD.left - PAD.right;
+    var shift = (drag.x - e.clientX) / plotW * (drag.view[1] - drag.view[0]);
+    shift = Math.max(full[0] - drag.view[0], Math.min(full[1] - drag.view[1], shift));
+    view = [drag.view[0] + shift, drag.view[1] + shift];
+    draw();
+  });
+  canvas.addEventListener("dblclick", function () { view = full.slice(); draw(); });
+  window.addEventListener("resize", draw);
+  draw();
+}
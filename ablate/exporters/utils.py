@@ -1,58 +1,269 @@
-import hashlib
-from pathlib import Path
-from typing import List
+from __future__ import annotations
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Literal
 
 from ablate.blocks import H1, H2, H3, H4, H5, H6, MetricPlot
-from ablate.core.types.runs import Run
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from matplotlib.figure import Figure
+    import pandas as pd
 
 
 HEADING_LEVELS = {H1: 1, H2: 2, H3: 3, H4: 4, H5: 5, H6: 6}
+DATA_FORMATS = ("csv", "parquet", "feather")
+PLOT_STYLE: Dict[str, Any] = {
+    "style": "whitegrid",
+    "context": "paper",
+    "font_scale": 0.8,
+    "palette": "muted",
+    "dpi": 300,
+}
 
+# rc_context swaps the global rc parameters, so styled sections must not overlap
+_style_lock = threading.RLock()
+_local = threading.local()
 
-def apply_default_plot_style() -> None:
-    sns.set_style("whitegrid")
-    sns.set_context("paper", font_scale=0.8)
-    sns.set_palette("muted")
-    plt.rcParams["figure.dpi"] = 300
 
+@lru_cache(maxsize=1)
+def plot_style_rc() -> Dict[str, Any]:
+    """Resolve the default plot style into matplotlib rc parameters.
 
-def hash_dataframe(df: pd.DataFrame) -> str:
-    return hashlib.md5(df.to_csv(index=False).encode("utf-8")).hexdigest()[:12]
+    The style is resolved once per process and applied to each figure using
+    :func:`plot_style`, leaving the global matplotlib state untouched.
 
+    Returns:
+        The rc parameters of the default plot style.
+    """
+    from cycler import cycler
+    import seaborn as sns
 
-def create_metric_plot(df: pd.DataFrame, label: str) -> plt.Figure:
-    apply_default_plot_style()
-    fig, ax = plt.subplots()
-    sns.lineplot(
-        data=df,
-        x="step",
-        y="value",
-        hue="run",
-        style="metric" if df["metric"].nunique() > 1 else None,
-        ax=ax,
-    )
-    ax.set_xlabel("Step")
-    ax.set_ylabel("Value")
-    ax.legend(title=label, loc="best", frameon=False)
-    plt.tight_layout()
+    return {
+        **sns.axes_style(PLOT_STYLE["style"]),
+        **sns.plotting_context(PLOT_STYLE["context"], PLOT_STYLE["font_scale"]),
+        "axes.prop_cycle": cycler(color=sns.color_palette(PLOT_STYLE["palette"])),
+        "figure.dpi": PLOT_STYLE["dpi"],
+    }
+
+
+@contextmanager
+def plot_style() -> Iterator[None]:
+    """Apply the default plot style within a context.
+
+    The style is applied using :func:`matplotlib.rc_context`, which temporarily
+    replaces the global rc parameters. Styled contexts of concurrent threads are
+    therefore serialized, so each thread restores the parameters it replaced.
+
+    Yields:
+        None
+    """
+    from matplotlib import rc_context
+
+    with _style_lock, rc_context(plot_style_rc()):
+        yield
+
+
+def new_figure() -> Figure:
+    """Create a figure attached to a non-interactive Agg canvas, bypassing the
+    pyplot figure manager.
+
+    Returns:
+        The created figure.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    with plot_style():
+        fig = Figure()
+    FigureCanvasAgg(fig)
     return fig
 
 
-def render_metric_plot(
+def hash_dataframe(df: pd.DataFrame, *salt: str) -> str:
+    import pandas as pd
+
+    digest = hashlib.md5()
+    for column, dtype in df.dtypes.items():
+        digest.update(f"{column}\0{dtype}\0".encode())
+    if len(df.columns) > 0:
+        # object cells such as lists or dicts of params are not hashable by pandas
+        objects = df.select_dtypes(include="object").columns
+        if len(objects) > 0:
+            df = df.copy()
+            for column in objects:
+                df[column] = df[column].map(repr)
+        rows = pd.util.hash_pandas_object(df, index=False)
+        digest.update(rows.to_numpy(dtype="uint64").tobytes())
+    for s in salt:
+        digest.update(b"\0" + s.encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def aggregate_metric_frame(
+    df: pd.DataFrame,
+    errorbar: Literal["sd", "minmax"] | None,
+) -> pd.DataFrame:
+    grouped = df.groupby(["metric", "run", "step"], observed=True)["value"]
+    agg = grouped.mean().rename("value").to_frame()
+    match errorbar:
+        case "sd":
+            sd = grouped.std().fillna(0.0)
+            agg["lower"], agg["upper"] = agg["value"] - sd, agg["value"] + sd
+        case "minmax":
+            agg["lower"], agg["upper"] = grouped.min(), grouped.max()
+    return agg.reset_index()
+
+
+def create_metric_plot(
+    df: pd.DataFrame,
+    label: str,
+    errorbar: Literal["ci", "sd", "minmax"] | None = "ci",
+    fig: Figure | None = None,
+) -> Figure:
+    import seaborn as sns
+
+    if fig is None:
+        fig = new_figure()
+    else:
+        fig.clear()
+    with plot_style():
+        ax = fig.subplots()
+        style = "metric" if df["metric"].nunique() > 1 else None
+        if errorbar == "ci":
+            sns.lineplot(data=df, x="step", y="value", hue="run", style=style, ax=ax)
+        else:
+            agg = aggregate_metric_frame(df, errorbar)
+            levels = list(agg["run"].unique())
+            palette = dict(
+                zip(levels, sns.color_palette(n_colors=len(levels)), strict=True)
+            )
+            if errorbar is not None:
+                for (_, run), group in agg.groupby(["metric", "run"], observed=True):
+                    ax.fill_between(
+                        group["step"],
+                        group["lower"],
+                        group["upper"],
+                        color=palette[run],
+                        alpha=0.2,
+                        linewidth=0,
+                    )
+            sns.lineplot(
+                data=agg,
+                x="step",
+                y="value",
+                hue="run",
+                hue_order=levels,
+                palette=palette,
+                style=style,
+                estimator=None,
+                ax=ax,
+            )
+        ax.set_xlabel("Step")
+        ax.set_ylabel("Value")
+        ax.legend(title=label, loc="best", frameon=False)
+        fig.tight_layout()
+    return fig
+
+
+def metric_plot_filename(
     block: MetricPlot,
-    runs: List[Run],
-    output_dir: Path,
-) -> str | None:
-    df = block.build(runs)
-    if df.empty:
-        return None
-
-    fig = create_metric_plot(df, block.identifier.label)
-    filename = f"{type(block).__name__}_{hash_dataframe(df)}.png"
-    fig.savefig(output_dir / filename)
-    plt.close(fig)
-    return filename
+    df: pd.DataFrame,
+    extension: str = "png",
+) -> str:
+    salt = (
+        block.identifier.label,
+        str(block.errorbar),
+        repr(sorted(PLOT_STYLE.items())),
+    )
+    return f"{type(block).__name__}_{hash_dataframe(df, *salt)}.{extension}"
+
+
+def save_metric_plot(
+    df: pd.DataFrame,
+    label: str,
+    errorbar: Literal["ci", "sd", "minmax"] | None,
+    path: Path,
+) -> None:
+    fig = create_metric_plot(df, label, errorbar, _shared_figure())
+    tmp_path = path.with_name(f".{path.name}.{_tmp_suffix()}.tmp")
+    try:
+        with plot_style():
+            fig.savefig(tmp_path, format=path.suffix.lstrip("."))
+        os.replace(tmp_path, path)
+    finally:
+        fig.clear()
+        tmp_path.unlink(missing_ok=True)
+
+
+def _shared_figure() -> Figure:
+    # figures are saved and cleared right away, so one figure per thread suffices
+    fig = getattr(_local, "figure", None)
+    if fig is None:
+        fig = _local.figure = new_figure()
+    return fig
+
+
+def _tmp_suffix() -> str:
+    return f"{os.getpid()}.{threading.get_ident()}"
+
+
+def save_data(
+    df: pd.DataFrame,
+    path: Path,
+    data_format: Literal["csv", "parquet", "feather"],
+) -> None:
+    tmp_path = path.with_name(f".{path.name}.{_tmp_suffix()}.tmp")
+    try:
+        match data_format:
+            case "csv":
+                df.to_csv(tmp_path, index=False)
+            case "parquet":
+                df = _arrow_compatible(df)
+                df.to_parquet(tmp_path, index=False, compression="zstd")
+            case "feather":
+                df = _arrow_compatible(df).reset_index(drop=True)
+                df.to_feather(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _is_mixed(values: Iterable[Any]) -> bool:
+    import numpy as np
+
+    types = {type(v) for v in values}
+    if len(types) < 2:
+        return False
+    # ints and floats are merged into a float column by arrow
+    return not all(
+        issubclass(t, (int, float, np.number)) and not issubclass(t, (bool, np.bool_))
+        for t in types
+    )
+
+
+def _arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
+
+    # arrow requires a single type per column, while params of runs from
+    # heterogeneous sources often mix types, so mixed columns are stored as strings
+    converted = {}
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            if _is_mixed(values.cat.categories):
+                converted[column] = values.astype(str).astype("category")
+        elif values.dtype == object and _is_mixed(values.dropna()):
+            converted[column] = values.map(str, na_action="ignore")
+    if not converted:
+        return df
+    df = df.copy()
+    for column, values in converted.items():
+        df[column] = values
+    return df
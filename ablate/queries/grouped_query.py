@@ -4,14 +4,34 @@ from collections import defaultdict
 from copy import deepcopy
 from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Union
 
+from ablate.core.profiling import profiled
 from ablate.core.types import GroupedRun, Run
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.memory import MemoryFootprint
+
     from .query import Query  # noqa: TC004
     from .selectors import AbstractMetric, AbstractParam
 
 
+def _sorted_runs(
+    groups: List[List[Run]],
+    key: AbstractMetric,
+    reverse: bool,
+) -> List[List[Run]]:
+    # evaluate the metric once for the runs of all groups, so reductions of temporal
+    # metrics are computed in a single vectorized pass
+    values = key.evaluate_many([run for runs in groups for run in runs]).tolist()
+    result, offset = [], 0
+    for runs in groups:
+        keys = values[offset : offset + len(runs)]
+        order = sorted(range(len(runs)), key=keys.__getitem__, reverse=reverse)
+        result.append([runs[i] for i in order])
+        offset += len(runs)
+    return result
+
+
 class GroupedQuery:
     def __init__(self, groups: List[GroupedRun]) -> None:
         """Query interface for manipulating grouped runs in a functional way.
@@ -24,6 +44,7 @@ class GroupedQuery:
         """
         self._grouped = groups
 
+    @profiled("query")
     def filter(self, fn: Callable[[GroupedRun], bool]) -> GroupedQuery:
         """Filter the grouped runs in the grouped query based on a predicate function.
 
@@ -37,6 +58,7 @@ class GroupedQuery:
         """
         return GroupedQuery([g for g in self._grouped[:] if fn(g)])
 
+    @profiled("query")
     def map(self, fn: Callable[[GroupedRun], GroupedRun]) -> GroupedQuery:
         """Apply a function to each grouped run in the grouped query.
 
@@ -53,6 +75,7 @@ class GroupedQuery:
         """
         return GroupedQuery([fn(deepcopy(g)) for g in self._grouped])
 
+    @profiled("query")
     def sort(self, key: AbstractMetric, ascending: bool = False) -> GroupedQuery:
         """Sort the runs inside each grouped run in the grouped query based on a metric.
 
@@ -64,17 +87,19 @@ class GroupedQuery:
         Returns:
             A new grouped query with the grouped runs sorted by the specified metric.
         """
+        groups = [g.runs for g in self._grouped]
         return GroupedQuery(
             [
-                GroupedRun(
-                    key=g.key,
-                    value=g.value,
-                    runs=sorted(g.runs, key=key, reverse=not ascending),
+                GroupedRun(key=g.key, value=g.value, runs=runs)
+                for g, runs in zip(
+                    self._grouped,
+                    _sorted_runs(groups, key, not ascending),
+                    strict=True,
                 )
-                for g in self._grouped
             ]
         )
 
+    @profiled("query")
     def project(
         self, selectors: Union[AbstractParam, List[AbstractParam]]
     ) -> GroupedQuery:
@@ -104,6 +129,7 @@ class GroupedQuery:
 
         return GroupedQuery(projected)
 
+    @profiled("query")
     def head(self, n: int) -> Query:
         """Get the first n runs inside each grouped run.
 
@@ -120,6 +146,7 @@ class GroupedQuery:
             ]
         )._to_query()
 
+    @profiled("query")
     def tail(self, n: int) -> Query:
         """Get the last n runs inside each grouped run.
 
@@ -136,6 +163,7 @@ class GroupedQuery:
             ]
         )._to_query()
 
+    @profiled("query")
     def topk(self, metric: AbstractMetric, k: int) -> Query:
         """Get the top k runs inside each grouped run based on a metric.
 
@@ -147,19 +175,19 @@ class GroupedQuery:
             A new query with the top k runs from each grouped run based on the
             specified metric.
         """
+        groups = [g.runs for g in self._grouped]
         return GroupedQuery(
             [
-                GroupedRun(
-                    key=g.key,
-                    value=g.value,
-                    runs=sorted(g.runs, key=metric, reverse=metric.direction == "min")[
-                        :k
-                    ],
+                GroupedRun(key=g.key, value=g.value, runs=runs[:k])
+                for g, runs in zip(
+                    self._grouped,
+                    _sorted_runs(groups, metric, metric.direction == "min"),
+                    strict=True,
                 )
-                for g in self._grouped
             ]
         )._to_query()
 
+    @profiled("query")
     def bottomk(self, metric: AbstractMetric, k: int) -> Query:
         """Get the bottom k runs inside each grouped run based on a metric.
 
@@ -171,19 +199,19 @@ class GroupedQuery:
             A new query with the bottom k runs from each grouped run based on the
             specified metric.
         """
+        groups = [g.runs for g in self._grouped]
         return GroupedQuery(
             [
-                GroupedRun(
-                    key=g.key,
-                    value=g.value,
-                    runs=sorted(g.runs, key=metric, reverse=metric.direction == "max")[
-                        :k
-                    ],
+                GroupedRun(key=g.key, value=g.value, runs=runs[:k])
+                for g, runs in zip(
+                    self._grouped,
+                    _sorted_runs(groups, metric, metric.direction == "max"),
+                    strict=True,
                 )
-                for g in self._grouped
             ]
         )._to_query()
 
+    @profiled("query")
     def aggregate(
         self,
         method: Literal["first", "last", "best", "worst", "mean"],
@@ -298,6 +326,20 @@ class GroupedQuery:
         """
         return deepcopy(self._to_query()._runs)
 
+    def memory_footprint(self, top: int = 10) -> MemoryFootprint:
+        """Approximate the memory used by the runs in the grouped query, broken down
+        by the IDs, the values of each parameter and metric, and the series of each
+        temporal metric.
+
+        Args:
+            top: Number of largest runs and series to list. Defaults to 10.
+
+        Returns:
+            The memory footprint of the runs, see
+            :func:`~ablate.core.memory.memory_footprint`.
+        """
+        return self._to_query().memory_footprint(top)
+
     def copy(self) -> GroupedQuery:
         """Obtain a shallow copy of the grouped query.
 
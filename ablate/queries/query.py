@@ -1,19 +1,102 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from copy import deepcopy
+from functools import partial
 import hashlib
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Tuple, Union
-
+import math
+from operator import itemgetter
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
+
+from ablate.core.cache import invalidate
+from ablate.core.memory import MemoryFootprint, memory_footprint
+from ablate.core.profiling import profiled
 from ablate.core.types import GroupedRun, Run
 
-from .grouped_query import GroupedQuery
+from .grouped_query import GroupedQuery, _sorted_runs
 
 
 if TYPE_CHECKING:  # pragma: no cover
     from .selectors import AbstractMetric, AbstractParam
 
 
+def _vector_getter(indices: List[int]) -> Callable[..., Tuple[Any, ...]]:
+    if len(indices) > 1:
+        return itemgetter(*indices)
+    return lambda values: tuple(values[i] for i in indices)
+
+
+def _unique_prefixes(digests: List[str], length: int) -> List[str]:
+    # extend the prefixes of colliding digests until all distinct digests differ
+    prefixes = [d[:length] for d in digests]
+    while len(set(prefixes)) < len(set(digests)) and length < len(digests[0]):
+        length += 1
+        counts = Counter(prefixes)
+        prefixes = [
+            d[:length] if counts[p] > 1 else p
+            for p, d in zip(prefixes, digests, strict=True)
+        ]
+    return prefixes
+
+
+_RunData = Tuple[
+    str, Dict[str, Any], Dict[str, float], Dict[str, List[Tuple[int, float]]]
+]
+
+
+def _dump_runs(runs: List[Run]) -> List[_RunData]:
+    # plain tuples pickle much smaller and faster than pydantic models
+    return [(r.id, r.params, r.metrics, r.temporal) for r in runs]
+
+
+def _load_runs(data: List[_RunData]) -> List[Run]:
+    return [
+        Run.model_construct(id=i, params=p, metrics=m, temporal=t)
+        for i, p, m, t in data
+    ]
+
+
+def _map_chunk(fn: bytes, data: List[_RunData]) -> List[_RunData]:
+    map_fn = pickle.loads(fn)
+    return _dump_runs([map_fn(run) for run in _load_runs(data)])
+
+
+def _filter_chunk(fn: bytes, data: List[_RunData]) -> List[bool]:
+    filter_fn = pickle.loads(fn)
+    return [bool(filter_fn(run)) for run in _load_runs(data)]
+
+
+def _parallel(
+    worker: Callable[[bytes, List[_RunData]], List[Any]],
+    fn: Callable[[Run], Any],
+    runs: List[Run],
+    workers: int,
+    chunksize: int | None,
+) -> List[Any]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not runs:
+        return []
+    # pickle the function upfront, as unpicklable functions can stall the pool
+    payload = pickle.dumps(fn)
+    if chunksize is None:
+        # a few chunks per worker balance the load without much overhead
+        chunksize = math.ceil(len(runs) / (workers * 4))
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunksize: {chunksize}. Must be at least 1.")
+    chunks = [
+        _dump_runs(runs[i : i + chunksize]) for i in range(0, len(runs), chunksize)
+    ]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        try:
+            results = executor.map(partial(worker, payload), chunks)
+            return [item for chunk in results for item in chunk]
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
 class Query:
     def __init__(self, runs: List[Run]) -> None:
         """Query interface for manipulating runs in a functional way.
@@ -26,31 +109,69 @@ class Query:
         """
         self._runs = runs
 
-    def filter(self, fn: Callable[[Run], bool]) -> Query:
+    @profiled("query")
+    def filter(
+        self,
+        fn: Callable[[Run], bool],
+        workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> Query:
         """Filter the runs in the query based on a predicate function.
 
         Args:
             fn: Predicate function that takes in a run and returns a boolean value.
+            workers: Optional number of worker processes to evaluate the predicate
+                function in parallel. Requires the function to be picklable, e.g.,
+                defined at the module level. Defaults to None (serial execution).
+            chunksize: Optional number of runs sent to a worker process at once.
+                Defaults to None (four chunks per worker).
 
         Returns:
             A new query with the runs that satisfy the predicate function.
         """
-        return Query([r for r in self._runs[:] if fn(r)])
+        if workers is None or workers <= 1:
+            return Query([r for r in self._runs[:] if fn(r)])
+        mask = _parallel(_filter_chunk, fn, self._runs, workers, chunksize)
+        return Query([r for r, keep in zip(self._runs, mask, strict=True) if keep])
 
-    def map(self, fn: Callable[[Run], Run]) -> Query:
+    @profiled("query")
+    def map(
+        self,
+        fn: Callable[[Run], Run],
+        workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> Query:
         """Apply a function to each run in the query.
 
         This function is intended to be used for modifying the runs in the query. The
         function should return a new run object as the original run is not modified.
 
+        For expensive functions, the runs can be processed by multiple worker
+        processes. The runs are shipped to the workers in chunks, the order of the
+        runs is preserved, and the first error raised by the function is re-raised.
+
         Args:
             fn: Function that takes in a run and returns a new run object.
+            workers: Optional number of worker processes to apply the function in
+                parallel. Requires the function to be picklable, e.g., defined at the
+                module level. Defaults to None (serial execution).
+            chunksize: Optional number of runs sent to a worker process at once.
+                Defaults to None (four chunks per worker).
 
         Returns:
             A new query with the modified runs.
         """
-        return Query([fn(r) for r in deepcopy(self._runs)])
-
+        if workers is None or workers <= 1:
+            runs = [fn(r) for r in deepcopy(self._runs)]
+        else:
+            data = _parallel(_map_chunk, fn, self._runs, workers, chunksize)
+            runs = _load_runs(data)
+        for run in runs:
+            # values memoized while fn modified the run in-place are stale
+            invalidate(run)
+        return Query(runs)
+
+    @profiled("query")
     def sort(self, key: AbstractMetric, ascending: bool = False) -> Query:
         """Sort the runs in the query based on a metric.
 
@@ -62,8 +183,10 @@ class Query:
         Returns:
             A new query with the runs sorted by the specified metric.
         """
-        return Query(sorted(self._runs[:], key=key, reverse=not ascending))
+        (runs,) = _sorted_runs([self._runs], key, not ascending)
+        return Query(runs)
 
+    @profiled("query")
     def project(self, selectors: Union[AbstractParam, List[AbstractParam]]) -> Query:
         """Project the parameter space of the runs in the query to a subset of
         parameters only including the specified selectors.
@@ -89,6 +212,7 @@ class Query:
 
         return Query(projected)
 
+    @profiled("query")
     def groupby(
         self,
         selectors: Union[AbstractParam, List[AbstractParam]],
@@ -121,16 +245,32 @@ class Query:
         ]
         return GroupedQuery(grouped)
 
+    @profiled("query")
     def groupdiff(
         self,
         selectors: Union[AbstractParam, List[AbstractParam]],
+        label: bool = False,
     ) -> GroupedQuery:
         """Group the runs in the query by one or more selectors, excluding the keys.
         This is similar to `groupby` but it excludes the specified keys from the
         grouping key.
 
+        Runs are grouped in a single hashing pass by the vector of their remaining
+        parameter values in a canonical order of the parameter names, independent
+        of the order of the parameters of each run. The value of each group is the
+        shortest prefix of at least 8 characters of the digest of its parameters
+        that is unique among all groups, so different groups never share the same
+        value. Runs whose parameters do not compare equal but share the same
+        representation, e.g., NaN values, which are not equal to themselves, are
+        grouped together.
+
         Args:
             selectors: Selector or list of selectors to exclude from the grouping key.
+            label: Whether to use the parameters differing between the groups as
+                the value of each group instead of the digest, e.g.,
+                "lr=0.01,model=vit". The digest is used if all runs share the same
+                parameters and appended if labels are empty or ambiguous.
+                Defaults to False.
 
         Returns:
             A grouped query containing the grouped runs.
@@ -138,32 +278,66 @@ class Query:
         if not isinstance(selectors, list):
             selectors = [selectors]
 
-        def exclude_keys(
-            d: Dict[str, Any],
-            keys: Set[str],
-        ) -> Tuple[Tuple[str, Any], ...]:
-            return tuple(sorted((k, v) for k, v in d.items() if k not in keys))
-
         exclude_names = {s.name for s in selectors}
-        groups = defaultdict(list)
+        # runs are encoded as the vector of their values in a canonical order of
+        # their parameter names, which is computed once per layout of names
+        layouts: Dict[Tuple[str, ...], Tuple[int, Callable[..., Tuple[Any, ...]]]] = {}
+        names: Dict[Tuple[str, ...], int] = {}
+        groups: Dict[Tuple[int, Tuple[Any, ...]], List[Run]] = {}
         for run in self._runs:
-            key = exclude_keys(run.params, exclude_names)
-            groups[key].append(run)
-
-        def _hash_key(kv: Tuple[Tuple[str, Any], ...]) -> str:
-            raw = ",".join(f"{k}={v}" for k, v in sorted(kv))
-            return hashlib.md5(raw.encode()).hexdigest()[:8]
+            layout = tuple(run.params)
+            if layout not in layouts:
+                order = sorted(range(len(layout)), key=layout.__getitem__)
+                order = [i for i in order if layout[i] not in exclude_names]
+                canonical = tuple(layout[i] for i in order)
+                encoding = names.setdefault(canonical, len(names))
+                layouts[layout] = (encoding, _vector_getter(order))
+            encoding, getter = layouts[layout]
+            key = (encoding, getter(tuple(run.params.values())))
+            if key in groups:
+                groups[key].append(run)
+            else:
+                groups[key] = [run]
+
+        # merge groups with the same parameters that did not compare equal, e.g.,
+        # NaN values, which are not equal to themselves unless they are shared
+        canonical_names = list(names)
+        merged: Dict[str, Tuple[List[Tuple[str, Any]], List[Run]]] = {}
+        for (encoding, vector), runs in groups.items():
+            params = list(zip(canonical_names[encoding], vector, strict=True))
+            digest = hashlib.md5(repr(params).encode()).hexdigest()
+            if digest in merged:
+                merged[digest][1].extend(runs)
+            else:
+                merged[digest] = (params, runs)
+        items = [params for params, _ in merged.values()]
+        values = _unique_prefixes(list(merged), 8)
+        if label and len(groups) > 1:
+            sets = [frozenset(i) for i in items]
+            common = frozenset.intersection(*sets)
+            differing = {k for i in sets for k, _ in i - common}
+            labels = [
+                ",".join(f"{k}={v}" for k, v in i if k in differing) for i in items
+            ]
+            # fall back to the digest for labels that are empty or not unique, e.g.,
+            # if values only differ in their type
+            counts = Counter(labels)
+            values = [
+                text if text and counts[text] == 1 else f"{text}#{digest}".lstrip("#")
+                for text, digest in zip(labels, values, strict=True)
+            ]
 
         grouped = [
             GroupedRun(
                 key="-".join(s.name for s in selectors),
-                value=_hash_key(k),
+                value=value,
                 runs=runs,
             )
-            for k, runs in groups.items()
+            for value, (_, runs) in zip(values, merged.values(), strict=True)
         ]
         return GroupedQuery(grouped)
 
+    @profiled("query")
     def head(self, n: int) -> Query:
         """Get the first n runs in the query.
 
@@ -175,6 +349,7 @@ class Query:
         """
         return Query(self._runs[:n])
 
+    @profiled("query")
     def tail(self, n: int) -> Query:
         """Get the last n runs in the query.
 
@@ -186,6 +361,7 @@ class Query:
         """
         return Query(self._runs[-n:])
 
+    @profiled("query")
     def topk(self, metric: AbstractMetric, k: int) -> Query:
         """Get the top k runs in the query based on a metric.
 
@@ -198,6 +374,7 @@ class Query:
         """
         return self.sort(metric, ascending=metric.direction == "min").head(k)
 
+    @profiled("query")
     def bottomk(self, metric: AbstractMetric, k: int) -> Query:
         """Get the bottom k runs in the query based on a metric.
 
@@ -218,6 +395,20 @@ class Query:
         """
         return deepcopy(self._runs)
 
+    def memory_footprint(self, top: int = 10) -> MemoryFootprint:
+        """Approximate the memory used by the runs in the query, broken down by the
+        IDs, the values of each parameter and metric, and the series of each
+        temporal metric.
+
+        Args:
+            top: Number of largest runs and series to list. Defaults to 10.
+
+        Returns:
+            The memory footprint of the runs, see
+            :func:`~ablate.core.memory.memory_footprint`.
+        """
+        return memory_footprint(self._runs, top)
+
     def copy(self) -> Query:
         """Obtain a shallow copy of the query.
 
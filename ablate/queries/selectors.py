@@ -1,14 +1,50 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import partial
 from operator import eq, ge, gt, le, lt, ne
-from typing import TYPE_CHECKING, Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Tuple
+
+from ablate.core.cache import run_cache
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
     from ablate.core.types import Run
 
 
+def _object_array(values: Iterable[Any], size: int) -> np.ndarray:
+    import numpy as np
+
+    arr = np.empty(size, dtype=object)
+    for i, value in enumerate(values):
+        arr[i] = value
+    return arr
+
+
+# module-level functions keep predicates picklable for worker processes
+def _compare(
+    selector: AbstractSelector,
+    op: Callable[[Any, Any], bool],
+    other: Any,
+    run: Run,
+) -> bool:
+    return op(selector(run), other)
+
+
+def _and(a: Predicate, b: Predicate, run: Run) -> bool:
+    return a(run) and b(run)
+
+
+def _or(a: Predicate, b: Predicate, run: Run) -> bool:
+    return a(run) or b(run)
+
+
+def _not(a: Predicate, run: Run) -> bool:
+    return not a(run)
+
+
 class Predicate:
     def __init__(self, fn: Callable[[Run], bool]) -> None:
         self._fn = fn
@@ -17,13 +53,13 @@ class Predicate:
         return self._fn(run)
 
     def __and__(self, other: Predicate) -> Predicate:
-        return Predicate(lambda run: self(run) and other(run))
+        return Predicate(partial(_and, self, other))
 
     def __or__(self, other: Predicate) -> Predicate:
-        return Predicate(lambda run: self(run) or other(run))
+        return Predicate(partial(_or, self, other))
 
     def __invert__(self) -> Predicate:
-        return Predicate(lambda run: not self(run))
+        return Predicate(partial(_not, self))
 
 
 class AbstractSelector(ABC):
@@ -41,8 +77,22 @@ class AbstractSelector(ABC):
     @abstractmethod
     def __call__(self, run: Run) -> Any: ...
 
+    def evaluate_many(self, runs: List[Run]) -> np.ndarray:
+        """Evaluate the selector on a list of runs at once.
+
+        Subclasses may override this method with a vectorized implementation.
+        By default, the selector is called on each run individually.
+
+        Args:
+            runs: List of runs to evaluate the selector on.
+
+        Returns:
+            An array containing the selected value for each run in order.
+        """
+        return _object_array((self(run) for run in runs), len(runs))
+
     def _cmp(self, op: Callable[[Any, Any], bool], other: Any) -> Predicate:
-        return Predicate(lambda run: op(self(run), other))
+        return Predicate(partial(_compare, self, op, other))
 
     def __eq__(self, other: object) -> Predicate:  # type: ignore[override]
         return self._cmp(eq, other)
@@ -79,6 +129,9 @@ class Id(AbstractParam):
     def __call__(self, run: Run) -> str:
         return run.id
 
+    def evaluate_many(self, runs: List[Run]) -> np.ndarray:
+        return _object_array((run.id for run in runs), len(runs))
+
 
 class Param(AbstractParam):
     """Selector for a specific parameter of the run."""
@@ -86,6 +139,10 @@ class Param(AbstractParam):
     def __call__(self, run: Run) -> int | float | str | None:
         return run.params.get(self.name)
 
+    def evaluate_many(self, runs: List[Run]) -> np.ndarray:
+        name = self.name
+        return _object_array((run.params.get(name) for run in runs), len(runs))
+
 
 class AbstractMetric(AbstractSelector, ABC):
     def __init__(
@@ -119,47 +176,217 @@ class Metric(AbstractMetric):
             return float("-inf") if self.direction == "max" else float("inf")
         return val
 
+    def evaluate_many(self, runs: List[Run]) -> np.ndarray:
+        name = self.name
+        import numpy as np
+
+        missing = float("-inf") if self.direction == "max" else float("inf")
+        values = (run.metrics.get(name) for run in runs)
+        return np.fromiter(
+            (missing if v is None else v for v in values),
+            dtype=np.float64,
+            count=len(runs),
+        )
+
+
+REDUCTIONS = (
+    "min",
+    "max",
+    "first",
+    "last",
+    "mean",
+    "last_k",
+    "argmin",
+    "argmax",
+    "auc",
+)
+# reductions memoized together, the latter also requiring the steps of the series
+_VALUE_REDUCTIONS = ("min", "max", "first", "last", "mean")
+_STEP_REDUCTIONS = ("argmin", "argmax", "auc")
+
+
+def _concat(
+    series: List[List[Tuple[int, float]]],
+    steps: bool,
+) -> Tuple[np.ndarray | None, np.ndarray, np.ndarray, np.ndarray]:
+    import numpy as np
+
+    lengths = np.fromiter(map(len, series), dtype=np.int64, count=len(series))
+    total = int(lengths.sum())
+    values = np.fromiter((v for s in series for _, v in s), np.float64, count=total)
+    xs = None
+    if steps:
+        xs = np.fromiter((x for s in series for x, _ in s), np.float64, count=total)
+    return xs, values, np.cumsum(lengths) - lengths, lengths
+
+
+def _reduce_values(series: List[List[Tuple[int, float]]]) -> Dict[str, np.ndarray]:
+    import numpy as np
+
+    _, values, starts, lengths = _concat(series, steps=False)
+    result = {name: np.full(len(series), np.nan) for name in _VALUE_REDUCTIONS}
+    nonempty = lengths > 0
+    if not nonempty.any():
+        return result
+
+    starts, lengths = starts[nonempty], lengths[nonempty]
+    # fmin and fmax skip NaN values unless all values of a series are NaN
+    result["min"][nonempty] = np.fmin.reduceat(values, starts)
+    result["max"][nonempty] = np.fmax.reduceat(values, starts)
+    result["first"][nonempty] = values[starts]
+    result["last"][nonempty] = values[starts + lengths - 1]
+    result["mean"][nonempty] = np.add.reduceat(values, starts) / lengths
+    return result
+
+
+def _reduce_steps(series: List[List[Tuple[int, float]]]) -> Dict[str, np.ndarray]:
+    import numpy as np
+
+    steps, values, starts, lengths = _concat(series, steps=True)
+    assert steps is not None
+    result = {name: np.full(len(series), np.nan) for name in _STEP_REDUCTIONS}
+    nonempty = lengths > 0
+    if not nonempty.any():
+        return result
+
+    starts, lengths = starts[nonempty], lengths[nonempty]
+    segments = np.repeat(np.arange(len(starts)), lengths)
+    for name, ufunc in (("argmin", np.fmin), ("argmax", np.fmax)):
+        expected = np.repeat(ufunc.reduceat(values, starts), lengths)
+        hits = np.flatnonzero(
+            (values == expected) | (np.isnan(values) & np.isnan(expected))
+        )
+        # the first hit of each series is the step of its first extremum
+        first = np.r_[True, segments[hits][1:] != segments[hits][:-1]]
+        result[name][nonempty] = steps[hits[first]]
+
+    # trapezoids between consecutive points, excluding those across series
+    areas = np.zeros_like(values)
+    areas[1:] = np.diff(steps) * (values[1:] + values[:-1]) / 2
+    areas[starts] = 0.0
+    result["auc"][nonempty] = np.add.reduceat(areas, starts)
+    return result
+
+
+def _reduce_last_k(series: List[List[Tuple[int, float]]], k: int) -> np.ndarray:
+    import numpy as np
+
+    _, values, starts, lengths = _concat(series, steps=False)
+    result = np.full(len(series), np.nan)
+    nonempty = lengths > 0
+    if not nonempty.any():
+        return result
+
+    ends = (starts + lengths)[nonempty]
+    begins = np.maximum(ends - k, starts[nonempty])
+    # sum each window separately, skipping the gaps between windows
+    bounds = np.stack([begins, ends], axis=1).ravel()
+    sums = np.add.reduceat(np.append(values, 0.0), bounds)[::2]
+    result[nonempty] = sums / (ends - begins)
+    return result
+
 
 class TemporalMetric(AbstractMetric):
     def __init__(
         self,
         name: str,
         direction: Literal["min", "max"],
-        reduction: Literal["min", "max", "first", "last"] | None = None,
+        reduction: (
+            Literal[
+                "min",
+                "max",
+                "first",
+                "last",
+                "mean",
+                "last_k",
+                "argmin",
+                "argmax",
+                "auc",
+            ]
+            | None
+        ) = None,
         label: str | None = None,
+        k: int = 10,
     ) -> None:
         """Selector for a specific temporal metric of the run.
 
+        Reductions are memoized per run and computed for many runs at once in a
+        single vectorized pass. The first time "min", "max", "first", "last", or
+        "mean" is computed for a run, the others of these are computed alongside
+        it, and the same holds for "argmin", "argmax", and "auc". Memoized values are
+        dropped when an attribute of the run is reassigned, see
+        :func:`~ablate.core.cache.run_cache`.
+
         Args:
             name: Name of the temporal metric to select on.
             direction: Direction of the metric. "min" for minimization, "max" for
                 maximization.
             reduction: Reduction method to apply to the temporal metric. "min" for
-                minimum, "max" for maximum, "first" for the first value, and "last"
-                for the last value. If None, the direction is used as the reduction.
-                Defaults to None.
+                minimum, "max" for maximum, "first" for the first value, "last"
+                for the last value, "mean" for the mean, "last_k" for the mean of
+                the last `k` values, "argmin" and "argmax" for the step of the first
+                minimum and maximum, and "auc" for the area under the curve using
+                the trapezoidal rule. NaN values are skipped by "min", "max",
+                "argmin", and "argmax" unless all values are NaN, and propagated
+                by the other reductions. If None, the direction is used as the
+                reduction. Defaults to None.
             label: Optional label for displaying purposes. If None, defaults to `name`.
                 Defaults to None.
+            k: Number of last values averaged by the "last_k" reduction.
+                Defaults to 10.
+
+        Raises:
+            ValueError: If an invalid reduction or `k` is provided.
         """
         super().__init__(name, direction, label)
-        if reduction is not None and reduction not in ("min", "max", "first", "last"):
+        if reduction is not None and reduction not in REDUCTIONS:
             raise ValueError(
-                f"Invalid reduction method: '{reduction}'. Must be 'min', 'max', "
-                "'first', or 'last'."
+                f"Invalid reduction method: '{reduction}'. Must be one of "
+                f"{', '.join(repr(r) for r in REDUCTIONS)}."
             )
+        if k < 1:
+            raise ValueError(f"Invalid k: {k}. Must be at least 1.")
         self.reduction = reduction or direction
+        self.k = k
+
+    def _cache_key(self) -> Tuple[Any, ...]:
+        if self.reduction == "last_k":
+            return ("temporal", self.name, "last_k", self.k)
+        if self.reduction in _STEP_REDUCTIONS:
+            return ("temporal", self.name, "steps")
+        return ("temporal", self.name, "values")
 
     def __call__(self, run: Run) -> float:
-        values = run.temporal.get(self.name, [])
-        if not values:
-            return float("nan")
-
-        match self.reduction:
-            case "min":
-                return min(v for _, v in values)
-            case "max":
-                return max(v for _, v in values)
-            case "first":
-                return values[0][1]
-            case "last":
-                return values[-1][1]
+        cached = run_cache(run).get(self._cache_key())
+        if cached is None:
+            return float(self.evaluate_many([run])[0])
+        return cached if self.reduction == "last_k" else cached[self.reduction]
+
+    def evaluate_many(self, runs: List[Run]) -> np.ndarray:
+        import numpy as np
+
+        key = self._cache_key()
+        caches = [run_cache(run) for run in runs]
+        missing = [i for i, cache in enumerate(caches) if key not in cache]
+        if missing:
+            series = [runs[i].temporal.get(self.name, []) for i in missing]
+            if self.reduction == "last_k":
+                reduced = _reduce_last_k(series, self.k).tolist()
+                for i, value in zip(missing, reduced, strict=True):
+                    caches[i][key] = value
+            else:
+                names: Tuple[str, ...] = _VALUE_REDUCTIONS
+                reduce = _reduce_values
+                if self.reduction in _STEP_REDUCTIONS:
+                    names, reduce = _STEP_REDUCTIONS, _reduce_steps
+                reductions = reduce(series)
+                columns = [reductions[name].tolist() for name in names]
+                rows = zip(*columns, strict=True)
+                for i, row in zip(missing, rows, strict=True):
+                    caches[i][key] = dict(zip(names, row, strict=True))
+
+        if self.reduction == "last_k":
+            values: Iterable[float] = (cache[key] for cache in caches)
+        else:
+            values = (cache[key][self.reduction] for cache in caches)
+        return np.fromiter(values, dtype=np.float64, count=len(runs))
@@ -6,7 +6,7 @@ from typing_extensions import Self
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from ablate.blocks import AbstractBlock
+    from ablate.blocks import AbstractBlock, ColumnDependency
     from ablate.core.types import Run
 
 
@@ -41,3 +41,17 @@ class Report:
         r = Report(self.runs)
         r.blocks = self.blocks + [block]
         return r
+
+    def dependencies(self) -> List[ColumnDependency]:
+        """Analyze which selectors the blocks of the report evaluate on which runs.
+
+        Identical selectors of different blocks are merged and their runs combined,
+        allowing exporters to evaluate each selector only once per run and share
+        the values between blocks, see :class:`~ablate.blocks.ColumnStore`.
+
+        Returns:
+            The selectors evaluated by the blocks in the order of their first use.
+        """
+        from ablate.blocks.columns import dependencies
+
+        return dependencies(self)
@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import os
+from pathlib import Path
+import socketserver
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple, cast
+from urllib.parse import parse_qs, urlsplit
+
+from typing_extensions import Self
+
+from ablate import __version__
+from ablate.blocks import BuildCache
+from ablate.sources import AbstractFileSource
+from ablate.spec import apply_query, build_report, build_sources, load_spec
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.types import Run
+    from ablate.sources import AbstractSource
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    "html": "text/html; charset=utf-8",
+    "md": "text/markdown; charset=utf-8",
+    "json": "application/json",
+}
+
+
+class ReportServer:
+    def __init__(
+        self,
+        spec: Dict[str, Any] | str | Path,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        socket: str | Path | None = None,
+        refresh_interval: float | None = 60.0,
+        cache_size: int = 32,
+    ) -> None:
+        """Serve the report of a spec over HTTP, keeping its runs warm in memory.
+
+        The sources of the spec are loaded once and refreshed every
+        `refresh_interval` seconds. File-based sources are refreshed incrementally
+        using :meth:`~ablate.sources.AbstractFileSource.refresh`, so unchanged runs
+        and the values cached for them are kept, while other sources are reloaded.
+        Rendered reports are cached until the runs change, and blocks are built
+        through a build cache shared by all renders of the server. Assets that are
+        no longer referenced by any cached report are pruned after each render.
+
+        The following endpoints are served:
+
+        * ``GET /`` or ``GET /report.html``: The report as a self-contained HTML
+          document, see :class:`~ablate.exporters.HTML`.
+        * ``GET /report.md``: The report as Markdown, with figures served from
+          ``/.ablate/``.
+        * ``GET /runs``: The runs of the report after applying the query of the
+          spec as JSON.
+        * ``POST /query``: The runs after applying the query steps of the JSON
+          request body to the runs of the report, using the format of the query of
+          a spec, see :func:`~ablate.spec.load_spec`.
+        * ``GET /status``: The number of runs, the version of the runs incremented
+          whenever they change, and the time of the last refresh as JSON.
+
+        Reports accept an ``only`` parameter with a comma-separated list of block
+        names or positions to render, e.g., ``/report.html?only=results``.
+
+        Args:
+            spec: The report spec or the path to a YAML or TOML spec file.
+            host: The host to listen on. Defaults to "127.0.0.1".
+            port: The port to listen on. If 0, a free port is chosen.
+                Defaults to 8000.
+            socket: Optional path to a Unix domain socket to listen on instead of
+                `host` and `port`. Defaults to None.
+            refresh_interval: Interval in seconds to refresh the sources in the
+                background. If None, sources are only refreshed by calling
+                :meth:`refresh`. Defaults to 60.0.
+            cache_size: Maximum number of rendered reports to cache.
+                Defaults to 32.
+        """
+        self.spec = spec if isinstance(spec, dict) else load_spec(spec)
+        self.refresh_interval = refresh_interval
+        self.cache_size = cache_size
+        self.version = 0
+
+        self._sources: List[Tuple[AbstractSource, List[Run]]] = [
+            (source, source.load()) for source in build_sources(self.spec)
+        ]
+        self._runs = self._query()
+        self._rendered: OrderedDict[Tuple[Any, ...], bytes] = OrderedDict()
+        self._build_cache = BuildCache()
+        # guards the state read by requests, held only to read or swap it
+        self._lock = threading.Lock()
+        # serialize refreshes and renders without blocking requests for cached
+        # reports, runs, and the status
+        self._refresh_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._dir = tempfile.TemporaryDirectory(prefix="ablate-server-")
+        self.last_refresh = time.time()
+
+        self.socket = Path(socket) if socket is not None else None
+        self._httpd: _TCPHTTPServer | _UnixHTTPServer
+        if self.socket is not None:
+            self._httpd = _UnixHTTPServer(str(self.socket), _Handler)
+        else:
+            self._httpd = _TCPHTTPServer((host, port), _Handler)
+        self._httpd.report_server = self
+
+    @property
+    def address(self) -> str:
+        """The address the server listens on, either an HTTP URL or the path to
+        the Unix domain socket."""
+        if isinstance(self._httpd, _UnixHTTPServer):
+            return str(self.socket)
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host.decode() if isinstance(host, bytes) else host}:{port}"
+
+    @property
+    def runs(self) -> List[Run]:
+        """The runs of the report after applying the query of the spec."""
+        return self._runs
+
+    def _query(
+        self,
+        sources: List[Tuple[AbstractSource, List[Run]]] | None = None,
+    ) -> List[Run]:
+        sources = self._sources if sources is None else sources
+        runs = [run for _, source_runs in sources for run in source_runs]
+        return apply_query(runs, self.spec.get("query", []))
+
+    def refresh(self) -> bool:
+        """Refresh the sources and invalidate the rendered reports if runs changed.
+
+        The sources are reloaded while the previous runs and reports keep being
+        served, and the new runs are swapped in once they are loaded.
+
+        Returns:
+            Whether any runs changed.
+        """
+        with self._refresh_lock:
+            changed = False
+            sources = []
+            for source, runs in self._sources:
+                if isinstance(source, AbstractFileSource):
+                    changes = source.refresh()
+                    if changes:
+                        runs = changes.apply(runs)
+                        changed = True
+                else:
+                    reloaded = source.load()
+                    changed = changed or reloaded != runs
+                    runs = reloaded
+                sources.append((source, runs))
+            queried = self._query(sources) if changed else self._runs
+
+            with self._lock:
+                self._sources = sources
+                self.last_refresh = time.time()
+                if changed:
+                    self._runs = queried
+                    self._rendered.clear()
+                    self.version += 1
+            return changed
+
+    def render(self, format: str, only: List[str] | None = None) -> bytes:
+        """Render the report, reusing a previous rendering if the runs are
+        unchanged.
+
+        Args:
+            format: The format of the report, either "html" or "md".
+            only: Names or positions starting at 1 of the blocks to render. If None,
+                all blocks are rendered. Defaults to None.
+
+        Raises:
+            ValueError: If the format is not supported or a block does not exist.
+
+        Returns:
+            The rendered report.
+        """
+        from ablate.exporters import HTML, Markdown
+
+        if format not in ("html", "md"):
+            raise ValueError(f"Unsupported report format: '{format}'.")
+        key = (format, tuple(only) if only is not None else None)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        with self._render_lock:
+            # another request may have rendered the report while waiting
+            cached = self._cached(key)
+            if cached is not None:
+                return cached
+            with self._lock:
+                runs, version = self._runs, self.version
+
+            report = build_report(self.spec, runs, only)
+            output = self._output_path(key)
+            cls = HTML if format == "html" else Markdown
+            exporter = cls(str(output), str(self._assets_dir))
+            exporter.build_cache = self._build_cache
+            exporter.export(report)
+            rendered = output.read_bytes()
+
+            with self._lock:
+                # discard reports of runs replaced by a refresh while rendering
+                if version == self.version:
+                    self._rendered[key] = rendered
+                    if len(self._rendered) > self.cache_size:
+                        self._rendered.popitem(last=False)
+                live = {self._output_path(k) for k in self._rendered}
+            self._prune(live)
+            return rendered
+
+    @property
+    def _assets_dir(self) -> Path:
+        return Path(self._dir.name) / ".ablate"
+
+    def _output_path(self, key: Tuple[Any, ...]) -> Path:
+        # each cached report keeps its own output file and manifest of its assets
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()[:12]
+        return Path(self._dir.name) / f"report-{digest}.{key[0]}"
+
+    def _prune(self, live: Set[Path]) -> None:
+        from ablate.exporters.assets import prune_assets
+
+        # removing the outputs of reports no longer cached releases their manifests,
+        # so assets only referenced by them are pruned
+        for path in Path(self._dir.name).glob("report-*"):
+            if path not in live:
+                path.unlink(missing_ok=True)
+        prune_assets(self._assets_dir)
+
+    def _cached(self, key: Tuple[Any, ...]) -> bytes | None:
+        with self._lock:
+            if key not in self._rendered:
+                return None
+            self._rendered.move_to_end(key)
+            return self._rendered[key]
+
+    def asset(self, name: str) -> bytes | None:
+        """Read a rendered asset such as a figure.
+
+        Args:
+            name: The file name of the asset.
+
+        Returns:
+            The content of the asset or None if it does not exist.
+        """
+        path = self._assets_dir / os.path.basename(name)
+        if name.startswith(".") or not path.is_file():
+            return None
+        return path.read_bytes()
+
+    def start(self) -> None:
+        """Start serving and refreshing in background threads."""
+        self._start_refreshing()
+        thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted, refreshing the sources in the background."""
+        self._start_refreshing()
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:  # pragma: no cover
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop serving and refreshing and remove all temporary files."""
+        self._stop.set()
+        if any(t.is_alive() for t in self._threads):
+            self._httpd.shutdown()
+        self._httpd.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        if self.socket is not None:
+            self.socket.unlink(missing_ok=True)
+        self._dir.cleanup()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown()
+
+    def _start_refreshing(self) -> None:
+        if self.refresh_interval is None:
+            return
+        interval = self.refresh_interval
+
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    # keep serving the previous runs and retry at the next interval
+                    logger.exception("Failed to refresh the sources.")
+
+        thread = threading.Thread(target=loop, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+
+class _TCPHTTPServer(ThreadingHTTPServer):
+    report_server: ReportServer
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    report_server: ReportServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = f"ablate/{__version__}"
+
+    def address_string(self) -> str:
+        # clients of unix domain sockets have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    @property
+    def report_server(self) -> ReportServer:
+        server = cast("_TCPHTTPServer | _UnixHTTPServer", self.server)
+        return server.report_server
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        only = params["only"][0].split(",") if "only" in params else None
+        server = self.report_server
+        try:
+            if url.path in ("/", "/report.html"):
+                self._send(server.render("html", only), "html")
+            elif url.path == "/report.md":
+                self._send(server.render("md", only), "md")
+            elif url.path == "/runs":
+                self._send_runs(server.runs)
+            elif url.path == "/status":
+                status = {
+                    "runs": len(server.runs),
+                    "version": server.version,
+                    "last_refresh": server.last_refresh,
+                }
+                self._send(json.dumps(status).encode(), "json")
+            elif url.path.startswith("/.ablate/"):
+                asset = server.asset(url.path.removeprefix("/.ablate/"))
+                if asset is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                self._send(asset, Path(url.path).suffix.lstrip("."))
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+        except ValueError as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception as e:
+            logger.exception("Failed to handle request '%s'.", self.path)
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def do_POST(self) -> None:  # noqa: N802
+        if urlsplit(self.path).path != "/query":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            steps = json.loads(self.rfile.read(length) or b"[]")
+            self._send_runs(apply_query(self.report_server.runs, steps))
+        except ValueError as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(e))
+        except TypeError as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, f"Invalid query: {e}")
+        except Exception as e:
+            logger.exception("Failed to handle request '%s'.", self.path)
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def _send_runs(self, runs: List[Run]) -> None:
+        data = "[" + ",".join(run.model_dump_json() for run in runs) + "]"
+        self._send(data.encode(), "json")
+
+    def _send(self, body: bytes, kind: str) -> None:
+        self.send_response(HTTPStatus.OK)
+        content_type = CONTENT_TYPES.get(kind, f"image/{kind}")
+        if kind == "svg":
+            content_type = "image/svg+xml"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(
+    spec: Dict[str, Any] | str | Path,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket: str | Path | None = None,
+    refresh_interval: float | None = 60.0,
+) -> None:
+    """Serve the report of a spec until interrupted, see :class:`ReportServer`.
+
+    Args:
+        spec: The report spec or the path to a YAML or TOML spec file.
+        host: The host to listen on. Defaults to "127.0.0.1".
+        port: The port to listen on. Defaults to 8000.
+        socket: Optional path to a Unix domain socket to listen on instead of
+            `host` and `port`. Defaults to None.
+        refresh_interval: Interval in seconds to refresh the sources in the
+            background. If None, sources are never refreshed. Defaults to 60.0.
+    """
+    ReportServer(spec, host, port, socket, refresh_interval).serve_forever()
@@ -1,3 +1,4 @@
+from .abstract_file_source import AbstractFileSource
 from .abstract_source import AbstractSource
 from .autrainer_source import Autrainer
 from .clearml_source import ClearML
@@ -8,6 +9,7 @@ from .wandb_source import WandB
 
 
 __all__ = [
+    "AbstractFileSource",
     "AbstractSource",
     "Autrainer",
     "ClearML",
@@ -0,0 +1,253 @@
+from abc import ABC, abstractmethod
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, Generator, Iterable, List, Set, Tuple
+
+from ablate.core.types import ChangeSet, Run
+
+from .abstract_source import AbstractSource
+
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def directory_signature(path: Path) -> Signature:
+    """Compute a cheap signature of a directory based on the relative paths,
+    modification times, and sizes of all files it contains.
+
+    Args:
+        path: The directory to compute the signature for.
+
+    Returns:
+        A sorted tuple of (relative path, mtime in ns, size) for each file.
+    """
+    entries: List[Tuple[str, int, int]] = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                        continue
+                    st = entry.stat()
+                    rel = os.path.relpath(entry.path, path)
+                    entries.append((rel, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            continue
+    return tuple(sorted(entries))
+
+
+class AbstractFileSource(AbstractSource, ABC):
+    def __init__(self, roots: List[Path]) -> None:
+        """Abstract source for loading runs from run directories on disk.
+
+        File-based sources keep a signature of each run directory, allowing them to
+        be refreshed incrementally using :meth:`refresh` or :meth:`watch` instead of
+        re-parsing every run directory.
+
+        Args:
+            roots: The root directories containing the run directories.
+        """
+        self._roots = roots
+        self._snapshot: Dict[Path, Signature] = {}
+        self._ids: Dict[Path, str] = {}
+        self.failed: Dict[Path, Exception] = {}
+        """Run directories that failed to load during the last refresh."""
+
+    @abstractmethod
+    def _run_paths(self) -> List[Path]:
+        """Discover all run directories of the source.
+
+        Returns:
+            A list of paths to run directories.
+        """
+
+    @abstractmethod
+    def _load_run(self, path: Path) -> Run:
+        """Load a single run from a run directory.
+
+        Args:
+            path: The path to the run directory.
+
+        Returns:
+            The loaded run.
+        """
+
+    def load(self) -> List[Run]:
+        runs = []
+        self._snapshot.clear()
+        self._ids.clear()
+        self.failed.clear()
+        for path in self._run_paths():
+            signature = directory_signature(path)
+            runs.append(self._track(path, signature, self._load_run(path)))
+        return runs
+
+    def _track(self, path: Path, signature: Signature, run: Run) -> Run:
+        # only commit the signature once the run is loaded, so that runs failing to
+        # load are retried by the next refresh
+        self._snapshot[path] = signature
+        self._ids[path] = run.id
+        return run
+
+    def _try_track(self, path: Path) -> Run | None:
+        # the signature is taken before loading, so that files written while the run
+        # is loaded are detected by the next refresh
+        signature = directory_signature(path)
+        try:
+            run = self._load_run(path)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to load run directory '%s': %s", path, e)
+            self.failed[path] = e
+            return None
+        return self._track(path, signature, run)
+
+    def refresh(self, dirty: Iterable[Path] | None = None) -> ChangeSet:
+        """Detect and load runs that were added, updated, or removed since the last
+        call to :meth:`load` or :meth:`refresh`.
+
+        Run directories that fail to load, e.g., because they are still being
+        written, are skipped and collected in :attr:`failed`. They are retried by
+        the next refresh, and updated runs failing to load keep their previous
+        version until then.
+
+        Args:
+            dirty: Optional paths known to have changed. If provided, only run
+                directories containing these paths are checked for updates, while new
+                and removed run directories are always detected. If None, all run
+                directories are checked. Defaults to None.
+
+        Returns:
+            The changes since the last load or refresh.
+        """
+        paths = self._run_paths()
+        current = set(paths)
+        candidates = self._owners(dirty) if dirty is not None else current
+
+        self.failed.clear()
+        added: List[Run] = []
+        updated: List[Run] = []
+        for path in paths:
+            if path not in self._snapshot:
+                run = self._try_track(path)
+                if run is not None:
+                    added.append(run)
+            elif path in candidates:
+                if directory_signature(path) == self._snapshot[path]:
+                    continue
+                run = self._try_track(path)
+                if run is not None:
+                    updated.append(run)
+
+        removed = []
+        for path in [p for p in self._snapshot if p not in current]:
+            del self._snapshot[path]
+            removed.append(self._ids.pop(path))
+
+        return ChangeSet(
+            added=self._intern(added),
+            updated=self._intern(updated),
+            removed=removed,
+        )
+
+    def _owners(self, dirty: Iterable[Path]) -> Set[Path]:
+        owners = set()
+        for path in dirty:
+            for candidate in (path, *path.parents):
+                if candidate in self._snapshot:
+                    owners.add(candidate)
+                    break
+        return owners
+
+    def watch(
+        self,
+        interval: float = 1.0,
+        use_watchdog: bool = True,
+    ) -> Generator[ChangeSet, None, None]:
+        """Watch the source for changes and yield incremental change sets.
+
+        If `watchdog` is installed, file system events are used to wake up and only
+        run directories with events are checked for updates. Otherwise, the run
+        directories are polled every `interval` seconds. Only non-empty change sets
+        are yielded. Changes that happened between the last load or refresh and the
+        start of watching are yielded first.
+
+        Args:
+            interval: Polling interval in seconds. Defaults to 1.0.
+            use_watchdog: Whether to use `watchdog` for file system events if it is
+                installed. Defaults to True.
+
+        Yields:
+            Change sets that can be applied to the runs using
+            :meth:`~ablate.core.types.ChangeSet.apply`.
+        """
+        started = self._start_observer() if use_watchdog else None
+        try:
+            changes = self.refresh()
+            if changes:
+                yield changes
+            while True:
+                if started is None:
+                    time.sleep(interval)
+                    changes = self.refresh()
+                else:
+                    started[0].wait(interval)
+                    changes = self.refresh(started[0].collect())
+                if changes:
+                    yield changes
+        finally:
+            if started is not None:
+                started[1].stop()
+                started[1].join()
+
+    def _start_observer(self) -> Tuple["_EventCollector", Any] | None:
+        try:
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+
+        handler = _EventCollector()
+        observer = Observer()
+        for root in self._roots:
+            observer.schedule(handler.handler, str(root), recursive=True)
+        observer.start()
+        return handler, observer
+
+
+class _EventCollector:
+    def __init__(self) -> None:
+        from watchdog.events import FileSystemEvent, FileSystemEventHandler
+
+        self._paths: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        collector = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event: FileSystemEvent) -> None:
+                collector.add(event.src_path, getattr(event, "dest_path", ""))
+
+        self.handler = Handler()
+
+    def add(self, *paths: str | bytes) -> None:
+        with self._lock:
+            for p in paths:
+                if p:
+                    self._paths.add(Path(os.fsdecode(p)))
+        self._event.set()
+
+    def wait(self, timeout: float) -> None:
+        self._event.wait(timeout)
+
+    def collect(self) -> Set[Path]:
+        with self._lock:
+            paths, self._paths = self._paths, set()
+            self._event.clear()
+        return paths
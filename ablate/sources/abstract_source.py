@@ -1,10 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import List
+from functools import wraps
+from typing import Any, Callable, List
 
+from ablate.core import profiling
+from ablate.core.interning import ParamTable
 from ablate.core.types import Run
 
 
 class AbstractSource(ABC):
+    intern_params: bool = True
+    """Whether to intern the names and values of the parameters of loaded runs
+    using the :attr:`param_table` of the source, so runs share a single object per
+    distinct name and value, see :class:`~ablate.core.interning.ParamTable`."""
+
+    _param_table: ParamTable | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "load" in vars(cls):
+            cls.load = _wrap_load(cls.load)  # type: ignore[assignment,method-assign]
+
+    @property
+    def param_table(self) -> ParamTable:
+        """The table of parameter names and values shared by all runs loaded from
+        the source."""
+        if self._param_table is None:
+            self._param_table = ParamTable()
+        return self._param_table
+
+    def _intern(self, runs: List[Run]) -> List[Run]:
+        if not self.intern_params:
+            return runs
+        return self.param_table.intern_runs(runs)
+
     @abstractmethod
     def load(self) -> List[Run]:
         """Load the data from the source.
@@ -12,3 +40,16 @@ class AbstractSource(ABC):
         Returns:
             A list of runs with their parameters, metrics, and optionally temporal data.
         """
+
+
+def _wrap_load(fn: Callable[[Any], List[Run]]) -> Callable[[Any], List[Run]]:
+    @wraps(fn)
+    def load(self: AbstractSource) -> List[Run]:
+        if profiling.active_profile() is None:
+            return self._intern(fn(self))
+        with profiling.span("load", type(self).__name__) as span:
+            runs = self._intern(fn(self))
+            span.runs = span.rows = len(runs)
+        return runs
+
+    return load
@@ -1,12 +1,11 @@
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Union
 
-import pandas as pd
 import yaml
 
 from ablate.core.types import Run
 
-from .abstract_source import AbstractSource
+from .abstract_file_source import AbstractFileSource
 
 
 def extract_metric_values(metrics: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
@@ -35,7 +34,7 @@ def flatten_autrainer_config(
         yield prefix.rstrip("."), config
 
 
-class Autrainer(AbstractSource):
+class Autrainer(AbstractFileSource):
     def __init__(self, results_dir: str, experiment_id: str) -> None:
         """Autrainer source for loading runs from an autrainer experiment.
 
@@ -58,8 +57,11 @@ class Autrainer(AbstractSource):
                 "No autrainer experiment found with ID "
                 f"'{experiment_id}' in directory '{results_dir}'."
             )
+        super().__init__([self._location])
 
     def _load_run(self, path: Path) -> Run:
+        import pandas as pd
+
         run_id = path.name
 
         with open(path / ".hydra" / "config.yaml") as f:
@@ -80,10 +82,5 @@ class Autrainer(AbstractSource):
 
         return Run(id=run_id, params=params, metrics=metrics, temporal=temporal)
 
-    def load(self) -> List[Run]:
-        runs = []
-        for p in Path(self._location).iterdir():
-            if not p.is_dir():
-                continue
-            runs.append(self._load_run(p))
-        return runs
+    def _run_paths(self) -> List[Path]:
+        return [p for p in self._location.iterdir() if p.is_dir()]
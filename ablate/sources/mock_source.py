@@ -1,8 +1,6 @@
 import itertools
 from typing import Dict, List
 
-import numpy as np
-
 from ablate.core.types import Run
 
 from .abstract_source import AbstractSource
@@ -35,6 +33,8 @@ class Mock(AbstractSource):
         param_dict: Dict[str, str | int | float | bool],
         idx: int,
     ) -> List[Run]:
+        import numpy as np
+
         runs: List[Run] = []
         for local_seed in range(self.num_seeds):
             global_seed = idx * self.num_seeds + local_seed
@@ -1,12 +1,12 @@
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from ablate.core.types import Run
 
-from .abstract_source import AbstractSource
+from .abstract_file_source import AbstractFileSource
 
 
-class TensorBoard(AbstractSource):
+class TensorBoard(AbstractFileSource):
     def __init__(self, logdirs: str | List[str]) -> None:
         """TensorBoard source for loading runs from event logs.
 
@@ -26,33 +26,33 @@ class TensorBoard(AbstractSource):
         self.logdirs = (
             [Path(logdirs)] if isinstance(logdirs, str) else [Path(p) for p in logdirs]
         )
+        super().__init__(self.logdirs)
 
-    def load(self) -> List[Run]:
+    def _run_paths(self) -> List[Path]:
+        paths: Dict[Path, None] = {}
+        for logdir in self.logdirs:
+            for path in logdir.glob("**/events.out.tfevents.*"):
+                paths[path.parent] = None
+        return list(paths)
+
+    def _load_run(self, path: Path) -> Run:
         from tensorboard.backend.event_processing.event_accumulator import (
             EventAccumulator,
         )
 
-        records: List[Run] = []
-
-        for logdir in self.logdirs:
-            for path in logdir.glob("**/events.out.tfevents.*"):
-                ea = EventAccumulator(str(path.parent))
-                ea.Reload()
-
-                metrics = {}
-                temporal = {}
+        ea = EventAccumulator(str(path))
+        ea.Reload()
 
-                for tag in ea.Tags().get("scalars", []):
-                    scalar_events = ea.Scalars(tag)
-                    if scalar_events:
-                        last_value = scalar_events[-1].value
-                        metrics[tag] = last_value
-                        temporal[tag] = [(e.step, e.value) for e in scalar_events]
+        metrics = {}
+        temporal = {}
 
-                run_id = path.parent.name  # use folder name as ID
+        for tag in ea.Tags().get("scalars", []):
+            scalar_events = ea.Scalars(tag)
+            if scalar_events:
+                last_value = scalar_events[-1].value
+                metrics[tag] = last_value
+                temporal[tag] = [(e.step, e.value) for e in scalar_events]
 
-                records.append(
-                    Run(id=run_id, params={}, metrics=metrics, temporal=temporal)
-                )
+        run_id = path.name  # use folder name as ID
 
-        return records
+        return Run(id=run_id, params={}, metrics=metrics, temporal=temporal)
@@ -1,7 +1,5 @@
 from typing import List
 
-import pandas as pd
-
 from ablate.core.types import Run
 
 from .abstract_source import AbstractSource
@@ -32,6 +30,8 @@ class WandB(AbstractSource):
         self.api = wandb.Api()
 
     def load(self) -> List[Run]:
+        import pandas as pd
+
         runs = self.api.runs(f"{self.entity}/{self.project}")
         records = []
         for r in runs:
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from importlib import import_module
+import inspect
+from operator import eq, ge, gt, le, lt, ne
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.blocks import AbstractBlock
+    from ablate.core.types import Run
+    from ablate.exporters import AbstractExporter
+    from ablate.queries.selectors import AbstractSelector, Predicate
+    from ablate.report import Report
+    from ablate.sources import AbstractSource
+
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "eq": eq,
+    "ne": ne,
+    "lt": lt,
+    "le": le,
+    "gt": gt,
+    "ge": ge,
+}
+
+QUERY_METHODS = {
+    "filter",
+    "sort",
+    "project",
+    "groupby",
+    "groupdiff",
+    "head",
+    "tail",
+    "topk",
+    "bottomk",
+    "aggregate",
+}
+
+
+def load_spec(path: str | Path) -> Dict[str, Any]:
+    """Load a report spec from a YAML or TOML file.
+
+    A spec describes the sources to load runs from, an optional query applied to
+    all runs, the blocks of the report, and the exporters of the report:
+
+    .. code-block:: yaml
+
+        sources:
+          - type: Mock
+            grid: {model: [resnet, vgg], lr: [0.1, 0.01]}
+            num_seeds: 2
+        query:
+          - filter: {selector: {type: Param, name: lr}, eq: "0.1"}
+          - topk: {metric: {type: Metric, name: accuracy, direction: max}, k: 5}
+        blocks:
+          - type: H1
+            text: Results
+          - type: Table
+            name: results
+            columns:
+              - {type: Param, name: model}
+              - {type: Metric, name: accuracy, direction: max}
+        exporter:
+          type: Markdown
+          output_path: report.md
+
+    Sources, blocks, exporters, and selectors are given by the name of their class
+    in :mod:`ablate.sources`, :mod:`ablate.blocks`, :mod:`ablate.exporters`, and
+    :mod:`ablate.queries` and the arguments of their constructor. Queries are lists
+    of single-key mappings from a method of :class:`~ablate.queries.Query` or
+    :class:`~ablate.queries.GroupedQuery` to its arguments, given as a mapping, a
+    list, or a single value. Filters are given as conditions of a selector using
+    the operators "eq", "ne", "lt", "le", "gt", "ge", and "in", and lists of
+    conditions are combined. Blocks may specify a `name` to be selected by and a
+    `query` to apply to the runs of the report for the block.
+
+    Args:
+        path: The path to the spec file with a ".yaml", ".yml", or ".toml" suffix.
+
+    Raises:
+        ValueError: If the file format is not supported or the spec is invalid.
+
+    Returns:
+        The spec.
+    """
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        with open(path, encoding="utf-8") as f:
+            try:
+                spec = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid spec at '{path}': {e}") from e
+    elif path.suffix == ".toml":
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:  # pragma: no cover
+            import tomli as tomllib
+
+        with open(path, "rb") as f:
+            try:
+                spec = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"Invalid spec at '{path}': {e}") from e
+    else:
+        raise ValueError(
+            f"Unsupported spec format: '{path.suffix}'. "
+            "Must be '.yaml', '.yml', or '.toml'."
+        )
+    if not isinstance(spec, dict):
+        raise ValueError(f"Invalid spec: '{path}' must contain a mapping.")
+    for key in ("sources", "blocks", "exporter"):
+        if key not in spec:
+            raise ValueError(f"Invalid spec: missing '{key}'.")
+    return spec
+
+
+def build_object(spec: Dict[str, Any], module: str) -> Any:
+    """Build an object from its spec.
+
+    Nested specs in the arguments are built as selectors of
+    :mod:`ablate.queries`.
+
+    Args:
+        spec: The spec of the object, consisting of the name of its class as `type`
+            and the arguments of its constructor.
+        module: The module to look up the class in.
+
+    Raises:
+        ValueError: If the class does not exist in the module or does not accept
+            the arguments.
+
+    Returns:
+        The built object.
+    """
+    kwargs = dict(spec)
+    cls = _resolve(kwargs.pop("type", None), module)
+    args = {k: _build_value(v) for k, v in kwargs.items()}
+    try:
+        return cls(**args)
+    except TypeError as e:
+        raise ValueError(f"Invalid spec at '{module}.{cls.__name__}': {e}") from e
+
+
+def _resolve(name: Any, module: str) -> type:
+    cls = getattr(import_module(module), str(name), None)
+    if not inspect.isclass(cls) or inspect.isabstract(cls):
+        raise ValueError(f"Invalid spec: unknown type '{name}' in '{module}'.")
+    return cls
+
+
+def _build_value(value: Any) -> Any:
+    if isinstance(value, dict) and "type" in value:
+        return build_object(value, "ablate.queries")
+    if isinstance(value, list):
+        return [_build_value(v) for v in value]
+    return value
+
+
+def build_condition(spec: Dict[str, Any] | List[Dict[str, Any]]) -> Predicate:
+    """Build a predicate from one or more conditions.
+
+    Args:
+        spec: A condition consisting of a selector spec as `selector` and one or
+            more operators mapped to the value to compare to, or a list of
+            conditions that all need to be satisfied.
+
+    Raises:
+        ValueError: If a condition is invalid.
+
+    Returns:
+        The predicate.
+    """
+    from ablate.queries.selectors import Predicate
+
+    conditions = spec if isinstance(spec, list) else [spec]
+    predicates: List[Predicate] = []
+    for condition in conditions:
+        ops = dict(condition)
+        if "selector" not in ops:
+            raise ValueError("Invalid spec: filter conditions require a 'selector'.")
+        selector = build_object(ops.pop("selector"), "ablate.queries")
+        if not ops or not ops.keys() <= {*OPERATORS, "in"}:
+            raise ValueError(
+                f"Invalid spec: filter operators must be one of {[*OPERATORS, 'in']}."
+            )
+        for op, other in ops.items():
+            if op == "in":
+                predicates.append(Predicate(_contained_in(selector, other)))
+            else:
+                predicates.append(OPERATORS[op](selector, other))
+
+    def predicate(run: Run) -> bool:
+        return all(p(run) for p in predicates)
+
+    return Predicate(predicate)
+
+
+def _contained_in(
+    selector: AbstractSelector, values: List[Any]
+) -> Callable[[Run], bool]:
+    return lambda run: selector(run) in values
+
+
+def apply_query(
+    runs: List[Run],
+    steps: List[Dict[str, Any]] | Dict[str, Any],
+) -> List[Run]:
+    """Apply the steps of a query spec to a list of runs.
+
+    Args:
+        runs: The runs to query.
+        steps: The steps of the query, each a single-key mapping from the name of
+            the method to its arguments, or a single step.
+
+    Raises:
+        ValueError: If a step is invalid.
+
+    Returns:
+        The resulting runs. Grouped queries are flattened.
+    """
+    from ablate.queries import Query
+
+    query: Any = Query(runs)
+    for step in _as_list(steps):
+        if not isinstance(step, dict) or len(step) != 1:
+            raise ValueError(
+                f"Invalid spec: query steps must be single-key mappings, got {step!r}."
+            )
+        ((name, args),) = step.items()
+        method = getattr(query, name, None) if name in QUERY_METHODS else None
+        if method is None or (name == "filter" and not isinstance(query, Query)):
+            raise ValueError(
+                f"Invalid spec: unsupported method '{name}' of {type(query).__name__}."
+            )
+        if name == "filter":
+            query = query.filter(build_condition(args))
+            continue
+        if isinstance(args, dict) and "type" not in args:
+            query = method(**{k: _build_value(v) for k, v in args.items()})
+        elif isinstance(args, list):
+            query = method(*(_build_value(v) for v in args))
+        else:
+            query = method(_build_value(args))
+    return query.all()
+
+
+def build_sources(spec: Dict[str, Any]) -> List[AbstractSource]:
+    """Build the sources of a spec.
+
+    Args:
+        spec: The report spec.
+
+    Returns:
+        The sources.
+    """
+    return [build_object(s, "ablate.sources") for s in _as_list(spec["sources"])]
+
+
+def load_runs(spec: Dict[str, Any]) -> List[Run]:
+    """Load the runs of all sources of a spec and apply its query.
+
+    Args:
+        spec: The report spec.
+
+    Returns:
+        The loaded and queried runs.
+    """
+    runs: List[Run] = []
+    for source in build_sources(spec):
+        runs.extend(source.load())
+    return apply_query(runs, spec.get("query", []))
+
+
+def build_report(
+    spec: Dict[str, Any],
+    runs: List[Run],
+    only: List[str] | None = None,
+) -> Report:
+    """Build the report of a spec.
+
+    Args:
+        spec: The report spec.
+        runs: The runs of the report.
+        only: Names or positions starting at 1 of the blocks to include. If None,
+            all blocks are included. Defaults to None.
+
+    Raises:
+        ValueError: If a selected block does not exist.
+
+    Returns:
+        The report.
+    """
+    from ablate.report import Report
+
+    selected = set(only or [])
+    blocks: List[AbstractBlock] = []
+    for i, block_spec in enumerate(_as_list(spec["blocks"]), start=1):
+        block_spec = dict(block_spec)
+        name = block_spec.pop("name", None)
+        query = block_spec.pop("query", None)
+        if only is not None and not selected & {str(i), name}:
+            continue
+        selected -= {str(i), name}
+        if query is not None:
+            block_spec["runs"] = apply_query(runs, query)
+        blocks.append(build_object(block_spec, "ablate.blocks"))
+    if selected:
+        raise ValueError(f"Unknown blocks: {', '.join(sorted(selected))}.")
+    return Report(runs).add(*blocks)
+
+
+def build_exporters(
+    spec: Dict[str, Any],
+    **overrides: Any,
+) -> List[AbstractExporter]:
+    """Build the exporters of a spec.
+
+    Args:
+        spec: The report spec.
+        **overrides: Arguments overriding the arguments of all exporters.
+
+    Raises:
+        ValueError: If an exporter does not support an overridden argument.
+
+    Returns:
+        The exporters.
+    """
+    exporters = []
+    for exporter_spec in _as_list(spec["exporter"]):
+        exporter_spec = {**exporter_spec, **overrides}
+        cls = _resolve(exporter_spec.get("type"), "ablate.exporters")
+        unsupported = overrides.keys() - inspect.signature(cls).parameters.keys()
+        if unsupported:
+            raise ValueError(
+                f"Exporter '{exporter_spec['type']}' does not support "
+                f"{', '.join(sorted(unsupported))}."
+            )
+        exporters.append(build_object(exporter_spec, "ablate.exporters"))
+    return exporters
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
@@ -0,0 +1,97 @@
+import argparse
+import json
+import platform
+import sys
+from typing import List
+
+import ablate
+
+from .suite import BENCHMARKS, DEFAULT_SCALES, SCALES, compare, run_import, run_scale
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark queries, sources, and exporters of ablate at "
+        "different scales of runs and steps generated by the Mock source.",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=list(SCALES),
+        default=DEFAULT_SCALES,
+        help="Scales to run. Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[b.name for b in BENCHMARKS] + ["import"],
+        help="Only run the given benchmarks.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timed calls per benchmark. Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip measuring the peak allocated memory.",
+    )
+    parser.add_argument("-o", "--output", help="Path to save the results as JSON.")
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="Path to the JSON results of a baseline to compare against.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown flagged as a regression. Defaults to %(default)s.",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.only is None or "import" in args.only:
+        results.update(run_import())
+    for scale in args.scales:
+        only = None if args.only is None else [n for n in args.only if n != "import"]
+        if only == []:
+            break
+        print(f"# {scale}: {SCALES[scale].runs} runs, {SCALES[scale].steps} steps")
+        results.update(
+            run_scale(scale, args.repeat, not args.no_memory, only=only),
+        )
+
+    if args.output:
+        data = {
+            "meta": {
+                "ablate": ablate.__version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    lines, regressions = compare(baseline, results, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Tuple
+
+from ablate.blocks import H1, MetricPlot, Table
+from ablate.core.formatting import format_time
+from ablate.exporters import Markdown
+from ablate.exporters.utils import hash_dataframe
+from ablate.queries import Metric, Param, Query, TemporalMetric
+from ablate.report import Report
+from ablate.sources import Mock
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ablate.core.types import Run
+
+
+class Scale(NamedTuple):
+    runs: int
+    steps: int
+
+
+SCALES: Dict[str, Scale] = {
+    "1k": Scale(runs=1_000, steps=100),
+    "100k": Scale(runs=100_000, steps=10),
+    "1m": Scale(runs=1_000_000, steps=1),
+    "steps-10k": Scale(runs=20, steps=10_000),
+    "steps-100k": Scale(runs=20, steps=100_000),
+}
+"""Benchmark scales by number of runs and number of steps of temporal metrics.
+Large numbers of runs are combined with few steps and vice versa to keep the
+memory footprint of the generated runs manageable."""
+
+DEFAULT_SCALES = ["1k", "steps-10k"]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    unit: str
+    setup: Callable[[Mock, List[Run]], Tuple[Any, ...]]
+    fn: Callable[..., Any]
+    size: Callable[[List[Run]], int]
+
+
+def make_source(scale: Scale) -> Mock:
+    """Create a mock source generating the number of runs of a scale.
+
+    Runs are spread over 10 models and 10 learning rates, and if necessary a
+    third parameter and seeds.
+
+    Args:
+        scale: The scale to create the source for.
+
+    Returns:
+        The mock source.
+    """
+    grid: Dict[str, List[str | int | float | bool]] = {
+        "model": [f"model-{i}" for i in range(min(scale.runs, 10))],
+        "lr": [10**-i for i in range(max(min(scale.runs // 10, 10), 1))],
+    }
+    configs = len(grid["model"]) * len(grid["lr"])
+    num_seeds = 1
+    if scale.runs >= configs * 100:
+        grid["dropout"] = [i / 1000 for i in range(scale.runs // configs)]
+    else:
+        num_seeds = max(scale.runs // configs, 1)
+    return Mock(grid=grid, num_seeds=num_seeds, steps=scale.steps)
+
+
+def _export(runs: List[Run]) -> None:
+    grouped = Query(runs).groupby(Param("model")).aggregate("mean").all()
+    report = Report(runs).add(
+        H1("Benchmark"),
+        Table([Param("model"), Param("lr"), Metric("accuracy", direction="max")]),
+        MetricPlot(
+            TemporalMetric("accuracy", direction="max"),
+            Param("model"),
+            runs=grouped,
+            max_points=1000,
+        ),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = Markdown(os.path.join(tmp, "report.md"))
+        exporter.build_cache = None
+        exporter.export(report)
+
+
+def _plot() -> MetricPlot:
+    return MetricPlot(TemporalMetric("accuracy", direction="max"), Param("model"))
+
+
+def _num_steps(runs: List[Run]) -> int:
+    return sum(len(r.temporal["accuracy"]) for r in runs)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "source.load",
+        "runs",
+        lambda source, runs: (source,),
+        lambda source: source.load(),
+        len,
+    ),
+    Benchmark(
+        "query.filter",
+        "runs",
+        lambda source, runs: (Query(runs),),
+        lambda q: q.filter(lambda r: r.metrics["accuracy"] > 0.9),
+        len,
+    ),
+    Benchmark(
+        "query.sort",
+        "runs",
+        lambda source, runs: (Query(runs), Metric("accuracy", direction="max")),
+        lambda q, m: q.sort(m),
+        len,
+    ),
+    Benchmark(
+        "query.groupby",
+        "runs",
+        lambda source, runs: (Query(runs), Param("model")),
+        lambda q, p: q.groupby(p),
+        len,
+    ),
+    Benchmark(
+        "query.groupdiff",
+        "runs",
+        lambda source, runs: (Query(runs), Param("seed")),
+        lambda q, p: q.groupdiff(p),
+        len,
+    ),
+    Benchmark(
+        "grouped.aggregate_mean",
+        "runs",
+        lambda source, runs: (Query(runs).groupby(Param("model")),),
+        lambda g: g.aggregate("mean"),
+        len,
+    ),
+    Benchmark(
+        "table.build",
+        "rows",
+        lambda source, runs: (
+            Table(
+                [
+                    Param("model"),
+                    Param("lr"),
+                    Metric("accuracy", direction="max"),
+                    Metric("loss", direction="min"),
+                ]
+            ),
+            runs,
+        ),
+        lambda block, runs: block.build(runs),
+        len,
+    ),
+    Benchmark(
+        "metricplot.build",
+        "points",
+        lambda source, runs: (_plot(), runs),
+        lambda block, runs: block.build(runs),
+        _num_steps,
+    ),
+    Benchmark(
+        "utils.hash_dataframe",
+        "points",
+        lambda source, runs: (_plot().build(runs),),
+        hash_dataframe,
+        _num_steps,
+    ),
+    Benchmark("markdown.export", "runs", lambda source, runs: (runs,), _export, len),
+]
+
+
+def measure(
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    repeat: int,
+    memory: bool,
+    min_time: float = 0.2,
+) -> Tuple[float, int | None]:
+    """Measure the fastest wall time and the peak allocated memory of a function.
+
+    The function is called once untimed first to warm up imports and caches. Fast
+    functions are called more often than `repeat` until they ran for `min_time`
+    seconds in total to reduce noise. The peak memory is measured in a
+    separate call, as tracing allocations distorts the wall time.
+
+    Args:
+        fn: The function to measure.
+        args: The arguments to call the function with.
+        repeat: Minimum number of timed calls.
+        memory: Whether to measure the peak allocated memory.
+        min_time: Minimum total time of the timed calls in seconds.
+            Defaults to 0.2.
+
+    Returns:
+        The fastest wall time in seconds and the peak memory in bytes, or None if
+        memory is not measured.
+    """
+    fn(*args)
+    best, total, calls = float("inf"), 0.0, 0
+    while calls < repeat or total < min_time:
+        gc.collect()
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        best, total, calls = min(best, elapsed), total + elapsed, calls + 1
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run_scale(
+    name: str,
+    repeat: int = 3,
+    memory: bool = True,
+    only: List[str] | None = None,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Dict[str, Any]]:
+    """Run all benchmarks at a scale.
+
+    Args:
+        name: The name of the scale, see :data:`SCALES`.
+        repeat: Number of timed calls per benchmark. Defaults to 3.
+        memory: Whether to measure the peak allocated memory. Defaults to True.
+        only: Names of the benchmarks to run. If None, all are run.
+            Defaults to None.
+        log: Function called with the result of each benchmark.
+            Defaults to print.
+
+    Returns:
+        A dictionary mapping "<scale>/<benchmark>" to its results.
+    """
+    scale = SCALES[name]
+    source = make_source(scale)
+    runs = source.load()
+    results: Dict[str, Dict[str, Any]] = {}
+    for benchmark in BENCHMARKS:
+        if only is not None and benchmark.name not in only:
+            continue
+        args = benchmark.setup(source, runs)
+        seconds, peak = measure(benchmark.fn, args, repeat, memory)
+        size = benchmark.size(runs)
+        key = f"{name}/{benchmark.name}"
+        results[key] = {
+            "seconds": seconds,
+            "throughput": size / seconds if seconds > 0 else float("inf"),
+            "unit": f"{benchmark.unit}/s",
+            "size": size,
+            "peak_memory": peak,
+        }
+        log(format_result(key, results[key]))
+    return results
+
+
+def run_import(
+    repeat: int = 5,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Dict[str, Any]]:
+    """Measure the time to import ablate in a fresh interpreter.
+
+    Args:
+        repeat: Number of timed imports. Defaults to 5.
+        log: Function called with the result. Defaults to print.
+
+    Returns:
+        A dictionary mapping "import/ablate" to its results.
+    """
+    code = (
+        "import time; start = time.perf_counter(); import ablate; "
+        "print(time.perf_counter() - start)"
+    )
+    seconds = min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+    result = {
+        "seconds": seconds,
+        "throughput": 1 / seconds,
+        "unit": "imports/s",
+        "size": 1,
+        "peak_memory": None,
+    }
+    log(format_result("import/ablate", result))
+    return {"import/ablate": result}
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    results: Dict[str, Dict[str, Any]],
+    threshold: float = 0.2,
+) -> Tuple[List[str], List[str]]:
+    """Compare benchmark results against a baseline.
+
+    Args:
+        baseline: The results of the baseline.
+        results: The results to compare.
+        threshold: Relative slowdown above which a benchmark is flagged as a
+            regression. Defaults to 0.2.
+
+    Returns:
+        The lines of a comparison table of all benchmarks present in both results,
+        and the names of the regressed benchmarks.
+    """
+    lines = [f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'change':>8}"]
+    regressions: List[str] = []
+    for key in sorted(baseline.keys() & results.keys()):
+        before = baseline[key]["seconds"]
+        after = results[key]["seconds"]
+        change = after / before - 1 if before > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        lines.append(
+            f"{key:<40} {format_time(before):>10} {format_time(after):>10} "
+            f"{change:>+8.1%}{flag}"
+        )
+    return lines, regressions
+
+
+def format_result(key: str, result: Dict[str, Any]) -> str:
+    """Format the result of a benchmark as a single line.
+
+    Args:
+        key: The name of the benchmark.
+        result: The result of the benchmark.
+
+    Returns:
+        The formatted result.
+    """
+    peak = result["peak_memory"]
+    memory = f"{peak / 2**20:>9.1f} MiB" if peak is not None else f"{'-':>13}"
+    return (
+        f"{key:<40} {format_time(result['seconds']):>10} "
+        f"{result['throughput']:>12.4g} {result['unit']:<10} {memory}"
+    )
@@ -1,10 +1,12 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from ablate.blocks import H1, MetricPlot, Table, Text
 from ablate.core.types import Run
-from ablate.queries.selectors import Metric, Param
+from ablate.queries.selectors import Metric, Param, TemporalMetric
 
 
 def make_runs() -> List[Run]:
@@ -50,3 +52,91 @@ def test_metric_plot_multi() -> None:
     df = plot.build(make_runs())
     assert isinstance(df, pd.DataFrame)
     assert all(k in df.columns for k in ["step", "value", "metric", "run"])
+
+
+def test_table_block_infers_column_dtypes() -> None:
+    runs = make_runs() + [Run(id="c", params={"model": "vit"}, metrics={})]
+    table = Table(
+        columns=[
+            Param("model"),
+            Param("seed"),
+            Metric("accuracy", direction="max"),
+            TemporalMetric("accuracy", direction="max", label="best"),
+        ]
+    )
+    df = table.build(runs)
+    assert df["model"].tolist() == ["resnet", "resnet", "vit"]
+    assert df["seed"].dtype == "float64"
+    assert df["accuracy"].tolist()[:2] == [0.7, 0.8]
+    assert df["best"].tolist()[:2] == [0.7, 0.8]
+    assert len(df) == 3
+
+
+def test_metric_plot_builds_categorical_long_format() -> None:
+    runs = make_runs() + [Run(id="c", params={}, metrics={})]
+    plot = MetricPlot(
+        [Metric("accuracy", direction="max"), Metric("loss", direction="min")],
+        identifier=Param("seed"),
+    )
+    df = plot.build(runs)
+    assert list(df.columns) == ["step", "value", "metric", "run", "run_id"]
+    assert len(df) == 4
+    assert df["step"].tolist() == [0, 1, 0, 1]
+    assert df["value"].tolist() == [0.6, 0.7, 0.7, 0.8]
+    for column in ["metric", "run", "run_id"]:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert df["run"].tolist() == [1, 1, 2, 2]
+    assert df["run_id"].cat.categories.tolist() == ["a", "b"]
+
+
+def test_metric_plot_empty() -> None:
+    plot = MetricPlot(Metric("missing", direction="max"))
+    df = plot.build(make_runs())
+    assert df.empty
+    assert list(df.columns) == ["step", "value", "metric", "run", "run_id"]
+
+
+def test_metric_plot_downsamples_series() -> None:
+    run = Run(
+        id="long",
+        params={},
+        metrics={},
+        temporal={"loss": [(i, 1 / (i + 1)) for i in range(1000)]},
+    )
+    for method in ["lttb", "minmax"]:
+        plot = MetricPlot(
+            Metric("loss", direction="min"),
+            max_points=50,
+            downsample=method,  # type: ignore[arg-type]
+        )
+        df = plot.build([run])
+        assert 0 < len(df) <= 50
+        assert df["step"].iloc[0] == 0
+        assert df["value"].max() == 1.0
+
+
+def test_metric_plot_downsamples_seeds_on_shared_steps() -> None:
+    rng = np.random.default_rng(0)
+    runs = [
+        Run(
+            id=f"seed{seed}",
+            params={"model": "resnet"},
+            metrics={},
+            temporal={"loss": list(enumerate(rng.random(500).tolist()))},
+        )
+        for seed in range(3)
+    ]
+    plot = MetricPlot(Metric("loss", direction="min"), Param("model"), max_points=40)
+    df = plot.build(runs)
+    per_run = [set(group["step"]) for _, group in df.groupby("run_id", observed=True)]
+    assert len(per_run) == 3
+    assert per_run[0] == per_run[1] == per_run[2]
+    assert 0 < len(per_run[0]) <= 40
+
+
+def test_metric_plot_invalid_options() -> None:
+    metric = Metric("loss", direction="min")
+    with pytest.raises(ValueError, match="Unsupported downsampling method"):
+        MetricPlot(metric, downsample="median")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Unsupported error bar"):
+        MetricPlot(metric, errorbar="bootstrap")  # type: ignore[arg-type]
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from ablate.blocks import BuildCache, MetricPlot, Table
+from ablate.blocks.cache import block_fingerprint, config_key
+from ablate.core.types import Run
+from ablate.exporters import Markdown
+from ablate.queries import Metric, Param
+
+
+def make_runs() -> List[Run]:
+    return [
+        Run(id="a", params={"model": "resnet"}, metrics={"accuracy": 0.7}),
+        Run(id="b", params={"model": "vit"}, metrics={"accuracy": 0.8}),
+    ]
+
+
+def make_table() -> Table:
+    return Table(columns=[Param("model"), Metric("accuracy", direction="max")])
+
+
+def test_build_cache_reuses_results() -> None:
+    cache = BuildCache()
+    runs = make_runs()
+    first = cache.build(make_table(), runs)
+    second = cache.build(make_table(), runs)
+
+    assert isinstance(first, pd.DataFrame)
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    assert cache.nbytes > 0
+
+
+def test_build_cache_distinguishes_configs_and_runs() -> None:
+    cache = BuildCache()
+    runs = make_runs()
+    cache.build(make_table(), runs)
+    cache.build(Table(columns=[Param("model", label="Model")]), runs)
+    cache.build(make_table(), runs[:1])
+    cache.build(make_table(), make_runs())
+    assert cache.misses == 4
+    assert cache.hits == 0
+
+
+def test_build_cache_invalidates_reassigned_runs() -> None:
+    cache = BuildCache()
+    runs = make_runs()
+    cache.build(make_table(), runs)
+    runs[0].metrics = {"accuracy": 0.1}
+    df = cache.build(make_table(), runs)
+    assert df["accuracy"].tolist() == [0.1, 0.8]
+    assert cache.misses == 2
+
+
+def test_build_cache_evicts_least_recently_used() -> None:
+    cache = BuildCache(max_entries=2)
+    runs = make_runs()
+    tables = [Table(columns=[Param("model", label=str(i))]) for i in range(3)]
+    cache.build(tables[0], runs)
+    cache.build(tables[1], runs)
+    cache.build(tables[0], runs)
+    cache.build(tables[2], runs)
+    assert len(cache) == 2
+
+    cache.build(tables[0], runs)
+    assert cache.hits == 2
+    cache.build(tables[1], runs)
+    assert cache.misses == 4
+
+
+def test_build_cache_respects_max_bytes() -> None:
+    cache = BuildCache(max_bytes=1)
+    cache.build(make_table(), make_runs())
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+    cache.max_bytes = None
+    cache.build(make_table(), make_runs())
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_config_key_ignores_block_runs() -> None:
+    metric = Metric("accuracy", direction="max")
+    assert config_key(MetricPlot(metric)) == config_key(
+        MetricPlot(metric, runs=make_runs())
+    )
+    assert config_key(MetricPlot(metric)) != config_key(
+        MetricPlot(metric, max_points=10)
+    )
+
+
+def test_block_fingerprint_is_content_based() -> None:
+    runs = make_runs()
+    key = block_fingerprint(make_table(), runs)
+    assert key == block_fingerprint(make_table(), [r.model_copy() for r in runs])
+    assert key != block_fingerprint(make_table(), runs[:1])
+    assert key != block_fingerprint(make_table(), runs, "salt")
+    runs[0].metrics = {"accuracy": 0.9}
+    assert key != block_fingerprint(make_table(), runs)
+
+
+def test_block_fingerprint_rejects_unstable_configs() -> None:
+    table = make_table()
+    assert block_fingerprint(table, make_runs()) is not None
+    vars(table)["formatter"] = lambda x: x
+    assert block_fingerprint(table, make_runs()) is None
+
+
+def test_build_cache_is_thread_safe() -> None:
+    cache = BuildCache(max_entries=4)
+    runs = make_runs()
+    tables = [Table(columns=[Param("model", label=str(i))]) for i in range(8)]
+
+    def build(i: int) -> pd.DataFrame:
+        return cache.build(tables[i % 8], runs)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(build, range(200)))
+
+    assert all(len(df) == 2 for df in results)
+    assert cache.hits + cache.misses == 200
+    assert len(cache) == 4
+
+
+def test_exporters_have_separate_build_caches(tmp_path: Path) -> None:
+    first = Markdown(str(tmp_path / "first.md"))
+    second = Markdown(str(tmp_path / "second.md"))
+    assert first.build_cache is not None
+    assert first.build_cache is first.build_cache
+    assert first.build_cache is not second.build_cache
+
+    second.build_cache = None
+    assert second.build_cache is None
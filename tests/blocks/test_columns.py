@@ -0,0 +1,118 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from ablate.blocks import H1, ColumnStore, MetricPlot, Table
+from ablate.blocks.columns import active_column_store, evaluate, use_column_store
+from ablate.core.types import Run
+from ablate.exporters import Markdown
+from ablate.queries import Metric, Param, TemporalMetric
+from ablate.report import Report
+
+
+def make_runs() -> List[Run]:
+    return [
+        Run(
+            id=str(i),
+            params={"model": "resnet" if i % 2 else "vit"},
+            metrics={"accuracy": i / 10},
+            temporal={"accuracy": [(0, 0.0), (1, i / 10)]},
+        )
+        for i in range(4)
+    ]
+
+
+def make_report(runs: List[Run]) -> Report:
+    return Report(runs).add(
+        H1("Results"),
+        Table([Param("model"), Metric("accuracy", direction="max")]),
+        Table([Param("model", label="Model"), TemporalMetric("accuracy", "max")]),
+        Table([Param("model")], runs=runs[:2]),
+        MetricPlot(TemporalMetric("accuracy", "max"), Param("model")),
+    )
+
+
+def test_report_dependencies() -> None:
+    runs = make_runs()
+    extra = Run(id="extra", params={"model": "vgg"}, metrics={})
+    report = make_report(runs).add(Table([Param("model")], runs=[extra]))
+    dependencies = report.dependencies()
+
+    assert [d.selector.name for d in dependencies] == ["model", "accuracy", "accuracy"]
+    model = dependencies[0]
+    assert model.blocks == [1, 2, 3, 4, 5]
+    assert model.runs == [*runs, extra]
+    assert dependencies[1].blocks == [1]
+    assert dependencies[2].blocks == [2]
+
+
+def test_column_store_evaluates_selectors_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runs = make_runs()
+    calls: List[int] = []
+    evaluate_many = Param.evaluate_many
+
+    def spy(self: Param, runs: List[Run]) -> np.ndarray:
+        calls.append(len(runs))
+        return evaluate_many(self, runs)
+
+    monkeypatch.setattr(Param, "evaluate_many", spy)
+    store = ColumnStore(make_report(runs))
+    first = store.evaluate(Param("model"), runs[:2])
+    second = store.evaluate(Param("model", label="Model"), runs)
+
+    assert first.tolist() == ["vit", "resnet"]
+    assert second.tolist() == ["vit", "resnet", "vit", "resnet"]
+    assert calls == [4]
+    assert (store.hits, store.misses) == (6, 4)
+    assert len(store) == 1
+
+
+def test_column_store_invalidates_reassigned_runs() -> None:
+    runs = make_runs()
+    store = ColumnStore()
+    assert store.evaluate(Param("model"), runs).tolist()[0] == "vit"
+    runs[0].params = {"model": "vgg"}
+    assert store.evaluate(Param("model"), runs).tolist()[0] == "vgg"
+    assert store.misses == 5
+    assert store.evaluate(Param("model"), []).tolist() == []
+
+
+def test_evaluate_uses_active_store() -> None:
+    runs = make_runs()
+    assert active_column_store() is None
+    assert evaluate(Param("model"), runs).tolist() == ["vit", "resnet"] * 2
+
+    with use_column_store(ColumnStore()) as store:
+        assert active_column_store() is store
+        evaluate(Param("model"), runs)
+        evaluate(Param("model"), runs)
+    assert active_column_store() is None
+    assert store is not None
+    assert (store.hits, store.misses) == (4, 4)
+
+
+def test_exporter_shares_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runs = make_runs()
+    calls: List[int] = []
+    evaluate_many = Param.evaluate_many
+
+    def spy(self: Param, runs: List[Run]) -> np.ndarray:
+        calls.append(len(runs))
+        return evaluate_many(self, runs)
+
+    monkeypatch.setattr(Param, "evaluate_many", spy)
+    exporter = Markdown(str(tmp_path / "report.md"))
+    exporter.build_cache = None
+    exporter.export(make_report(runs))
+    assert calls == [4]
+
+    calls.clear()
+    exporter.share_columns = False
+    exporter.export(make_report(runs))
+    assert calls == [4, 4, 2, 4]
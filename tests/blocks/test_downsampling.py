@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from ablate.blocks.downsampling import downsample, lttb, minmax
+
+
+@pytest.fixture
+def series() -> tuple[np.ndarray, np.ndarray]:
+    x = np.arange(1000)
+    y = np.sin(x / 50) + np.random.default_rng(0).normal(0, 0.1, len(x))
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_limits_points(
+    series: tuple[np.ndarray, np.ndarray],
+) -> None:
+    x, y = series
+    idx = lttb(x, y, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0
+    assert idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_minmax_keeps_bucket_extremes(series: tuple[np.ndarray, np.ndarray]) -> None:
+    x, y = series
+    idx = minmax(x, y, 100)
+    assert len(idx) <= 100
+    assert np.all(np.diff(idx) > 0)
+    assert np.argmax(y) in idx
+    assert np.argmin(y) in idx
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample_short_series_is_unchanged(method: str) -> None:
+    x = np.arange(10)
+    idx = downsample(x, x.astype(float), 20, method)  # type: ignore[arg-type]
+    assert idx.tolist() == list(range(10))
+
+
+def test_downsample_invalid_method() -> None:
+    x = np.arange(10)
+    with pytest.raises(ValueError, match="Unsupported downsampling method"):
+        downsample(x, x.astype(float), 5, "median")  # type: ignore[arg-type]
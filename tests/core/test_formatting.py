@@ -0,0 +1,13 @@
+from ablate.core.formatting import format_bytes, format_time
+
+
+def test_format_time() -> None:
+    assert format_time(0.0123) == "12.3ms"
+    assert format_time(2.5) == "2.50s"
+
+
+def test_format_bytes() -> None:
+    assert format_bytes(512) == "512B"
+    assert format_bytes(1536) == "1.5KiB"
+    assert format_bytes(3 * 1024**2) == "3.0MiB"
+    assert format_bytes(2048 * 1024**3) == "2048.0GiB"
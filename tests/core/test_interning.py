@@ -0,0 +1,59 @@
+import json
+import math
+from typing import List
+
+from ablate.core.interning import ParamTable
+from ablate.core.types import Run
+from ablate.sources import AbstractSource
+
+
+def parse(params: str) -> Run:
+    return Run(id="run", params=json.loads(params), metrics={})
+
+
+def test_param_table_shares_values() -> None:
+    config = json.dumps({"optimizer": "adam", "lr": 0.001, "layers": [1, 2]})
+    runs = ParamTable().intern_runs([parse(config), parse(config)])
+    a, b = runs[0].params, runs[1].params
+    assert a == json.loads(config)
+    assert list(a) == ["optimizer", "lr", "layers"]
+    assert a["optimizer"] is b["optimizer"]
+    assert a["lr"] is b["lr"]
+    assert next(iter(a)) is next(iter(b))
+    assert a["layers"] is not b["layers"]
+
+
+def test_param_table_distinguishes_types() -> None:
+    table = ParamTable()
+    params = table.intern({"a": 1, "b": 1.0, "c": True, "d": "1"})
+    assert [type(v) for v in params.values()] == [int, float, bool, str]
+    codes = [table.encode(v) for v in (1, 1.0, True, "1")]
+    assert len(set(codes)) == 4
+    assert len(table) == 4
+    assert table.decode(table.encode(True)) is True  # type: ignore[arg-type]
+
+
+def test_param_table_keeps_unmergeable_values() -> None:
+    table = ParamTable()
+    params = table.intern({"zero": -0.0, "nan": math.nan, "none": None})
+    assert math.copysign(1, params["zero"]) == -1
+    assert math.isnan(params["nan"])
+    assert params["none"] is None
+    assert table.encode(0.0) is None
+    assert table.encode(None) is None
+    assert len(table) == 0
+
+
+def test_sources_intern_params() -> None:
+    class Source(AbstractSource):
+        def load(self) -> List[Run]:
+            return [parse('{"model": "resnet"}'), parse('{"model": "resnet"}')]
+
+    source = Source()
+    a, b = source.load()
+    assert a.params["model"] is b.params["model"]
+    assert len(source.param_table) == 1
+
+    source.intern_params = False
+    a, b = source.load()
+    assert a.params["model"] is not b.params["model"]
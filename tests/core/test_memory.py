@@ -0,0 +1,75 @@
+import sys
+
+from ablate.core.memory import memory_footprint, sizeof
+from ablate.core.types import Run
+from ablate.queries import Param, Query
+
+
+def make_runs() -> list[Run]:
+    return [
+        Run(
+            id="a",
+            params={"model": "resnet", "layers": [64, 128]},
+            metrics={"accuracy": 0.7},
+            temporal={"loss": [(i, 1.0 / (i + 1)) for i in range(1000)]},
+        ),
+        Run(
+            id="b",
+            params={"model": "vgg", "layers": [64]},
+            metrics={"accuracy": 0.8},
+            temporal={"loss": [(i, 0.5) for i in range(10)], "lr": [(0, 0.1)]},
+        ),
+    ]
+
+
+def test_sizeof() -> None:
+    assert sizeof(1.0) == sys.getsizeof(1.0)
+    assert sizeof({"key": 1.0}) == sys.getsizeof({"key": 1.0}) + sys.getsizeof(1.0)
+    series = [(1, 0.5), (2, 0.25)]
+    element = sys.getsizeof((1, 0.5)) + sys.getsizeof(1) + sys.getsizeof(0.5)
+    assert sizeof(series) == sys.getsizeof(series) + 2 * element
+
+
+def test_memory_footprint_breakdown() -> None:
+    runs = make_runs()
+    footprint = memory_footprint(runs, top=2)
+
+    assert footprint.runs == 2
+    assert footprint.ids == sys.getsizeof("a") + sys.getsizeof("b")
+    assert set(footprint.params) == {"model", "layers"}
+    assert footprint.params["model"] == sizeof("resnet") + sizeof("vgg")
+    assert footprint.metrics == {"accuracy": 2 * sys.getsizeof(0.7)}
+    assert footprint.temporal["loss"] == sum(sizeof(r.temporal["loss"]) for r in runs)
+    assert footprint.points == {"loss": 1010, "lr": 1}
+    assert footprint.total == (
+        footprint.overhead
+        + footprint.ids
+        + sum(footprint.params.values())
+        + sum(footprint.metrics.values())
+        + sum(footprint.temporal.values())
+    )
+
+    assert [r.id for r in footprint.largest_runs] == ["a", "b"]
+    assert footprint.largest_runs[0].bytes > footprint.temporal["loss"] / 2
+    assert [(s.run, s.key, s.points) for s in footprint.largest_series] == [
+        ("a", "loss", 1000),
+        ("b", "loss", 10),
+    ]
+
+
+def test_memory_footprint_summary() -> None:
+    summary = memory_footprint(make_runs()).summary()
+    lines = summary.splitlines()
+    assert lines[0].startswith("2 runs, ")
+    assert any(line.split()[0] == "temporal" for line in lines if line)
+    assert "largest series:" in lines
+    assert lines[-1].endswith("b / lr")
+
+
+def test_query_memory_footprint() -> None:
+    runs = make_runs()
+    footprint = Query(runs).memory_footprint()
+    assert footprint == memory_footprint(runs)
+    grouped = Query(runs).groupby(Param("model")).memory_footprint(top=1)
+    assert grouped.total == footprint.total
+    assert len(grouped.largest_series) == 1
@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import json
+from pathlib import Path
+import threading
+import tracemalloc
+
+import ablate
+from ablate.blocks import H1, MetricPlot, Table
+from ablate.core import profiling
+from ablate.exporters import Markdown
+from ablate.queries import Metric, Param, Query, TemporalMetric
+from ablate.report import Report
+from ablate.sources import Mock
+
+
+def make_source() -> Mock:
+    return Mock(grid={"model": ["resnet", "vgg"], "lr": [0.01, 0.001]}, steps=10)
+
+
+def test_profile_records_pipeline(tmp_path: Path) -> None:
+    with ablate.profile() as prof:
+        runs = make_source().load()
+        runs = Query(runs).groupby(Param("model")).aggregate("first").all()
+        report = Report(runs).add(
+            H1("Report"),
+            Table([Param("model"), Metric("accuracy", direction="max")]),
+            MetricPlot(TemporalMetric("accuracy", direction="max"), Param("model")),
+        )
+        exporter = Markdown(str(tmp_path / "report.md"))
+        exporter.build_cache = None
+        exporter.export(report)
+
+    stages = {r.stage for r in prof.records}
+    assert stages == {"load", "query", "build", "render"}
+
+    load = next(r for r in prof.records if r.stage == "load")
+    assert load.name == "Mock"
+    assert load.runs == load.rows == 4
+    assert load.wall_time >= 0
+    assert load.cpu_time >= 0
+    assert load.peak_memory
+
+    groupby = next(r for r in prof.records if r.name == "Query.groupby")
+    assert (groupby.runs, groupby.rows) == (4, 2)
+    head = next(r for r in prof.records if r.name == "GroupedQuery.head")
+    assert head.depth == 1
+
+    table = next(r for r in prof.records if r.stage == "build" and r.name == "Table")
+    assert (table.runs, table.rows, table.depth) == (2, 2, 1)
+    renders = [r.name for r in prof.records if r.stage == "render"]
+    assert renders == ["H1", "Table", "MetricPlot"]
+
+    totals = prof.totals()
+    assert totals["query"]["count"] == 2
+    assert totals["render"]["count"] == 3
+    assert not tracemalloc.is_tracing()
+    assert profiling.active_profile() is None
+
+
+def test_profile_report(tmp_path: Path) -> None:
+    with ablate.profile(memory=False) as prof:
+        Query(make_source().load()).filter(lambda r: r.params["lr"] == 0.01)
+
+    assert all(r.peak_memory is None for r in prof.records)
+    data = json.loads(prof.to_json(tmp_path / "profile.json"))
+    assert data == json.loads((tmp_path / "profile.json").read_text())
+    assert [r["name"] for r in data["records"]] == ["Mock", "Query.filter"]
+    assert data["totals"]["query"]["count"] == 1
+
+    lines = prof.summary().splitlines()
+    assert lines[0].split() == [
+        "stage",
+        "name",
+        "calls",
+        "wall",
+        "cpu",
+        "peak",
+        "mem",
+        "runs",
+        "rows",
+    ]
+    assert lines[2].split()[:3] == ["load", "Mock", "1"]
+    assert lines[3].split()[:3] == ["query", "Query.filter", "1"]
+    assert str(prof) == prof.summary()
+
+
+def test_profile_peak_memory_of_nested_operations() -> None:
+    with ablate.profile() as prof, profiling.span("render", "outer"):
+        data = bytearray(4 * 1024 * 1024)
+        del data
+        with profiling.span("build", "inner"):
+            pass
+
+    inner, outer = prof.records
+    assert (outer.peak_memory or 0) >= 4 * 1024 * 1024
+    assert inner.peak_memory is not None
+    assert inner.peak_memory < 1024 * 1024
+
+
+def test_profile_nests_threads_independently() -> None:
+    barrier = threading.Barrier(4)
+
+    def work(i: int) -> None:
+        with profiling.span("render", f"outer{i}"):
+            barrier.wait()
+            with profiling.span("build", f"inner{i}"):
+                barrier.wait()
+
+    def other() -> None:
+        with profiling.span("build", "other"):
+            pass
+
+    with ablate.profile(memory=False) as prof:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, work, i)
+                for i in range(4)
+            ]
+            for future in futures:
+                future.result()
+        # threads do not inherit the active profile without a copy of the context
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+
+    assert len(prof.records) == 8
+    depths = {r.name: r.depth for r in prof.records}
+    assert depths == {
+        **{f"outer{i}": 0 for i in range(4)},
+        **{f"inner{i}": 1 for i in range(4)},
+    }
+    assert profiling.active_profile() is None
+
+
+def test_profile_disabled() -> None:
+    assert profiling.active_profile() is None
+    span = profiling.span("build", "Table")
+    with span:
+        span.rows = 1
+    assert span is profiling.span("render", "Table")
+    assert len(Query(make_source().load()).head(2)) == 2
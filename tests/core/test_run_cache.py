@@ -0,0 +1,40 @@
+from copy import deepcopy
+import gc
+
+from ablate.core.cache import invalidate, run_cache, run_version
+from ablate.core.types import Run
+
+
+def make_run() -> Run:
+    return Run(id="a", params={"model": "resnet"}, metrics={"accuracy": 0.7})
+
+
+def test_run_cache_is_per_run() -> None:
+    run = make_run()
+    run_cache(run)["key"] = 1
+    assert run_cache(run)["key"] == 1
+    assert "key" not in run_cache(deepcopy(run))
+    assert run_version(run) != run_version(make_run())
+
+
+def test_run_version_changes_on_reassignment() -> None:
+    run = make_run()
+    version = run_version(run)
+    assert run_version(run) == version
+    run.metrics = {"accuracy": 0.9}
+    assert run_version(run) != version
+
+    version = run_version(run)
+    invalidate(run)
+    assert run_version(run) != version
+
+
+def test_run_cache_is_released_with_run() -> None:
+    from ablate.core import cache
+
+    run = make_run()
+    run_cache(run)
+    size = len(cache._entries)
+    del run
+    gc.collect()
+    assert len(cache._entries) == size - 1
@@ -1,7 +1,7 @@
 from pydantic import ValidationError
 import pytest
 
-from ablate.core.types import GroupedRun, Run
+from ablate.core.types import ChangeSet, GroupedRun, Run
 
 
 def test_run() -> None:
@@ -54,3 +54,29 @@ def test_run_roundtrip_serialization() -> None:
     data = run.model_dump()
     recovered = Run(**data)
     assert recovered == run
+
+
+def test_change_set_apply() -> None:
+    runs = [
+        Run(id="a", params={}, metrics={"acc": 0.1}),
+        Run(id="b", params={}, metrics={"acc": 0.2}),
+        Run(id="c", params={}, metrics={"acc": 0.3}),
+    ]
+    changes = ChangeSet(
+        added=[Run(id="d", params={}, metrics={"acc": 0.4})],
+        updated=[Run(id="b", params={}, metrics={"acc": 0.5})],
+        removed=["c"],
+    )
+    result = changes.apply(runs)
+
+    assert [r.id for r in result] == ["a", "b", "d"]
+    assert result[1].metrics["acc"] == 0.5
+    assert [r.id for r in runs] == ["a", "b", "c"]
+    assert changes
+    assert not ChangeSet()
+
+
+def test_change_set_apply_appends_unknown_updates() -> None:
+    runs = [Run(id="a", params={}, metrics={"acc": 0.1})]
+    changes = ChangeSet(updated=[Run(id="b", params={}, metrics={"acc": 0.2})])
+    assert [r.id for r in changes.apply(runs)] == ["a", "b"]
@@ -0,0 +1,125 @@
+import base64
+import json
+from pathlib import Path
+import re
+from typing import List
+
+import pytest
+
+from ablate.blocks import H2, MetricPlot, Table, Text
+from ablate.core.types import Run
+from ablate.exporters import HTML
+from ablate.queries import Id, Metric, Param
+from ablate.report import Report
+
+from .utils import DummyFigureBlock, DummyTextBlock
+
+
+@pytest.fixture
+def runs() -> List[Run]:
+    return [
+        Run(
+            id=f"run{i}",
+            params={"model": "resnet" if i % 2 else "vit"},
+            metrics={"accuracy": 0.5 + i / 100},
+            temporal={"accuracy": [(0, 0.5), (1, 0.5 + i / 100)]},
+        )
+        for i in range(6)
+    ]
+
+
+def test_export_text_and_table(tmp_path: Path, runs: List[Run]) -> None:
+    report = Report(runs[:2]).add(
+        H2("Results <1>"),
+        Text("Some text."),
+        Table(columns=[Param("model"), Metric("accuracy", direction="max")]),
+    )
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path)).export(report)
+
+    content = out_path.read_text()
+    assert "<h2>Results &lt;1&gt;</h2>" in content
+    assert "<p>Some text.</p>" in content
+    assert re.search(r"<td>vit</td>\s*<td>0.50</td>", content)
+
+
+def test_large_tables_are_paginated(tmp_path: Path, runs: List[Run]) -> None:
+    report = Report(runs).add(Table(columns=[Id(), Param("model")]))
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path), page_size=4).export(report)
+
+    content = out_path.read_text()
+    assert "<table" not in content.split("<body>")[1].split("<script>")[0]
+    match = re.search(
+        r'data-page-size="4"><script type="application/json">(.*?)</script>', content
+    )
+    assert match is not None
+    data = json.loads(match.group(1))
+    assert data["columns"] == ["id", "model"]
+    assert [row[0] for row in data["data"]] == [f"run{i}" for i in range(6)]
+
+
+@pytest.mark.parametrize("figure_format", ["svg", "webp", "png"])
+def test_figures_are_embedded_and_lazy(
+    tmp_path: Path, runs: List[Run], figure_format: str
+) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path), figure_format=figure_format).export(  # type: ignore[arg-type]
+        Report(runs).add(plot)
+    )
+
+    content = out_path.read_text()
+    match = re.search(r'data-src="data:image/[\w+]+;base64,([^"]+)"', content)
+    assert match is not None
+    (asset,) = (tmp_path / ".ablate").glob(f"MetricPlot_*.{figure_format}")
+    assert base64.b64decode(match.group(1)) == asset.read_bytes()
+
+
+def test_figures_are_linked(tmp_path: Path, runs: List[Run]) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path), embed=False).export(Report(runs).add(plot))
+
+    (asset,) = (tmp_path / ".ablate").glob("MetricPlot_*.svg")
+    assert f'data-src=".ablate/{asset.name}"' in out_path.read_text()
+
+
+def test_empty_figure(tmp_path: Path) -> None:
+    runs = [Run(id="a", params={}, metrics={})]
+    plot = MetricPlot(Metric("accuracy", direction="max"))
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path)).export(Report(runs).add(plot))
+    assert "No data available for accuracy" in out_path.read_text()
+
+
+def test_invalid_figure_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported figure format"):
+        HTML(output_path=str(tmp_path / "r.html"), figure_format="gif")  # type: ignore[arg-type]
+
+
+def test_unsupported_blocks_raise(tmp_path: Path, runs: List[Run]) -> None:
+    exporter = HTML(output_path=str(tmp_path / "r.html"))
+    with pytest.raises(NotImplementedError, match="Unsupported text block"):
+        exporter.export(Report(runs).add(DummyTextBlock("oops")))
+    with pytest.raises(NotImplementedError, match="Unsupported figure block"):
+        exporter.export(Report(runs).add(DummyFigureBlock()))
+
+
+def test_interactive_figures(tmp_path: Path, runs: List[Run]) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    out_path = tmp_path / "report.html"
+    HTML(output_path=str(out_path), figure_format="interactive").export(
+        Report(runs).add(plot)
+    )
+
+    content = out_path.read_text()
+    assert "function ablateViewer(" in content
+    match = re.search(
+        r'data-interactive><script type="application/json">(.*?)</script>', content
+    )
+    assert match is not None
+    payload = json.loads(match.group(1))
+    assert payload["runs"] == ["vit", "resnet"]
+    assert [s["run"] for s in payload["series"]] == [0, 1]
+    assert not list((tmp_path / ".ablate").glob("MetricPlot_*"))
@@ -0,0 +1,78 @@
+import base64
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ablate.exporters.interactive import (
+    dump_payload,
+    metric_plot_payload,
+    save_interactive_plot,
+)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    steps = np.arange(10_000)
+    return pd.DataFrame(
+        {
+            "step": np.tile(steps, 3),
+            "value": np.concatenate([np.sin(steps / 100), steps, -steps]),
+            "metric": pd.Categorical(["loss"] * 20_000 + ["acc"] * 10_000),
+            "run": pd.Categorical(["a"] * 10_000 + ["b"] * 20_000),
+            "run_id": pd.Categorical(["1"] * 10_000 + ["2"] * 20_000),
+        }
+    )
+
+
+def decode(data: str, dtype: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(data), dtype=dtype)
+
+
+def test_payload_encodes_categories(df: pd.DataFrame) -> None:
+    payload = metric_plot_payload(df, "model")
+    assert payload["label"] == "model"
+    assert payload["metrics"] == ["acc", "loss"]
+    assert payload["runs"] == ["b", "a"]
+    keys = {
+        (payload["metrics"][s["metric"]], payload["runs"][s["run"]])
+        for s in payload["series"]
+    }
+    assert keys == {("loss", "a"), ("loss", "b"), ("acc", "b")}
+
+
+def test_payload_builds_decimation_pyramid(df: pd.DataFrame) -> None:
+    payload = metric_plot_payload(df, "model", points=100, levels=5, factor=4)
+    for series in payload["series"]:
+        sizes = [len(decode(level["x"], "<f8")) for level in series["levels"]]
+        assert sizes == [100, 400, 1600, 6400, 10_000]
+        coarse = series["levels"][0]
+        full = series["levels"][-1]
+        assert decode(coarse["y"], "<f4").max() == decode(full["y"], "<f4").max()
+        assert decode(coarse["y"], "<f4").min() == decode(full["y"], "<f4").min()
+        assert "lower" not in coarse
+
+
+@pytest.mark.parametrize("errorbar", ["sd", "minmax"])
+def test_payload_includes_bands(df: pd.DataFrame, errorbar: str) -> None:
+    payload = metric_plot_payload(df, "model", errorbar=errorbar)  # type: ignore[arg-type]
+    level = payload["series"][0]["levels"][0]
+    lower, upper = decode(level["lower"], "<f4"), decode(level["upper"], "<f4")
+    assert (lower <= decode(level["y"], "<f4")).all()
+    assert (upper >= decode(level["y"], "<f4")).all()
+
+
+def test_dump_payload_escapes_script_end() -> None:
+    dumped = dump_payload({"label": "</script>"})
+    assert "</" not in dumped
+    assert json.loads(dumped) == {"label": "</script>"}
+
+
+def test_save_interactive_plot(tmp_path: Path, df: pd.DataFrame) -> None:
+    path = tmp_path / "plot.html"
+    save_interactive_plot(df, "model", None, path)
+    content = path.read_text()
+    assert "function ablateViewer(" in content
+    assert '"label":"model"' in content
@@ -1,13 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
-from typing import List
+from typing import List, Literal
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+import pandas as pd
 import pytest
 
-from ablate.blocks import H1, H2, MetricPlot, Table, Text
+from ablate.blocks import H1, H2, BuildCache, MetricPlot, Table, Text
 from ablate.core.types import Run
 from ablate.exporters import Markdown
+from ablate.exporters.assets import block_cache_path, read_block_cache
+from ablate.exporters.utils import hash_dataframe
 from ablate.queries import Metric, Param
 from ablate.report import Report
 
@@ -83,6 +88,27 @@ def test_export_figure_block(tmp_path: Path, runs: List[Run]) -> None:
     assert img.shape[-1] in {3, 4}
 
 
+def test_export_figure_block_keeps_global_state(
+    tmp_path: Path, runs: List[Run]
+) -> None:
+    rc_params = dict(mpl.rcParams)
+    figures = plt.get_fignums()
+
+    def export(i: int) -> None:
+        plot = MetricPlot(
+            Metric("accuracy", direction="max"), identifier=Param("model")
+        )
+        report = Report(runs[i % 2 :]).add(plot, plot)
+        Markdown(output_path=str(tmp_path / f"report{i}.md")).export(report)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(export, range(8)))
+
+    assert dict(mpl.rcParams) == rc_params
+    assert plt.get_fignums() == figures
+    assert len(list((tmp_path / ".ablate").glob("MetricPlot_*.png"))) == 2
+
+
 def test_export_figure_block_empty(tmp_path: Path) -> None:
     empty_run = Run(id="x", params={}, metrics={}, temporal={})
     plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
@@ -171,3 +197,294 @@ def test_export_figure_block_with_csv(tmp_path: Path, runs: List[Run]) -> None:
     assert "step,value,metric,run,run_id" in csv_content
     assert "0,0.5,accuracy,resnet,run1" in csv_content
     assert "1,0.9,accuracy,resnet,run2" in csv_content
+
+
+@pytest.mark.parametrize("errorbar", ["ci", "sd", "minmax", None])
+def test_export_figure_block_errorbar(
+    tmp_path: Path, runs: List[Run], errorbar: str | None
+) -> None:
+    plot = MetricPlot(
+        Metric("accuracy", direction="max"),
+        identifier=Param("model"),
+        max_points=1,
+        errorbar=errorbar,  # type: ignore[arg-type]
+    )
+    out_path = tmp_path / "report.md"
+    Markdown(output_path=str(out_path)).export(Report(runs).add(plot))
+    assert len(list((tmp_path / ".ablate").glob("MetricPlot_*.png"))) == 1
+
+
+def test_export_figure_block_builds_once(tmp_path: Path, runs: List[Run]) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    report = Report(runs).add(plot)
+    exporter = Markdown(output_path=str(tmp_path / "report.md"), export_csv=True)
+    exporter.build_cache = BuildCache()
+    exporter.export(report)
+    exporter.export(report)
+    assert exporter.build_cache.misses == 1
+    assert exporter.build_cache.hits == 1
+
+
+def test_export_parallel_preserves_block_order(tmp_path: Path, runs: List[Run]) -> None:
+    report = Report(runs)
+    for i in range(4):
+        report.add(
+            H2(f"Section {i}"),
+            MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model")),
+        )
+        runs[0].temporal["accuracy"].append((i + 2, 0.1 * i))
+        runs = [r.model_copy(deep=True) for r in runs]
+        report.add(MetricPlot(Metric("accuracy", direction="max"), runs=runs))
+    out_path = tmp_path / "report.md"
+    Markdown(output_path=str(out_path), workers=2).export(report)
+
+    content = out_path.read_text()
+    positions = [content.index(f"## Section {i}") for i in range(4)]
+    assert positions == sorted(positions)
+    assets = {p.name for p in (tmp_path / ".ablate").glob("MetricPlot_*.png")}
+    assert assets == set(re.findall(r"\(\.ablate/(MetricPlot_\w+\.png)\)", content))
+    assert len(assets) > 1
+
+
+def test_export_reuses_existing_assets(
+    tmp_path: Path, runs: List[Run], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    table = Table(columns=[Param("model")])
+    report = Report(runs).add(table, plot)
+    out_path = tmp_path / "report.md"
+    Markdown(output_path=str(out_path), export_csv=True).export(report)
+    assets = {p.name for p in (tmp_path / ".ablate").glob("[!.]*")}
+    assert len(assets) == 3
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("Unexpected re-rendering of an existing asset.")
+
+    monkeypatch.setattr("ablate.exporters.markdown_exporter.save_metric_plot", fail)
+    monkeypatch.setattr("pandas.DataFrame.to_csv", fail)
+    exporter = Markdown(output_path=str(out_path), export_csv=True)
+    exporter.build_cache = BuildCache()
+    exporter.export(report)
+    assert {p.name for p in (tmp_path / ".ablate").glob("[!.]*")} == assets
+
+
+def test_figure_asset_key_includes_plot_settings(
+    tmp_path: Path, runs: List[Run]
+) -> None:
+    report = Report(runs).add(
+        MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model")),
+        MetricPlot(
+            Metric("accuracy", direction="max"),
+            identifier=Param("model", label="Model"),
+        ),
+        MetricPlot(
+            Metric("accuracy", direction="max"),
+            identifier=Param("model"),
+            errorbar="sd",
+        ),
+    )
+    Markdown(output_path=str(tmp_path / "report.md")).export(report)
+    assert len(list((tmp_path / ".ablate").glob("MetricPlot_*.png"))) == 3
+
+
+def test_hash_dataframe_is_stable_and_content_based() -> None:
+    df = pd.DataFrame({"step": [0, 1], "value": [0.5, float("nan")]})
+    assert hash_dataframe(df) == "d84f6156a2ba"
+    assert hash_dataframe(df) == hash_dataframe(df.copy())
+    assert hash_dataframe(df) != hash_dataframe(df.iloc[::-1])
+    assert hash_dataframe(df) != hash_dataframe(df.rename(columns={"value": "v"}))
+    assert hash_dataframe(df) != hash_dataframe(df.astype({"step": "float64"}))
+    assert hash_dataframe(df) != hash_dataframe(df, "salt")
+    assert hash_dataframe(pd.DataFrame()) == hash_dataframe(pd.DataFrame())
+
+
+def test_export_table_block_with_list_params(tmp_path: Path) -> None:
+    runs = [
+        Run(id="a", params={"layers": [64, 32], "opt": {"lr": 0.1}}, metrics={}),
+        Run(id="b", params={"layers": [64], "opt": {"lr": 0.2}}, metrics={}),
+    ]
+    report = Report(runs).add(Table([Param("layers"), Param("opt")]))
+    Markdown(output_path=str(tmp_path / "report.md"), export_csv=True).export(report)
+    (csv,) = (tmp_path / ".ablate").glob("Table_*.csv")
+    assert "[64, 32]" in csv.read_text()
+
+    df = pd.DataFrame({"layers": [[64, 32], [64]]})
+    assert hash_dataframe(df) == hash_dataframe(df.copy())
+    assert hash_dataframe(df) != hash_dataframe(pd.DataFrame({"layers": [[64], [64]]}))
+
+
+def test_prune_unreferenced_assets(tmp_path: Path, runs: List[Run]) -> None:
+    out_path = tmp_path / "report.md"
+    other_path = tmp_path / "other.md"
+    first = Report(runs).add(MetricPlot(Metric("accuracy", direction="max")))
+    Markdown(output_path=str(out_path)).export(first)
+    Markdown(output_path=str(other_path)).export(first)
+    (old,) = (tmp_path / ".ablate").glob("MetricPlot_*.png")
+
+    runs[0].temporal["accuracy"].append((2, 0.7))
+    runs[0] = runs[0].model_copy(deep=True)
+    second = Report(runs).add(MetricPlot(Metric("accuracy", direction="max")))
+    exporter = Markdown(output_path=str(out_path))
+    exporter.export(second)
+    assert exporter.prune_assets() == []
+
+    other_path.unlink()
+    assert exporter.prune_assets(retention=3600) == []
+    assert exporter.prune_assets() == [old]
+    (new,) = (tmp_path / ".ablate").glob("MetricPlot_*.png")
+    assert f".ablate/{new.name}" in out_path.read_text()
+
+
+def test_prune_on_export(tmp_path: Path, runs: List[Run]) -> None:
+    stale = tmp_path / ".ablate" / "MetricPlot_0123456789ab.png"
+    stale.parent.mkdir()
+    stale.touch()
+    report = Report(runs).add(MetricPlot(Metric("accuracy", direction="max")))
+    Markdown(output_path=str(tmp_path / "report.md"), prune=True).export(report)
+    assert not stale.exists()
+    assert len(list((tmp_path / ".ablate").glob("MetricPlot_*.png"))) == 1
+
+
+def test_prune_keeps_foreign_files(tmp_path: Path, runs: List[Run]) -> None:
+    notes = tmp_path / "notes.txt"
+    notes.write_text("notes")
+    similar = tmp_path / "MetricPlot_notahash.png"
+    similar.touch()
+    report = Report(runs).add(MetricPlot(Metric("accuracy", direction="max")))
+    out_path = tmp_path / "report.md"
+    exporter = Markdown(
+        output_path=str(out_path), assets_dir=str(tmp_path), export_csv=True
+    )
+    exporter.export(report)
+    assets = {p for p in tmp_path.glob("MetricPlot_*") if p != similar}
+    assert len(assets) == 2
+    exporter.export(Report(runs))
+    assert set(exporter.prune_assets()) == assets
+    assert out_path.exists()
+    assert notes.read_text() == "notes"
+    assert similar.exists()
+
+
+@pytest.mark.parametrize("data_format", ["csv", "parquet", "feather"])
+def test_export_data_formats(
+    tmp_path: Path, runs: List[Run], data_format: Literal["csv", "parquet", "feather"]
+) -> None:
+    plot = MetricPlot(Metric("accuracy", direction="max"), identifier=Param("model"))
+    report = Report(runs).add(Table(columns=[Param("model")]), plot)
+    exporter = Markdown(
+        output_path=str(tmp_path / "report.md"), export_data=data_format
+    )
+    exporter.export(report)
+
+    (plot_path,) = (tmp_path / ".ablate").glob(f"MetricPlot_*.{data_format}")
+    (table_path,) = (tmp_path / ".ablate").glob(f"Table_*.{data_format}")
+    read = getattr(pd, f"read_{data_format}")
+    df = read(plot_path)
+    assert list(df.columns) == ["step", "value", "metric", "run", "run_id"]
+    assert len(df) == 4
+    if data_format != "csv":
+        assert isinstance(df["run"].dtype, pd.CategoricalDtype)
+    assert read(table_path)["model"].tolist() == ["resnet", "resnet"]
+
+
+@pytest.mark.parametrize("data_format", ["csv", "parquet", "feather"])
+def test_export_data_mixed_params(
+    tmp_path: Path, data_format: Literal["csv", "parquet", "feather"]
+) -> None:
+    runs = [
+        Run(
+            id=str(i),
+            params={"seed": seed, "lr": lr},
+            metrics={},
+            temporal={"loss": [(0, 1.0)]},
+        )
+        for i, (seed, lr) in enumerate([(1, 0.1), ("s", 1), (None, 0.2)])
+    ]
+    plot = MetricPlot(Metric("loss", direction="min"), identifier=Param("seed"))
+    report = Report(runs).add(Table([Param("seed"), Param("lr")]), plot)
+    Markdown(output_path=str(tmp_path / "report.md"), export_data=data_format).export(
+        report
+    )
+
+    read = getattr(pd, f"read_{data_format}")
+    (table_path,) = (tmp_path / ".ablate").glob(f"Table_*.{data_format}")
+    df = read(table_path)
+    assert df["seed"].astype(str).tolist()[:2] == ["1", "s"]
+    assert df["lr"].tolist() == [0.1, 1.0, 0.2]
+    (plot_path,) = (tmp_path / ".ablate").glob(f"MetricPlot_*.{data_format}")
+    assert len(read(plot_path)) == 3
+
+
+def test_export_data_invalid_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported data format"):
+        Markdown(output_path=str(tmp_path / "report.md"), export_data="xlsx")  # type: ignore[arg-type]
+
+
+def test_export_stream_keeps_partial_output(tmp_path: Path, runs: List[Run]) -> None:
+    report = Report(runs).add(H1("Heading 1"), Text("Some text."), DummyBlock())  # type: ignore[arg-type]
+    out_path = tmp_path / "report.md"
+    with pytest.raises(ValueError, match="Unknown block type"):
+        Markdown(output_path=str(out_path), stream=True).export(report)
+    assert out_path.read_text() == "# Heading 1\n\nSome text.\n\n"
+
+
+def test_export_incremental_renders_changed_blocks(
+    tmp_path: Path, runs: List[Run], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def make_report(runs: List[Run]) -> Report:
+        return Report(runs).add(
+            H1("Results"),
+            MetricPlot(Metric("accuracy", direction="max"), runs=runs[:1]),
+            MetricPlot(Metric("accuracy", direction="max"), runs=runs[1:]),
+        )
+
+    out_path = tmp_path / "report.md"
+    Markdown(output_path=str(out_path), incremental=True).export(make_report(runs))
+    first = out_path.read_text()
+
+    rendered: List[str] = []
+    render_figure = Markdown.render_figure
+
+    def spy(self: Markdown, block: MetricPlot, runs: List[Run]) -> str:
+        rendered.append(runs[0].id)
+        return render_figure(self, block, runs)
+
+    monkeypatch.setattr(Markdown, "render_figure", spy)
+    exporter = Markdown(output_path=str(out_path), incremental=True)
+    exporter.build_cache = BuildCache()
+    exporter.export(make_report(runs))
+    assert rendered == []
+    assert out_path.read_text() == first
+
+    runs[1] = runs[1].model_copy(update={"metrics": {"accuracy": 0.95}})
+    runs[1].temporal = {"accuracy": [(0, 0.7), (1, 0.95)]}
+    exporter.export(make_report(runs))
+    assert rendered == ["run2"]
+
+    for asset in (tmp_path / ".ablate").glob("MetricPlot_*.png"):
+        asset.unlink()
+    exporter.export(make_report(runs))
+    assert rendered == ["run2", "run1", "run2"]
+    assert len(list((tmp_path / ".ablate").glob("MetricPlot_*.png"))) == 2
+
+
+def test_export_incremental_keeps_assets_per_block(
+    tmp_path: Path, runs: List[Run]
+) -> None:
+    def make_report(runs: List[Run]) -> Report:
+        return Report(runs).add(
+            MetricPlot(Metric("accuracy", direction="max"), runs=runs[:1]),
+            MetricPlot(Metric("accuracy", direction="max"), runs=runs[1:]),
+        )
+
+    out_path = tmp_path / "report.md"
+    exporter = Markdown(output_path=str(out_path), incremental=True)
+    exporter.export(make_report(runs))
+    runs[0] = runs[0].model_copy(update={"temporal": {"accuracy": [(0, 0.1)]}})
+    exporter.export(make_report(runs))
+
+    cache = read_block_cache(block_cache_path(exporter.assets_dir, out_path))
+    assets = [entry["assets"] for entry in cache.values()]
+    assert len(assets) == 2
+    assert all(len(a) == 1 for a in assets)
+    assert assets[0] != assets[1]
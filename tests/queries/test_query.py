@@ -53,6 +53,40 @@ def test_map(runs: List[Run]) -> None:
     assert runs[0].id == "a"
 
 
+def double_accuracy(run: Run) -> Run:
+    if run.id == "fail":
+        raise ValueError("Failed run.")
+    run.metrics["accuracy"] *= 2
+    return run
+
+
+def test_map_workers() -> None:
+    runs = [
+        Run(id=str(i), params={"seed": i}, metrics={"accuracy": i}) for i in range(10)
+    ]
+    updated = Query(runs).map(double_accuracy, workers=2, chunksize=3).all()
+    assert [r.id for r in updated] == [str(i) for i in range(10)]
+    assert [r.metrics["accuracy"] for r in updated] == [2 * i for i in range(10)]
+    assert runs[1].metrics["accuracy"] == 1
+    assert Query([]).map(double_accuracy, workers=2).all() == []
+
+    runs.append(Run(id="fail", params={}, metrics={"accuracy": 0}))
+    with pytest.raises(ValueError, match="Failed run"):
+        Query(runs).map(double_accuracy, workers=2)
+    with pytest.raises(ValueError, match="Invalid chunksize"):
+        Query(runs).map(double_accuracy, workers=2, chunksize=0)
+
+
+def test_filter_workers(runs: List[Run]) -> None:
+    predicate = (Param("model") == "resnet") & ~(Param("seed") > 1)
+    filtered = Query(runs).filter(predicate, workers=2)
+    assert filtered._runs == runs[:1]
+    assert filtered._runs[0] is runs[0]
+
+    with pytest.raises(AttributeError, match="local object"):
+        Query(runs).filter(lambda run: True, workers=2)
+
+
 def test_groupby_single_key(runs: List[Run]) -> None:
     gq = Query(runs).groupby(Param("model"))
     assert len(gq) == 2
@@ -74,6 +108,58 @@ def test_groupdiff(runs: List[Run]) -> None:
     assert all(len(g.value) == 8 for g in grouped)
 
 
+def test_groupdiff_ignores_param_order() -> None:
+    runs = [
+        Run(id="a", params={"lr": 0.1, "model": "vit", "seed": 1}, metrics={}),
+        Run(id="b", params={"seed": 2, "model": "vit", "lr": 0.1}, metrics={}),
+    ]
+    grouped = Query(runs).groupdiff(Param("seed"))._grouped
+    assert [[r.id for r in g.runs] for g in grouped] == [["a", "b"]]
+
+
+def test_groupdiff_labels(runs: List[Run]) -> None:
+    runs.append(
+        Run(id="d", params={"model": "vit", "seed": 2, "lr": 1}, metrics={}),
+    )
+    runs.append(
+        Run(id="e", params={"model": "vit", "seed": 3, "lr": "1"}, metrics={}),
+    )
+    grouped = Query(runs).groupdiff(Param("seed"), label=True)._grouped
+    values = [g.value for g in grouped]
+    assert values[:2] == ["model=resnet", "model=vit"]
+    # labels of values only differing in their type are disambiguated
+    assert values[2].startswith("lr=1,model=vit#")
+    assert values[3].startswith("lr=1,model=vit#")
+    assert values[2] != values[3]
+
+    single = Query(runs[:2]).groupdiff(Param("seed"), label=True)._grouped
+    assert len(single[0].value) == 8
+
+
+def test_groupdiff_nan_params() -> None:
+    runs = [
+        Run(id=str(i), params={"lr": lr, "seed": i}, metrics={})
+        for i, lr in enumerate([float("nan"), 0.1, float("nan"), 0.1])
+    ]
+    grouped = Query(runs).groupdiff(Param("seed"), label=True)
+    assert [[r.id for r in g.runs] for g in grouped._grouped] == [
+        ["0", "2"],
+        ["1", "3"],
+    ]
+    assert [g.value for g in grouped._grouped] == ["lr=nan", "lr=0.1"]
+
+    values = [g.value for g in Query(runs).groupdiff(Param("seed"))._grouped]
+    assert len(set(values)) == 2
+
+
+def test_groupdiff_unique_values() -> None:
+    from ablate.queries.query import _unique_prefixes
+
+    digests = ["abcdefgh1", "abcdefgh2", "12345678x"]
+    assert _unique_prefixes(digests, 8) == ["abcdefgh1", "abcdefgh2", "12345678"]
+    assert _unique_prefixes(["aa", "aa"], 1) == ["a", "a"]
+
+
 def test_query_copy_shallow(runs: List[Run]) -> None:
     original = Query(runs)
     copied = original.copy()
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from ablate.core.types import Run
@@ -66,12 +68,17 @@ def test_invalid_metric_direction() -> None:
         ("max", 0.9),
         ("first", 0.5),
         ("last", 0.9),
+        ("mean", pytest.approx(2.2 / 3)),
+        ("last_k", pytest.approx(0.85)),
+        ("argmin", 0),
+        ("argmax", 2),
+        ("auc", pytest.approx(0.65 + 0.85)),
     ],
 )
 def test_temporal_metric_selector(
     example_run: Run, reduction: str, expected: float
 ) -> None:
-    selector = TemporalMetric("accuracy", direction="max", reduction=reduction)  # type: ignore[arg-type]
+    selector = TemporalMetric("accuracy", "max", reduction=reduction, k=2)  # type: ignore[arg-type]
     assert selector(example_run) == expected
 
 
@@ -83,6 +90,36 @@ def test_temporal_metric_missing_returns_nan(example_run: Run) -> None:
 def test_temporal_metric_invalid_reduction() -> None:
     with pytest.raises(ValueError, match="Invalid reduction method"):
         TemporalMetric("accuracy", direction="max", reduction="median")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Invalid k"):
+        TemporalMetric("accuracy", direction="max", reduction="last_k", k=0)
+
+
+def test_temporal_metric_memoizes_reductions(example_run: Run) -> None:
+    assert TemporalMetric("accuracy", "max", "mean")(example_run) == pytest.approx(
+        2.2 / 3
+    )
+    example_run.temporal["accuracy"].append((3, 1.0))
+    # all reductions were computed and memoized in the same pass
+    assert TemporalMetric("accuracy", "max")(example_run) == 0.9
+    assert TemporalMetric("accuracy", "max", "last_k", k=1)(example_run) == 1.0
+
+    example_run.temporal = {"accuracy": [(0, 0.2)]}
+    assert TemporalMetric("accuracy", "max")(example_run) == 0.2
+
+
+def test_temporal_metric_map_invalidates(example_run: Run) -> None:
+    from ablate.queries import Query
+
+    selector = TemporalMetric("accuracy", "max")
+
+    def scale(run: Run) -> Run:
+        assert selector(run) == 0.9
+        run.temporal["accuracy"][-1] = (2, 0.95)
+        return run
+
+    (mapped,) = Query([example_run]).map(scale).all()
+    assert selector(mapped) == 0.95
+    assert selector(example_run) == 0.9
 
 
 def test_predicate_and(example_run: Run) -> None:
@@ -127,3 +164,66 @@ def test_chained_predicates(example_run: Run) -> None:
 
     pred = ((acc > 0.95) & (loss < 0.05)) | (lr == 0.02)
     assert pred(example_run) is False
+
+
+def test_evaluate_many_matches_call(example_run: Run) -> None:
+    other = Run(
+        id="run-43",
+        params={"model": "vit"},
+        metrics={"accuracy": 0.5},
+        temporal={"accuracy": [(0, 0.3), (1, 0.2)]},
+    )
+    empty = Run(id="run-44", params={}, metrics={})
+    runs = [example_run, empty, other]
+    selectors = [
+        Id(),
+        Param("model"),
+        Metric("accuracy", direction="max"),
+        Metric("loss", direction="min"),
+    ]
+    for selector in selectors:
+        assert selector.evaluate_many(runs).tolist() == [selector(r) for r in runs]
+
+
+@pytest.mark.parametrize(
+    "reduction",
+    ["min", "max", "first", "last", "mean", "last_k", "argmin", "argmax", "auc"],
+)
+def test_temporal_metric_evaluate_many(example_run: Run, reduction: str) -> None:
+    runs = [
+        example_run,
+        Run(id="empty", params={}, metrics={}),
+        Run(id="b", params={}, metrics={}, temporal={"accuracy": [(0, 0.1)]}),
+        example_run,
+    ]
+    selector = TemporalMetric("accuracy", direction="max", reduction=reduction)  # type: ignore[arg-type]
+    result = selector.evaluate_many(runs)
+
+    assert result.shape == (4,)
+    assert result[1] != result[1]
+    for i in (0, 2, 3):
+        # compare to reductions of fresh copies not sharing memoized values
+        assert result[i] == selector(runs[i].model_copy(deep=True))
+    assert selector.evaluate_many([]).shape == (0,)
+
+
+def test_temporal_metric_skips_nan() -> None:
+    nan = float("nan")
+    runs = [
+        Run(
+            id="a",
+            params={},
+            metrics={},
+            temporal={"loss": [(0, nan), (1, 0.5), (2, nan), (3, 0.2), (4, 0.9)]},
+        ),
+        Run(id="b", params={}, metrics={}, temporal={"loss": [(0, nan), (1, nan)]}),
+    ]
+    expected = {"min": 0.2, "max": 0.9, "argmin": 3, "argmax": 4}
+    for reduction, value in expected.items():
+        selector = TemporalMetric("loss", direction="min", reduction=reduction)  # type: ignore[arg-type]
+        a, b = selector.evaluate_many(runs).tolist()
+        assert a == value
+        assert selector(runs[0].model_copy(deep=True)) == value
+        # series of only NaN values have a NaN extremum at their first step
+        assert math.isnan(b) if reduction in ("min", "max") else b == 0
+    assert math.isnan(TemporalMetric("loss", "min", reduction="mean")(runs[0]))
@@ -1,4 +1,5 @@
 from pathlib import Path
+import shutil
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -122,3 +123,96 @@ def test_flatten_config_with_list_of_dicts() -> None:
     result = dict(flatten_autrainer_config(config))
 
     assert result == {"0": "first", "1": "second_id", "1.name": "second"}
+
+
+def test_refresh_detects_added_updated_and_removed_runs(tmp_path: Path) -> None:
+    exp_id = "exp-003"
+    base = tmp_path / exp_id / "training"
+    for name in ["run0", "run1"]:
+        make_dummy_run(base / name)
+
+    source = Autrainer(results_dir=str(tmp_path), experiment_id=exp_id)
+    runs = source.load()
+    assert not source.refresh()
+
+    make_dummy_run(base / "run2")
+    write_csv(
+        base / "run0" / "metrics.csv",
+        {"iteration": [1, 2, 3, 4], "accuracy": [0.7, 0.75, 0.8, 0.9]},
+    )
+    shutil.rmtree(base / "run1")
+
+    changes = source.refresh()
+    assert [r.id for r in changes.added] == ["run2"]
+    assert [r.id for r in changes.updated] == ["run0"]
+    assert changes.removed == ["run1"]
+
+    runs = changes.apply(runs)
+    assert sorted(r.id for r in runs) == ["run0", "run2"]
+    run0 = next(r for r in runs if r.id == "run0")
+    assert run0.temporal["accuracy"][-1] == (4, 0.9)
+    assert not source.refresh()
+
+
+def test_refresh_with_dirty_paths_only_checks_owners(tmp_path: Path) -> None:
+    exp_id = "exp-004"
+    base = tmp_path / exp_id / "training"
+    for name in ["run0", "run1"]:
+        make_dummy_run(base / name)
+
+    source = Autrainer(results_dir=str(tmp_path), experiment_id=exp_id)
+    source.load()
+    for name in ["run0", "run1"]:
+        write_csv(base / name / "metrics.csv", {"iteration": [1], "loss": [0.1]})
+
+    changes = source.refresh(dirty=[base / "run1" / "metrics.csv"])
+    assert [r.id for r in changes.updated] == ["run1"]
+    assert [r.id for r in source.refresh().updated] == ["run0"]
+
+
+def test_refresh_skips_half_written_runs(tmp_path: Path) -> None:
+    exp_id = "exp-006"
+    base = tmp_path / exp_id / "training"
+    make_dummy_run(base / "run0")
+    source = Autrainer(results_dir=str(tmp_path), experiment_id=exp_id)
+    runs = source.load()
+
+    # run1 only has its config and run0 is in the middle of rewriting its results
+    write_yaml(base / "run1" / ".hydra" / "config.yaml", {"model": {"id": "M"}})
+    make_dummy_run(base / "run2")
+    (base / "run0" / "_best" / "dev.yaml").unlink()
+
+    changes = source.refresh()
+    assert [r.id for r in changes.added] == ["run2"]
+    assert not changes.updated
+    assert sorted(p.name for p in source.failed) == ["run0", "run1"]
+    runs = changes.apply(runs)
+
+    make_dummy_run(base / "run0")
+    make_dummy_run(base / "run1")
+    changes = source.refresh()
+    assert [r.id for r in changes.added] == ["run1"]
+    assert [r.id for r in changes.updated] == ["run0"]
+    assert not source.failed
+    assert [r.id for r in changes.apply(runs)] == ["run0", "run2", "run1"]
+    assert not source.refresh()
+
+
+@pytest.mark.parametrize("use_watchdog", [True, False])
+def test_watch_yields_pending_changes(tmp_path: Path, use_watchdog: bool) -> None:
+    exp_id = "exp-005"
+    base = tmp_path / exp_id / "training"
+    make_dummy_run(base / "run0")
+
+    source = Autrainer(results_dir=str(tmp_path), experiment_id=exp_id)
+    source.load()
+    make_dummy_run(base / "run1")
+
+    watcher = source.watch(interval=0.01, use_watchdog=use_watchdog)
+    changes = next(watcher)
+    assert [r.id for r in changes.added] == ["run1"]
+
+    write_csv(base / "run0" / "metrics.csv", {"iteration": [1], "loss": [0.1]})
+    changes = next(watcher)
+    assert [r.id for r in changes.updated] == ["run0"]
+    watcher.close()
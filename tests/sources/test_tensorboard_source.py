@@ -87,3 +87,31 @@ def test_tensorboard_handles_empty_logs(
     assert len(runs) == 1
     assert runs[0].metrics == {}
     assert runs[0].temporal == {}
+
+
+@patch("tensorboard.backend.event_processing.event_accumulator.EventAccumulator")
+def test_tensorboard_refresh_loads_changed_runs_only(
+    mock_event_accumulator: MagicMock, tmp_path: Path
+) -> None:
+    for name in ["runA", "runB"]:
+        path = tmp_path / name
+        path.mkdir()
+        (path / "events.out.tfevents.1").touch()
+
+    mock_ea_instance = mock_event_accumulator.return_value
+    mock_ea_instance.Tags.return_value = {"scalars": ["acc"]}
+    mock_ea_instance.Scalars.return_value = [SimpleNamespace(step=1, value=0.75)]
+
+    source = TensorBoard(logdirs=str(tmp_path))
+    assert len(source.load()) == 2
+    assert mock_event_accumulator.call_count == 2
+
+    (tmp_path / "runA" / "events.out.tfevents.1").write_bytes(b"new events")
+    (tmp_path / "runC").mkdir()
+    (tmp_path / "runC" / "events.out.tfevents.1").touch()
+
+    changes = source.refresh()
+    assert [r.id for r in changes.added] == ["runC"]
+    assert [r.id for r in changes.updated] == ["runA"]
+    assert changes.removed == []
+    assert mock_event_accumulator.call_count == 4
@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks import __main__ as cli
+from benchmarks.suite import compare, measure
+
+
+def result(seconds: float) -> Dict[str, Any]:
+    return {
+        "seconds": seconds,
+        "throughput": 1 / seconds if seconds > 0 else float("inf"),
+        "unit": "runs/s",
+        "size": 1,
+        "peak_memory": None,
+    }
+
+
+def test_measure_warms_up_and_repeats() -> None:
+    calls: List[int] = []
+
+    def fn(value: int) -> List[int]:
+        calls.append(value)
+        return [0] * 1000
+
+    seconds, peak = measure(fn, (1,), repeat=3, memory=False, min_time=0.0)
+    assert len(calls) == 4
+    assert seconds >= 0
+    assert peak is None
+
+    calls.clear()
+    _, peak = measure(fn, (1,), repeat=2, memory=True, min_time=0.0)
+    assert len(calls) == 4
+    assert peak is not None
+    assert peak > 0
+
+
+def test_measure_repeats_fast_functions_until_min_time() -> None:
+    calls: List[int] = []
+
+    def fn() -> None:
+        calls.append(1)
+        time.sleep(0.01)
+
+    measure(fn, (), repeat=1, memory=False, min_time=0.03)
+    assert len(calls) >= 4
+
+
+def test_compare_flags_regressions_above_threshold() -> None:
+    baseline = {
+        "1k/slower": result(1.0),
+        "1k/equal": result(1.0),
+        "1k/faster": result(1.0),
+        "1k/zero": result(0.0),
+        "1k/removed": result(1.0),
+    }
+    results = {
+        "1k/slower": result(1.3),
+        "1k/equal": result(1.2),
+        "1k/faster": result(0.5),
+        "1k/zero": result(1.0),
+        "1k/added": result(1.0),
+    }
+    lines, regressions = compare(baseline, results)
+    assert regressions == ["1k/slower"]
+    assert len(lines) == 5
+    assert "REGRESSION" in next(line for line in lines if "1k/slower" in line)
+    assert not any("removed" in line or "added" in line for line in lines)
+
+    _, regressions = compare(baseline, results, threshold=0.1)
+    assert regressions == ["1k/equal", "1k/slower"]
+    _, regressions = compare(baseline, results, threshold=0.5)
+    assert regressions == []
+
+
+@pytest.mark.parametrize(("threshold", "code"), [("0.2", 1), ("0.5", 0)])
+def test_main_exits_on_regressions(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    threshold: str,
+    code: int,
+) -> None:
+    monkeypatch.setattr(cli, "run_import", lambda: {"import/ablate": result(1.3)})
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"import/ablate": result(1.0)}}))
+    output = tmp_path / "results.json"
+
+    args = ["--only", "import", "-b", str(baseline), "-o", str(output)]
+    assert cli.main([*args, "-t", threshold]) == code
+    assert json.loads(output.read_text())["results"]["import/ablate"]["seconds"] == 1.3
+    assert ("regressed by more than" in capsys.readouterr().out) == bool(code)
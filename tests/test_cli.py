@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ablate.cli import main
+
+
+SPEC = """
+sources:
+  - type: Mock
+    grid: {model: [resnet, vgg]}
+    steps: 5
+blocks:
+  - type: H1
+    text: Results
+  - type: Table
+    name: results
+    columns:
+      - {type: Param, name: model}
+      - {type: Metric, name: accuracy, direction: max}
+exporter:
+  type: Markdown
+  output_path: report.md
+"""
+
+
+@pytest.fixture
+def spec(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "spec.yaml"
+    path.write_text(SPEC)
+    return path
+
+
+def test_cli_build(spec: Path) -> None:
+    assert main(["build", str(spec)]) == 0
+    content = (spec.parent / "report.md").read_text()
+    assert "# Results" in content
+    assert "resnet" in content
+
+
+def test_cli_build_options(
+    spec: Path,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    output = tmp_path / "partial.md"
+    args = ["build", str(spec), "--only", "results", "-o", str(output)]
+    args += ["--incremental", "--no-cache", "--profile", str(tmp_path / "p.json")]
+    assert main(args) == 0
+    content = output.read_text()
+    assert "# Results" not in content
+    assert "resnet" in content
+    assert "load" in capsys.readouterr().err
+    records = json.loads((tmp_path / "p.json").read_text())["records"]
+    assert {r["stage"] for r in records} >= {"load", "build", "render"}
+
+
+def test_cli_build_errors(
+    spec: Path,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    output = str(tmp_path / "partial.md")
+    assert main(["build", str(spec), "--only", "missing", "-o", output]) == 1
+    assert "ablate: error: Unknown blocks: missing" in capsys.readouterr().err
+    assert main(["build", str(spec), "--only", "results"]) == 1
+    assert "ablate: error: --only requires --output" in capsys.readouterr().err
+    assert not (spec.parent / "report.md").exists()
+    assert main(["build", "missing.yaml"]) == 1
+    with pytest.raises(SystemExit):
+        main([])
+
+
+def test_cli_build_invalid_arguments(spec: Path, capsys: pytest.CaptureFixture) -> None:
+    spec.write_text(SPEC.replace("steps: 5", "num_seed: 2"))
+    assert main(["build", str(spec)]) == 1
+    err = capsys.readouterr().err
+    assert "ablate: error: Invalid spec at 'ablate.sources.Mock'" in err
+    assert "num_seed" in err
+
+
+@pytest.mark.parametrize(
+    ("suffix", "content"),
+    [(".yaml", "sources: [type: Mock"), (".toml", "sources = [")],
+)
+def test_cli_build_malformed_spec(
+    tmp_path: Path, capsys: pytest.CaptureFixture, suffix: str, content: str
+) -> None:
+    path = tmp_path / f"spec{suffix}"
+    path.write_text(content)
+    assert main(["build", str(path)]) == 1
+    assert f"ablate: error: Invalid spec at '{path}'" in capsys.readouterr().err
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = ("matplotlib", "numpy", "pandas", "seaborn")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ablate",
+        "from ablate import Report",
+        "from ablate.sources import Autrainer, Mock, TensorBoard",
+        "from ablate.queries import Metric, Param, Query, TemporalMetric",
+        "from ablate.blocks import MetricPlot, Table",
+        "from ablate.exporters import HTML, Markdown",
+    ],
+)
+def test_import_does_not_load_heavy_modules(statement: str) -> None:
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes() -> None:
+    import ablate
+
+    assert ablate.Report.__name__ == "Report"
+    assert ablate.exporters.Markdown.__name__ == "Markdown"
+    assert "Report" in dir(ablate)
+    with pytest.raises(AttributeError):
+        ablate.missing  # type: ignore[attr-defined]  # noqa: B018
+    with pytest.raises(AttributeError):
+        ablate.exporters.Missing  # type: ignore[attr-defined]  # noqa: B018
@@ -0,0 +1,154 @@
+import http.client
+import json
+from pathlib import Path
+import socket
+import tempfile
+import threading
+from typing import Iterator
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from ablate.server import ReportServer
+
+
+SPEC = {
+    "sources": [{"type": "Mock", "grid": {"model": ["resnet", "vgg"]}, "steps": 5}],
+    "blocks": [
+        {"type": "H1", "text": "Results"},
+        {
+            "type": "Table",
+            "name": "results",
+            "columns": [{"type": "Param", "name": "model"}],
+        },
+    ],
+    "exporter": {"type": "Markdown"},
+}
+
+
+@pytest.fixture
+def server() -> Iterator[ReportServer]:
+    with ReportServer(SPEC, port=0, refresh_interval=None) as server:
+        yield server
+
+
+def fetch(server: ReportServer, path: str, data: bytes | None = None) -> bytes:
+    with urlopen(Request(server.address + path, data=data)) as response:
+        return response.read()
+
+
+def test_server_reports(server: ReportServer) -> None:
+    html = fetch(server, "/").decode()
+    assert "<h1>Results</h1>" in html
+    assert "resnet" in html
+    assert fetch(server, "/report.html") == html.encode()
+
+    markdown = fetch(server, "/report.md?only=results").decode()
+    assert "# Results" not in markdown
+    assert "resnet" in markdown
+    assert server.render("md", ["results"]) is server.render("md", ["results"])
+
+    with pytest.raises(HTTPError, match="400"):
+        fetch(server, "/report.md?only=missing")
+    with pytest.raises(HTTPError, match="404"):
+        fetch(server, "/missing")
+    with pytest.raises(HTTPError, match="404"):
+        fetch(server, "/.ablate/missing.png")
+
+
+def test_server_prunes_stale_assets() -> None:
+    plot = {
+        "type": "MetricPlot",
+        "metrics": {"type": "Metric", "name": "accuracy", "direction": "max"},
+    }
+    spec = {**SPEC, "blocks": [plot]}
+    with ReportServer(spec, port=0, refresh_interval=None) as server:
+        assets = server._assets_dir
+        server.render("md")
+        server.render("html")
+        (first,) = assets.glob("MetricPlot_*.png")
+        assert len(list(assets.glob("MetricPlot_*.svg"))) == 1
+
+        server.spec = {**spec, "query": [{"head": 1}]}
+        server._sources = [(s, runs[:1]) for s, runs in server._sources]
+        assert server.refresh()
+        server.render("md")
+        (second,) = assets.glob("MetricPlot_*.png")
+        assert second != first
+        assert not list(assets.glob("MetricPlot_*.svg"))
+        assert fetch(server, f"/.ablate/{second.name}")
+
+
+def test_server_internal_errors(
+    server: ReportServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def render(*args: object) -> bytes:
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(server, "render", render)
+    with pytest.raises(HTTPError, match="500") as e:
+        fetch(server, "/")
+    assert "render failed" in e.value.read().decode()
+
+
+def test_server_runs(server: ReportServer) -> None:
+    runs = json.loads(fetch(server, "/runs"))
+    assert [r["params"]["model"] for r in runs] == ["resnet", "vgg"]
+
+    steps = [{"filter": {"selector": {"type": "Param", "name": "model"}, "eq": "vgg"}}]
+    runs = json.loads(fetch(server, "/query", json.dumps(steps).encode()))
+    assert [r["params"]["model"] for r in runs] == ["vgg"]
+    with pytest.raises(HTTPError, match="400"):
+        fetch(server, "/query", b'[{"map": null}]')
+
+    status = json.loads(fetch(server, "/status"))
+    assert status["runs"] == 2
+    assert status["version"] == 0
+
+
+def test_server_refresh(server: ReportServer) -> None:
+    rendered = server.render("html")
+    assert not server.refresh()
+    assert server.render("html") is rendered
+
+    server.spec = {**SPEC, "query": [{"head": 1}]}
+    server._sources = [(s, runs[:1]) for s, runs in server._sources]
+    assert server.refresh()
+    assert server.version == 1
+    assert len(server.runs) == 1
+    assert server.render("html") is not rendered
+
+
+def test_server_refresh_errors(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls = []
+    done = threading.Event()
+
+    def refresh() -> bool:
+        calls.append(1)
+        if len(calls) < 3:
+            raise OSError("unavailable")
+        done.set()
+        return False
+
+    with ReportServer(SPEC, port=0, refresh_interval=0.01) as server:
+        monkeypatch.setattr(server, "refresh", refresh)
+        assert done.wait(5)
+        assert len(server.runs) == 2
+    assert "Failed to refresh the sources." in caplog.text
+
+
+def test_server_unix_socket() -> None:
+    path = Path(tempfile.mkdtemp()) / "ablate.sock"
+    with ReportServer(SPEC, socket=path, refresh_interval=None) as server:
+        assert server.address == str(path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(path))
+        connection = http.client.HTTPConnection("localhost")
+        connection.sock = sock
+        connection.request("GET", "/status")
+        assert json.loads(connection.getresponse().read())["runs"] == 2
+        connection.close()
+    assert not path.exists()
@@ -0,0 +1,145 @@
+from pathlib import Path
+
+import pytest
+
+from ablate.blocks import H1, Table
+from ablate.queries import Metric, Param
+from ablate.sources import Mock
+from ablate.spec import (
+    apply_query,
+    build_condition,
+    build_exporters,
+    build_object,
+    build_report,
+    load_runs,
+    load_spec,
+)
+
+
+METRIC = {"type": "Metric", "name": "accuracy", "direction": "max"}
+SPEC = {
+    "sources": [{"type": "Mock", "grid": {"model": ["resnet", "vgg"]}, "num_seeds": 3}],
+    "query": [{"filter": {"selector": {"type": "Param", "name": "seed"}, "ne": "2"}}],
+    "blocks": [
+        {"type": "H1", "text": "Results"},
+        {
+            "type": "Table",
+            "name": "best",
+            "columns": [{"type": "Param", "name": "model"}],
+            "query": [
+                {
+                    "topk": {
+                        "metric": {
+                            "type": "Metric",
+                            "name": "accuracy",
+                            "direction": "max",
+                        },
+                        "k": 1,
+                    }
+                }
+            ],
+        },
+    ],
+    "exporter": {"type": "Markdown", "output_path": "report.md"},
+}
+
+
+def test_load_spec(tmp_path: Path) -> None:
+    (tmp_path / "spec.yaml").write_text(
+        "sources:\n  - type: Mock\n    grid: {model: [resnet]}\n"
+        "blocks:\n  - {type: H1, text: Results}\n"
+        "exporter: {type: Markdown}\n"
+    )
+    (tmp_path / "spec.toml").write_text(
+        '[[sources]]\ntype = "Mock"\ngrid = { model = ["resnet"] }\n\n'
+        '[[blocks]]\ntype = "H1"\ntext = "Results"\n\n'
+        '[exporter]\ntype = "Markdown"\n'
+    )
+    assert load_spec(tmp_path / "spec.yaml") == load_spec(tmp_path / "spec.toml")
+
+    (tmp_path / "spec.json").write_text("{}")
+    with pytest.raises(ValueError, match="Unsupported spec format"):
+        load_spec(tmp_path / "spec.json")
+    (tmp_path / "empty.yaml").write_text("sources: []\n")
+    with pytest.raises(ValueError, match="missing 'blocks'"):
+        load_spec(tmp_path / "empty.yaml")
+
+
+def test_build_object() -> None:
+    block = build_object(
+        {"type": "Table", "columns": [{"type": "Param", "name": "model"}]},
+        "ablate.blocks",
+    )
+    assert isinstance(block, Table)
+    assert isinstance(block.columns[0], Param)
+    assert block.columns[0].name == "model"
+
+    for name in ("Unknown", "AbstractBlock", None):
+        with pytest.raises(ValueError, match="unknown type"):
+            build_object({"type": name}, "ablate.blocks")
+
+
+def test_build_condition() -> None:
+    runs = Mock(grid={"model": ["resnet", "vgg", "vit"]}).load()
+    predicate = build_condition(
+        [
+            {"selector": {"type": "Param", "name": "model"}, "in": ["resnet", "vit"]},
+            {"selector": {"type": "Param", "name": "model"}, "ne": "vit"},
+        ]
+    )
+    assert [r.params["model"] for r in runs if predicate(r)] == ["resnet"]
+
+    with pytest.raises(ValueError, match="require a 'selector'"):
+        build_condition({"eq": 1})
+    with pytest.raises(ValueError, match="operators must be one of"):
+        build_condition({"selector": {"type": "Param", "name": "model"}, "is": 1})
+
+
+def test_apply_query() -> None:
+    runs = Mock(grid={"model": ["resnet", "vgg"]}, num_seeds=2).load()
+    result = apply_query(
+        runs,
+        [
+            {"groupby": {"selectors": {"type": "Param", "name": "model"}}},
+            {"aggregate": ["first"]},
+            {"sort": {"key": METRIC}},
+            {"head": 1},
+        ],
+    )
+    firsts = [r for r in runs if r.params["seed"] == "0"]
+    best = max(firsts, key=Metric("accuracy", direction="max"))
+    assert [r.id for r in result] == [best.id]
+
+    for step in ({"map": None}, {"all": None}, {"head": 1, "tail": 1}):
+        with pytest.raises(ValueError, match="Invalid spec"):
+            apply_query(runs, [step])
+    with pytest.raises(ValueError, match="unsupported method 'filter'"):
+        apply_query(
+            runs,
+            [{"groupby": [{"type": "Param", "name": "model"}]}, {"filter": {}}],
+        )
+
+
+def test_build_report() -> None:
+    runs = load_runs(SPEC)
+    assert len(runs) == 4
+
+    report = build_report(SPEC, runs)
+    assert isinstance(report.blocks[0], H1)
+    assert len(report.blocks[1].runs or []) == 1
+
+    assert [type(b) for b in build_report(SPEC, runs, ["best"]).blocks] == [Table]
+    assert [type(b) for b in build_report(SPEC, runs, ["1"]).blocks] == [H1]
+    with pytest.raises(ValueError, match="Unknown blocks: 3, missing"):
+        build_report(SPEC, runs, ["missing", "3"])
+
+
+def test_build_exporters(tmp_path: Path) -> None:
+    output = str(tmp_path / "out.md")
+    (exporter,) = build_exporters(SPEC, output_path=output, workers=2)
+    assert str(exporter.output_path) == output  # type: ignore[attr-defined]
+    assert exporter.workers == 2
+
+    spec = {**SPEC, "exporter": [{"type": "HTML"}]}
+    with pytest.raises(ValueError, match="does not support incremental"):
+        build_exporters(spec, incremental=True)